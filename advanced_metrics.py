@@ -0,0 +1,254 @@
+"""
+Possession-based advanced metrics from box-score tables
+Estimates possessions, pace, ORtg/DRtg/Net, eFG%, TS%, TOV% and rebound
+rates for every team and player in one vectorized pass
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+from arrow_handoff import load, publish
+from artifact_manifest import stage_is_current, record_stage
+from team_registry import as_team_category
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+GAME_MINUTES = 40             # FIBA regulation
+FTA_WEIGHT = 0.44             # Share of free throw attempts that end a possession
+
+# Player box scores from the clean stage: team + season each file covers
+PLAYER_STAT_SOURCES = [
+    {
+        "csv_file": "nct_2025_player_stats_clean.csv",
+        "team": "Nairobi City Thunder",
+        "season": "2025 BAL"
+    },
+]
+
+# Team summaries that carry opponent scoring (Opp PPG)
+TEAM_SUMMARY_SOURCES = [
+    "nct_2025_summary_clean.csv",
+]
+
+TEAM_OUTPUT_FILE = "team_advanced_metrics.csv"
+PLAYER_OUTPUT_FILE = "player_advanced_metrics.csv"
+STAGE = "advanced_metrics"
+
+# Season totals every box is converted to before any metric is computed
+TOTAL_COLUMNS = ["MIN", "FG2M", "FG2A", "FG3M", "FG3A", "FTM", "FTA",
+                 "ORB", "DRB", "AST", "STL", "BLK", "TOV", "PTS"]
+
+# -----------------------------------------------------------------
+# LOADING FUNCTIONS
+# -----------------------------------------------------------------
+
+def player_totals(df, team, season):
+    """
+    Clean player table -> season totals
+
+    Made/attempted columns are already season totals; MIN and the counting
+    stats are per game and are scaled by Games.
+    """
+    df = df.drop_duplicates()
+    games = df["Games"].fillna(0).astype(int)
+
+    totals = pd.DataFrame({
+        "Team": team, "Season": season, "Player": df["Name"], "GP": games,
+        "FG2M": df["2PM"], "FG2A": df["2PA"],
+        "FG3M": df["3PM"], "FG3A": df["3PA"],
+        "FTM": df["FTM"], "FTA": df["FTA"],
+    }).astype({c: float for c in ["FG2M", "FG2A", "FG3M", "FG3A", "FTM", "FTA"]})
+    totals["Team"] = as_team_category(totals["Team"])
+
+    per_game = {"MIN": "MIN", "ORB": "ORB", "DRB": "DRB", "AST": "AST",
+                "STL": "STL", "BLK": "BLK", "TOV": "TO"}
+    for column, source in per_game.items():
+        totals[column] = df[source].fillna(0) * games
+    # Points rebuilt from makes - the per-game PTS column is rounded
+    totals["PTS"] = 2 * totals["FG2M"] + 3 * totals["FG3M"] + totals["FTM"]
+    return totals.reset_index(drop=True)
+
+
+def load_player_boxes(sources=None):
+    """All player box scores as season totals, one row per player"""
+    sources = sources if sources is not None else PLAYER_STAT_SOURCES
+    frames = [player_totals(load(s["csv_file"]), s["team"], s["season"])
+              for s in sources if os.path.exists(s["csv_file"])]
+    if not frames:
+        return pd.DataFrame(columns=["Team", "Season", "Player", "GP"] + TOTAL_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_opponent_scoring(sources=None):
+    """Team, Season, Opp_PTS (season total) from the clean summaries"""
+    sources = sources if sources is not None else TEAM_SUMMARY_SOURCES
+    frames = []
+    for csv_file in sources:
+        if not os.path.exists(csv_file):
+            continue
+        summary = load(csv_file)
+        games = pd.to_numeric(summary["Games Played"], errors="coerce")
+        frames.append(pd.DataFrame({
+            "Team": as_team_category(summary["Team"]),
+            "Season": summary["Season"],
+            "Opp_PTS": pd.to_numeric(summary["Opp PPG"], errors="coerce") * games
+        }))
+    if not frames:
+        return pd.DataFrame(columns=["Team", "Season", "Opp_PTS"])
+    return pd.concat(frames, ignore_index=True)
+
+# -----------------------------------------------------------------
+# METRIC FUNCTIONS
+# -----------------------------------------------------------------
+
+def _shooting_metrics(box):
+    """Columns shared by team and player rows"""
+    fga = box["FG2A"] + box["FG3A"]
+    fgm = box["FG2M"] + box["FG3M"]
+    plays = fga + FTA_WEIGHT * box["FTA"] + box["TOV"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return pd.DataFrame({
+            "FGA": fga,
+            "FGM": fgm,
+            "Plays": plays,
+            "eFG%": 100 * (fgm + 0.5 * box["FG3M"]) / fga,
+            "TS%": 100 * box["PTS"] / (2 * (fga + FTA_WEIGHT * box["FTA"])),
+            "TOV%": 100 * box["TOV"] / plays,
+            "FT_Rate": box["FTA"] / fga,
+        }, index=box.index)
+
+
+def team_boxes(players):
+    """Sum player totals into team totals (one groupby over all teams)"""
+    teams = players.groupby(["Team", "Season"], as_index=False)[TOTAL_COLUMNS].sum()
+    teams["GP"] = players.groupby(["Team", "Season"])["GP"].max().to_numpy()
+    return teams
+
+
+def team_metrics(teams, opponents=None):
+    """
+    Possessions, pace, ratings and four factors per team
+
+    Opponent rebounds are rarely published, so the opponent's defensive
+    rebounds are estimated as our missed field goals minus our offensive
+    rebounds; DRB% needs Opp_ORB and is left blank without it.
+    """
+    box = teams.copy()
+    if opponents is not None and not opponents.empty:
+        box = box.merge(opponents, on=["Team", "Season"], how="left")
+    for column in ["Opp_PTS", "Opp_ORB", "Opp_DRB", "Opp_Poss"]:
+        if column not in box.columns:
+            box[column] = np.nan
+
+    shots = _shooting_metrics(box)
+    poss = shots["FGA"] - box["ORB"] + box["TOV"] + FTA_WEIGHT * box["FTA"]
+    opp_poss = box["Opp_Poss"].fillna(poss)
+    opp_drb = box["Opp_DRB"].fillna(shots["FGA"] - shots["FGM"] - box["ORB"])
+    team_minutes_per_game = box["MIN"] / box["GP"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = pd.DataFrame({
+            "Team": box["Team"],
+            "Season": box["Season"],
+            "GP": box["GP"],
+            "Poss_per_Game": poss / box["GP"],
+            "Pace": poss / box["GP"] * GAME_MINUTES / (team_minutes_per_game / 5),
+            "ORtg": 100 * box["PTS"] / poss,
+            "DRtg": 100 * box["Opp_PTS"] / opp_poss,
+            "eFG%": shots["eFG%"],
+            "TS%": shots["TS%"],
+            "TOV%": shots["TOV%"],
+            "FT_Rate": shots["FT_Rate"],
+            "ORB%": 100 * box["ORB"] / (box["ORB"] + opp_drb),
+            "DRB%": 100 * box["DRB"] / (box["DRB"] + box["Opp_ORB"]),
+        })
+    metrics.insert(metrics.columns.get_loc("DRtg") + 1, "Net", metrics["ORtg"] - metrics["DRtg"])
+    return metrics.round(1).assign(FT_Rate=metrics["FT_Rate"].round(3))
+
+
+def player_metrics(players, teams, team_rates):
+    """
+    Shooting, usage and rebound rates per player against their team totals
+
+    Player ORtg here is points per 100 possessions used (FGA + 0.44 FTA + TOV);
+    on-court DRtg/Net need lineup data the box scores do not carry, so the
+    team's DRtg is repeated for context.
+    """
+    keys = ["Team", "Season"]
+    team_cols = teams.set_index(keys)[["MIN", "FG2A", "FG3A", "FG2M", "FG3M", "FTA", "TOV", "ORB", "DRB"]]
+    ctx = players[keys].join(team_cols.add_prefix("Tm_"), on=keys)
+    ctx = ctx.join(team_rates.set_index(keys)[["DRtg"]], on=keys)
+
+    shots = _shooting_metrics(players)
+    tm_fga = ctx["Tm_FG2A"] + ctx["Tm_FG3A"]
+    tm_plays = tm_fga + FTA_WEIGHT * ctx["Tm_FTA"] + ctx["Tm_TOV"]
+    tm_opp_drb = tm_fga - ctx["Tm_FG2M"] - ctx["Tm_FG3M"] - ctx["Tm_ORB"]
+    minute_share = (ctx["Tm_MIN"] / 5) / players["MIN"]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        metrics = pd.DataFrame({
+            "Team": players["Team"],
+            "Season": players["Season"],
+            "Player": players["Player"],
+            "GP": players["GP"],
+            "MPG": players["MIN"] / players["GP"],
+            "PPG": players["PTS"] / players["GP"],
+            "ORtg": 100 * players["PTS"] / shots["Plays"],
+            "Team_DRtg": ctx["DRtg"],
+            "USG%": 100 * shots["Plays"] * minute_share / tm_plays,
+            "eFG%": shots["eFG%"],
+            "TS%": shots["TS%"],
+            "TOV%": shots["TOV%"],
+            "ORB%": 100 * players["ORB"] * minute_share / (ctx["Tm_ORB"] + tm_opp_drb),
+            "DRB_Share%": 100 * players["DRB"] / ctx["Tm_DRB"],
+        })
+    metrics = metrics.replace([np.inf, -np.inf], np.nan)
+    return metrics.sort_values(["Team", "Season", "PPG"], ascending=[True, True, False]).round(1)
+
+
+def compute_all_metrics(players=None, opponents=None):
+    """Team and player metrics for every team in the loaded box scores"""
+    players = players if players is not None else load_player_boxes()
+    opponents = opponents if opponents is not None else load_opponent_scoring()
+    teams = team_boxes(players)
+    team_rates = team_metrics(teams, opponents)
+    return team_rates, player_metrics(players, teams, team_rates)
+
+
+def format_key_stats(row):
+    """Profile 'Key Stats' text for one team_metrics row"""
+    return f"ORtg: {row['ORtg']:.1f}, DRtg: {row['DRtg']:.1f}, Net: {row['Net']:+.1f}, Pace: {row['Pace']:.1f}"
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("POSSESSION-BASED ADVANCED METRICS")
+    print("=" * 70)
+
+    inputs = [source["csv_file"] for source in PLAYER_STAT_SOURCES] + TEAM_SUMMARY_SOURCES + ["advanced_metrics.py"]
+    outputs = [TEAM_OUTPUT_FILE, PLAYER_OUTPUT_FILE]
+    if ("--force" not in sys.argv and stage_is_current(STAGE, inputs)
+            and all(os.path.exists(path) for path in outputs)):
+        print("\n✓ Inputs unchanged since last build - outputs are current (use --force to rebuild)")
+        sys.exit(0)
+
+    df_teams, df_players = compute_all_metrics()
+
+    publish(df_teams, TEAM_OUTPUT_FILE)
+    publish(df_players, PLAYER_OUTPUT_FILE)
+    record_stage(STAGE, inputs, outputs)
+
+    print("\nTEAM METRICS")
+    print("-" * 70)
+    print(df_teams.to_string(index=False))
+    print(f"\n✓ Saved: {TEAM_OUTPUT_FILE}")
+
+    print("\nPLAYER METRICS")
+    print("-" * 70)
+    print(df_players.to_string(index=False))
+    print(f"\n✓ Saved: {PLAYER_OUTPUT_FILE}")
@@ -0,0 +1,80 @@
+"""
+Arrow IPC hand-off between pipeline stages
+A stage publishes each output table as an uncompressed Arrow IPC file next
+to its CSV export; downstream stages memory-map the IPC file (zero-copy,
+dtypes preserved) and only fall back to parsing the CSV when it is missing
+or older than the CSV
+"""
+
+import os
+import pyarrow as pa
+
+from artifact_manifest import write_if_changed
+from profiling import count, profiled, span
+from schema_registry import read_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+HANDOFF_DIR = "handoff"
+
+# -----------------------------------------------------------------
+# HAND-OFF FUNCTIONS
+# -----------------------------------------------------------------
+
+def handoff_path(csv_file, handoff_dir=HANDOFF_DIR):
+    """handoff/<csv stem>.arrow for a stage's CSV output"""
+    stem = os.path.splitext(os.path.basename(csv_file))[0]
+    return os.path.join(handoff_dir, f"{stem}.arrow")
+
+
+def write_arrow(df, path):
+    """Write df as one uncompressed Arrow IPC file (mmap-able)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    tmp_path = path + ".tmp"
+    with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)  # readers never see a half-written file
+
+
+@profiled("read", rows="in")
+def read_arrow(path, columns=None):
+    """Memory-map an Arrow IPC file into a DataFrame (zero-copy where dtypes allow)"""
+    with pa.memory_map(path, "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return table.to_pandas(split_blocks=True)
+
+
+def publish(df, csv_file, handoff_dir=HANDOFF_DIR):
+    """
+    Stage output: CSV export for Sheets/graphics, then Arrow IPC for the next stage
+
+    Identical content leaves both files untouched (same hash, same mtime),
+    so downstream stages and uploads keyed on it stay current. Returns
+    True if the output changed.
+    """
+    path = handoff_path(csv_file, handoff_dir)
+    with span("write", f"publish({csv_file})"):
+        count(rows_out=len(df))
+        changed = write_if_changed(csv_file, df.to_csv(index=False).encode("utf-8"))
+        if changed or not os.path.exists(path):
+            write_arrow(df, path)
+    return changed
+
+
+def load(csv_file, columns=None, handoff_dir=HANDOFF_DIR, **read_csv_kwargs):
+    """
+    Read a stage output, preferring the Arrow hand-off
+
+    The CSV is parsed only when no hand-off exists or the CSV was edited
+    after it (e.g. a hand-maintained file or a scraper that only writes CSV);
+    the CSV is then read with its registered schema.
+    """
+    path = handoff_path(csv_file, handoff_dir)
+    if os.path.exists(path) and (not os.path.exists(csv_file) or
+                                 os.path.getmtime(path) >= os.path.getmtime(csv_file)):
+        return read_arrow(path, columns)
+    return read_table(csv_file, columns, **read_csv_kwargs)
@@ -0,0 +1,170 @@
+"""
+Content-addressed build artifacts and a manifest of stage inputs
+Every generated dataset is hashed (sha256 of its bytes) and kept once in
+an object store; each stage records the hashes of the inputs it consumed,
+so a rerun with identical inputs - an upload included - is skipped
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows: no fcntl, manifest writes are unlocked
+    fcntl = None
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+MANIFEST_FILE = "build_manifest.json"
+OBJECT_DIR = os.path.join("artifacts", "objects")
+
+# -----------------------------------------------------------------
+# HASHING
+# -----------------------------------------------------------------
+
+def content_hash(data):
+    """sha256 hex digest of bytes"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """sha256 hex digest of a file or directory (None if it doesn't exist)"""
+    if not os.path.exists(path):
+        return None
+    if os.path.isdir(path):
+        return _directory_hash(path)
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _directory_hash(path):
+    """
+    Hash of every file's content under a directory, keyed by subdirectory
+
+    File names are left out: Parquet partitions get random names on each
+    write, so only the partition path and the bytes decide the hash.
+    """
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        relative = os.path.relpath(root, path)
+        entries += [f"{relative}:{file_hash(os.path.join(root, name))}" for name in files]
+    return content_hash("\n".join(sorted(entries)).encode("utf-8"))
+
+# -----------------------------------------------------------------
+# MANIFEST
+# -----------------------------------------------------------------
+
+def load_manifest(path=MANIFEST_FILE):
+    """{"artifacts": {file: entry}, "stages": {stage: entry}} (empty if none yet)"""
+    if not os.path.exists(path):
+        return {"artifacts": {}, "stages": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_FILE):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def manifest_lock(path=MANIFEST_FILE):
+    """Exclusive lock around a read-modify-write of the manifest (parallel stages)"""
+    if fcntl is None:
+        yield
+        return
+    with open(path + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def input_hashes(inputs):
+    """{path: hash} for a stage's input files"""
+    return {path: file_hash(path) for path in inputs}
+
+
+def stage_is_current(stage, inputs, manifest_file=MANIFEST_FILE):
+    """True when every input hashes the same as on the stage's last run"""
+    recorded = load_manifest(manifest_file)["stages"].get(stage)
+    return recorded is not None and recorded["inputs"] == input_hashes(inputs)
+
+
+def record_stage(stage, inputs, outputs=(), manifest_file=MANIFEST_FILE):
+    """Mark a stage as run against the current input hashes; stores its outputs"""
+    with manifest_lock(manifest_file):
+        manifest = load_manifest(manifest_file)
+        stamp = datetime.now().isoformat(timespec="seconds")
+        manifest["stages"][stage] = {"inputs": input_hashes(inputs), "outputs": list(outputs), "ran_at": stamp}
+        for output in outputs:
+            digest = store_object(output)
+            if digest is not None:
+                manifest["artifacts"][output] = {"hash": digest, "stage": stage, "built_at": stamp}
+        save_manifest(manifest, manifest_file)
+
+# -----------------------------------------------------------------
+# OBJECT STORE
+# -----------------------------------------------------------------
+
+def object_path(digest, object_dir=OBJECT_DIR):
+    return os.path.join(object_dir, digest[:2], digest)
+
+
+def store_object(path, object_dir=OBJECT_DIR):
+    """Copy a file into the object store under its hash (once); returns the hash"""
+    digest = file_hash(path)
+    if digest is None:
+        return None
+    target = object_path(digest, object_dir)
+    if not os.path.exists(target):
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(path, target)
+    return digest
+
+
+def write_if_changed(path, data):
+    """
+    Write bytes only when they differ from the file on disk
+
+    An identical rewrite leaves the file (and its mtime) untouched, so
+    stages that depend on it stay current. Returns True if written.
+    """
+    if file_hash(path) == content_hash(data):
+        return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def restore(path, manifest_file=MANIFEST_FILE, object_dir=OBJECT_DIR):
+    """Put back the last recorded version of a generated file"""
+    entry = load_manifest(manifest_file)["artifacts"][path]
+    shutil.copyfile(object_path(entry["hash"], object_dir), path)
+    return entry["hash"]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("BUILD MANIFEST")
+    print("=" * 70)
+    current = load_manifest()
+    for stage_name, entry in sorted(current["stages"].items()):
+        changed = [p for p, h in entry["inputs"].items() if file_hash(p) != h]
+        status = "stale: " + ", ".join(changed) if changed else "current"
+        print(f"  {stage_name:<45} {entry['ran_at']}  {status}")
+    print(f"\n✓ {len(current['artifacts'])} artifacts tracked in {MANIFEST_FILE}")
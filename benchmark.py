@@ -0,0 +1,377 @@
+"""
+Offline benchmarks - parser and compute throughput against a saved baseline
+Replays every archived page (see provenance.archive_page) and the standings
+script through the scrapers' parsers, then runs the compute stages on the
+stored game data without touching the network. Reports pages/s, games/s and
+rows/s per case and flags any case that slowed down past the tolerance;
+--synthetic load-tests the stages on a synthetic league instead
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+BASELINE_FILE = "benchmark_baseline.json"  # per machine, not committed (--baseline PATH to use another)
+STANDINGS_SCRIPT = "standings_script_105.js"
+ELITE16_GAMES = "elite16_all_games.csv"
+
+TOLERANCE = 0.30              # Throughput drop (vs baseline) that counts as a regression
+MIN_SECONDS = 1.0             # Keep repeating a case at least this long...
+MIN_REPEATS = 3               # ...and at least this many times; the fastest pass counts
+SIMULATION_RUNS = 1000        # Monte Carlo runs per simulate pass
+
+# -----------------------------------------------------------------
+# MEASUREMENT FUNCTIONS
+# -----------------------------------------------------------------
+
+def measure(func, min_seconds=MIN_SECONDS, min_repeats=MIN_REPEATS):
+    """
+    Fastest wall time of func() over repeated passes; returns (seconds, result)
+
+    One untimed warm-up pass first; parser output is swallowed.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+        best, total, repeats = float("inf"), 0.0, 0
+        while total < min_seconds or repeats < min_repeats:
+            started = time.perf_counter()
+            func()
+            seconds = time.perf_counter() - started
+            best, total, repeats = min(best, seconds), total + seconds, repeats + 1
+    return best, result
+
+
+def case_result(name, unit, items, rows, seconds):
+    return {"case": name, "unit": unit, "items": items, "rows": rows, "seconds": seconds,
+            "per_s": items / seconds if seconds else 0.0, "rows_per_s": rows / seconds if seconds else 0.0}
+
+# -----------------------------------------------------------------
+# PAGE PARSERS (archived page path -> rows extracted)
+# -----------------------------------------------------------------
+
+def _read_page(path):
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8", errors="replace")
+
+
+def parse_standings(path):
+    """Games from a standings script; table rows from the standings page itself"""
+    from extract_comprehensive_elite16 import extract_games_from_json
+
+    games = extract_games_from_json(path)
+    return len(games) if games is not None else parse_tables(path)
+
+
+def parse_elite16_stats(path):
+    from scrape_elite16_team_stats import TARGET_TEAMS, extract_team_stats_from_page, scrape_team_games
+
+    html = _read_page(path)
+    return sum(1 + len(scrape_team_games(html, team)) for team in TARGET_TEAMS.values()
+               if extract_team_stats_from_page(html, team))
+
+
+def parse_qualification(path):
+    from scrape_wikipedia_bal import parse_qualification_page
+
+    return len(parse_qualification_page(_read_page(path)))
+
+
+def parse_open_source(path):
+    from scrape_open_source_teams import TEAMS, extract_player_data
+
+    html = _read_page(path)
+    return sum(len(extract_player_data(html, team)) for team in TEAMS.values())
+
+
+def parse_tables(path):
+    """Generic table rows (FIBA history, BAL and Afrobasket pages)"""
+    from bs4 import BeautifulSoup
+    from scrape_all_teams import extract_table_data
+
+    return len(extract_table_data(BeautifulSoup(_read_page(path), "html.parser"), ""))
+
+
+# Provenance source -> parser its archived pages replay through
+PAGE_PARSERS = {
+    "fiba_standings": parse_standings,
+    "fiba_elite16_stats": parse_elite16_stats,
+    "wikipedia_qualification": parse_qualification,
+    "open_source_teams": parse_open_source,
+    "fiba_team_history": parse_tables,
+    "bal_historical": parse_tables,
+}
+
+# -----------------------------------------------------------------
+# COMPUTE CASES (loaded inputs -> (items processed, rows out))
+# -----------------------------------------------------------------
+
+def load_inputs():
+    """Everything the compute cases read, loaded once up front"""
+    from game_results import load_game_results, load_team_countries
+    from rating_engine import load_tier_priors, load_upcoming_fixtures, replay_ratings
+    from schema_registry import read_table
+
+    games = load_game_results()
+    countries = load_team_countries()
+    priors = load_tier_priors()
+    ratings, _ = replay_ratings(games, priors, countries)
+    return {
+        "games": games, "countries": countries, "priors": priors, "ratings": ratings,
+        "fixtures": load_upcoming_fixtures(games, countries),
+        "elite16_games": read_table(ELITE16_GAMES) if os.path.exists(ELITE16_GAMES) else None,
+    }
+
+
+def bench_load_games(inputs):
+    from game_results import load_game_results
+
+    games = load_game_results()
+    return len(games), len(games)
+
+
+def bench_standings(inputs):
+    from extract_comprehensive_elite16 import calculate_standings
+    from team_registry import CASE_STUDY_CODES
+
+    games = inputs["elite16_games"]
+    if games is None:
+        return 0, 0
+    return len(games), len(calculate_standings(games, CASE_STUDY_CODES)[0])
+
+
+def bench_ratings(inputs):
+    from rating_engine import replay_ratings
+
+    ratings, _ = replay_ratings(inputs["games"], inputs["priors"], inputs["countries"])
+    return len(inputs["games"]), len(ratings)
+
+
+def bench_head_to_head(inputs):
+    from head_to_head_index import build_index, to_dataframe
+
+    return len(inputs["games"]), len(to_dataframe(build_index(inputs["games"])))
+
+
+def bench_rolling_form(inputs):
+    from rolling_form import build_form, to_dataframe
+
+    return len(inputs["games"]), len(to_dataframe(build_form(inputs["games"])))
+
+
+def bench_simulate(inputs):
+    from rating_engine import simulate_fixtures
+
+    if inputs["fixtures"].empty:
+        return 0, 0
+    table = simulate_fixtures(inputs["ratings"], inputs["fixtures"], runs=SIMULATION_RUNS, seed=1)
+    return SIMULATION_RUNS * len(inputs["fixtures"]), len(table)
+
+
+def bench_advanced_metrics(inputs):
+    from advanced_metrics import compute_all_metrics
+
+    teams, players = compute_all_metrics(inputs.get("players"), inputs.get("opponents"))
+    return len(inputs["games"]), len(teams) + len(players)
+
+
+def bench_game_identity(inputs):
+    from game_identity import collect_mentions, resolve
+
+    mentions = collect_mentions()
+    _, identities, _ = resolve(mentions)
+    return len(inputs["games"]), len(identities)
+
+
+def bench_validation(inputs):
+    from data_validator import validate
+
+    issues, checks = validate()
+    return int(checks["Checks"].sum()), len(issues)
+
+
+# (case, unit of the items it processes, function)
+COMPUTE_CASES = [
+    ("load_game_results", "games", bench_load_games),
+    ("standings", "games", bench_standings),
+    ("ratings", "games", bench_ratings),
+    ("head_to_head", "games", bench_head_to_head),
+    ("rolling_form", "games", bench_rolling_form),
+    ("simulate", "games", bench_simulate),
+    ("advanced_metrics", "games", bench_advanced_metrics),
+    ("game_identity", "games", bench_game_identity),
+    ("data_quality", "checks", bench_validation),
+]
+
+# -----------------------------------------------------------------
+# SYNTHETIC LOAD TEST (synthetic_league.py -> the same compute cases)
+# -----------------------------------------------------------------
+
+def load_synthetic_inputs():
+    """
+    The compute inputs built from the synthetic league
+
+    Reads synthetic_league/ when generated, otherwise generates the default
+    league in memory. Synthetic teams are outside the team registry, so the
+    tables go straight to the stage functions rather than through
+    load_game_results.
+    """
+    from rating_engine import home_indicator, replay_ratings
+    from synthetic_league import generate_league, league_exists, load_league, season_totals, tier_priors
+
+    league = load_league() if league_exists() else generate_league(seed=1)
+    teams, games = league["teams"], league["games"]
+    unplayed = (games["Score_A"] == 0) & (games["Score_B"] == 0)
+    played = games[~unplayed].reset_index(drop=True)
+    countries = dict(zip(teams["Team"], teams["Country"]))
+    priors = tier_priors(teams)
+    ratings, _ = replay_ratings(played, priors, countries)
+    fixtures = games[unplayed].reset_index(drop=True)
+    latest = played[(played["Season"] == played["Season"].max()) & (played["Stage"] == "Group Phase")]
+    players, opponents = season_totals(league["box_scores"], played)
+    return {
+        "games": played, "countries": countries, "priors": priors, "ratings": ratings,
+        "fixtures": fixtures.assign(Home=home_indicator(fixtures, countries)),
+        "elite16_games": latest, "players": players, "opponents": opponents,
+        "box_scores": league["box_scores"],
+    }
+
+
+def bench_upload_payload(inputs):
+    """What upload_dataset builds before the Sheets call: display strings, then the cell grid"""
+    from display_format import format_for_display
+
+    box = inputs["box_scores"]
+    values = [box.columns.tolist()] + format_for_display(box).fillna("").values.tolist()
+    return len(box), len(values) - 1
+
+
+def bench_store_games(inputs):
+    import tempfile
+    from parquet_store import write_dataset
+
+    with tempfile.TemporaryDirectory() as store_dir:
+        rows = write_dataset("games", inputs["games"], store_dir=store_dir)
+    return len(inputs["games"]), rows
+
+
+SYNTHETIC_CASES = [
+    ("synthetic:standings", "games", bench_standings),
+    ("synthetic:ratings", "games", bench_ratings),
+    ("synthetic:head_to_head", "games", bench_head_to_head),
+    ("synthetic:rolling_form", "games", bench_rolling_form),
+    ("synthetic:simulate", "games", bench_simulate),
+    ("synthetic:advanced_metrics", "games", bench_advanced_metrics),
+    ("synthetic:upload_payload", "rows", bench_upload_payload),
+    ("synthetic:store_games", "games", bench_store_games),
+]
+
+# -----------------------------------------------------------------
+# SUITE FUNCTIONS
+# -----------------------------------------------------------------
+
+def page_cases(only=None):
+    """One case per source with archived pages, plus the standings script on disk"""
+    from provenance import archived_pages
+
+    sources = {}
+    if os.path.exists(STANDINGS_SCRIPT):
+        sources["standings_script"] = (parse_standings, [STANDINGS_SCRIPT])
+    pages = archived_pages(list(PAGE_PARSERS))
+    for source, group in pages.groupby("source", sort=False):
+        sources[f"pages:{source}"] = (PAGE_PARSERS[source], list(group["path"]))
+    return {name: spec for name, spec in sources.items() if only is None or name in only}
+
+
+def run_suite(only=None, synthetic=False):
+    """Benchmark every page and compute case (or the synthetic load test); returns the result rows"""
+    results = []
+    cases, loader = (SYNTHETIC_CASES, load_synthetic_inputs) if synthetic else (COMPUTE_CASES, load_inputs)
+    pages = {} if synthetic else page_cases(only)
+    for name, (parser, paths) in pages.items():
+        seconds, rows = measure(lambda: sum(parser(path) for path in paths))
+        unit = "games" if name == "standings_script" else "pages"
+        items = rows if unit == "games" else len(paths)
+        results.append(case_result(name, unit, items, rows, seconds))
+
+    inputs = None
+    for name, unit, bench in cases:
+        if only is not None and name not in only:
+            continue
+        if inputs is None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                inputs = loader()
+        seconds, (items, rows) = measure(lambda: bench(inputs))
+        if items:
+            results.append(case_result(name, unit, items, rows, seconds))
+    return results
+
+
+def load_baseline(path=BASELINE_FILE):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return {row["case"]: row for row in json.load(f)["results"]}
+
+
+def save_baseline(results, path=BASELINE_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"saved_at": time.strftime("%Y-%m-%d %H:%M:%S"), "python": sys.version.split()[0],
+                   "results": results}, f, indent=2)
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """Attach the change vs baseline to each row; returns the regressed case names"""
+    regressions = []
+    for row in results:
+        before = baseline.get(row["case"])
+        row["change"] = row["per_s"] / before["per_s"] - 1 if before and before["per_s"] else None
+        if row["change"] is not None and row["change"] < -tolerance:
+            regressions.append(row["case"])
+    return regressions
+
+
+def print_results(results):
+    print(f"\n{'CASE':<30} {'ITEMS':>7} {'THROUGHPUT':>18} {'ROWS/S':>11} {'PASS MS':>9} {'VS BASE':>8}")
+    for row in results:
+        change = f"{row['change']:+.0%}" if row.get("change") is not None else "-"
+        throughput = f"{row['per_s']:,.0f} {row['unit']}/s"
+        print(f"{row['case']:<30} {row['items']:>7} {throughput:>18} {row['rows_per_s']:>11,.0f} "
+              f"{row['seconds'] * 1000:>9.2f} {change:>8}")
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("OFFLINE BENCHMARKS")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    baseline_file = args[args.index("--baseline") + 1] if "--baseline" in args else BASELINE_FILE
+    only = [arg for i, arg in enumerate(args)
+            if not arg.startswith("--") and (i == 0 or args[i - 1] != "--baseline")] or None
+    suite_results = run_suite(only, synthetic="--synthetic" in args)
+    if not suite_results:
+        sys.exit("Nothing to benchmark - no archived pages or game data")
+
+    baseline = load_baseline(baseline_file)
+    regressed = compare(suite_results, baseline)
+    print_results(suite_results)
+
+    if "--save-baseline" in args:
+        save_baseline(suite_results, baseline_file)
+        print(f"\n✓ Baseline saved: {baseline_file}")
+    elif not baseline:
+        print(f"\n- No baseline at {baseline_file}, nothing compared (--save-baseline to record one)")
+    elif regressed:
+        print(f"\n✗ {len(regressed)} cases slower than baseline by more than {TOLERANCE:.0%}: "
+              f"{', '.join(regressed)}")
+        sys.exit(1)
+    else:
+        print(f"\n✓ No case slower than baseline by more than {TOLERANCE:.0%}")
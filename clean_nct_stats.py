@@ -3,174 +3,230 @@ Clean and parse NCT 2025 BAL stats from messy scraped data
 """
 
 import pandas as pd
-import re
-
-# Read the messy data
-df = pd.read_csv('nct_2025_bal_stats.csv')
-
-# Extract team summary stats (the clean ones)
-team_stats_data = []
-for _, row in df.iterrows():
-    data = row['data']
-    if isinstance(data, str):
-        # Team summary stats
-        if 'Points per game |' in data:
-            team_stats_data.append({'Metric': 'Points per game', 'Value': data.split('|')[1].strip()})
-        elif '2FGP% |' in data:
-            team_stats_data.append({'Metric': '2FG%', 'Value': data.split('|')[1].strip()})
-        elif '3FGP% |' in data:
-            team_stats_data.append({'Metric': '3FG%', 'Value': data.split('|')[1].strip()})
-        elif 'FT% |' in data:
-            team_stats_data.append({'Metric': 'FT%', 'Value': data.split('|')[1].strip()})
-        elif 'Off rebounds |' in data:
-            team_stats_data.append({'Metric': 'Offensive Rebounds', 'Value': data.split('|')[1].strip()})
-        elif 'Def rebounds |' in data:
-            team_stats_data.append({'Metric': 'Defensive Rebounds', 'Value': data.split('|')[1].strip()})
-        elif 'Total rebounds |' in data:
-            team_stats_data.append({'Metric': 'Total Rebounds', 'Value': data.split('|')[1].strip()})
-        elif 'Assists per game |' in data:
-            team_stats_data.append({'Metric': 'Assists per game', 'Value': data.split('|')[1].strip()})
-        elif 'Turnovers per game |' in data:
-            team_stats_data.append({'Metric': 'Turnovers per game', 'Value': data.split('|')[1].strip()})
-        elif 'Steals per game |' in data:
-            team_stats_data.append({'Metric': 'Steals per game', 'Value': data.split('|')[1].strip()})
-        elif 'Blocks per game |' in data:
-            team_stats_data.append({'Metric': 'Blocks per game', 'Value': data.split('|')[1].strip()})
-        elif 'Points per game of opponent |' in data:
-            team_stats_data.append({'Metric': 'Opponent Points per game', 'Value': data.split('|')[1].strip()})
-        elif 'Opponent 2FGP% |' in data:
-            team_stats_data.append({'Metric': 'Opponent 2FG%', 'Value': data.split('|')[1].strip()})
-        elif 'Opponent 3FGP% |' in data:
-            team_stats_data.append({'Metric': 'Opponent 3FG%', 'Value': data.split('|')[1].strip()})
-
-# Extract player stats (the pipe-separated ones)
-player_stats = []
-for _, row in df.iterrows():
-    data = row['data']
-    if isinstance(data, str) and ' | ' in data:
-        parts = data.split(' | ')
-        # Look for player stat rows (they have jersey number at start)
-        if len(parts) >= 18:
-            try:
-                # Check if first element is a number (jersey number)
-                jersey_num = parts[0].strip()
-                if jersey_num.isdigit():
-                    player_stats.append({
-                        'Jersey': jersey_num,
-                        'Name': parts[1].strip(),
-                        'Games': parts[2].strip(),
-                        'MIN': parts[3].strip(),
-                        'FGM-A': parts[4].strip(),
-                        'FG%': parts[5].strip(),
-                        '3PM-A': parts[6].strip(),
-                        '3P%': parts[7].strip(),
-                        'FTM-A': parts[8].strip(),
-                        'FT%': parts[9].strip(),
-                        'ORB': parts[10].strip(),
-                        'DRB': parts[11].strip(),
-                        'REB': parts[12].strip(),
-                        'AST': parts[13].strip(),
-                        'PF': parts[14].strip(),
-                        'STL': parts[15].strip(),
-                        'BLK': parts[16].strip(),
-                        'TO': parts[17].strip(),
-                        'PTS': parts[18].strip(),
-                        'RNK': parts[19].strip() if len(parts) > 19 else ''
-                    })
-            except:
-                pass
-
-# Extract game record
-game_record = {}
-for _, row in df.iterrows():
-    data = row['data']
-    if isinstance(data, str) and 'Basketball Africa League | 6 |' in data:
-        parts = data.split(' | ')
-        if len(parts) >= 6:
-            game_record = {
-                'Competition': parts[0].strip(),
-                'Total Games': parts[1].strip(),
-                'Home Won': parts[2].strip(),
-                'Home Lost': parts[3].strip(),
-                'Away Won': parts[4].strip(),
-                'Away Lost': parts[5].strip()
-            }
-
-# Create clean DataFrames
-print("="*70)
-print("NCT 2025 BAL SEASON - CLEANED DATA")
-print("="*70)
-
-# 1. Team Summary Stats
-if team_stats_data:
-    df_team = pd.DataFrame(team_stats_data)
-    df_team.to_csv('nct_2025_team_stats_clean.csv', index=False)
-    print("\n1. TEAM SUMMARY STATS")
-    print("-"*70)
-    print(df_team.to_string(index=False))
-    print(f"\n✓ Saved: nct_2025_team_stats_clean.csv")
-
-# 2. Game Record
-if game_record:
-    df_record = pd.DataFrame([game_record])
-    df_record.to_csv('nct_2025_game_record_clean.csv', index=False)
-    print("\n2. GAME RECORD (2025 BAL)")
-    print("-"*70)
-    print(df_record.to_string(index=False))
-    print(f"\n✓ Saved: nct_2025_game_record_clean.csv")
-
-# 3. Player Stats
-if player_stats:
-    df_players = pd.DataFrame(player_stats)
-    df_players.to_csv('nct_2025_player_stats_clean.csv', index=False)
-    print("\n3. PLAYER STATS")
-    print("-"*70)
-    print(df_players.to_string(index=False))
-    print(f"\n✓ Saved: nct_2025_player_stats_clean.csv")
-
-# 4. Create a comprehensive summary sheet
-print("\n" + "="*70)
-print("CREATING COMPREHENSIVE SUMMARY")
-print("="*70)
-
-# Key metrics for comparison
-key_metrics = {
+
+from arrow_handoff import publish
+from profiling import profiled
+from schema_registry import read_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+RAW_FILE = "nct_2025_bal_stats.csv"
+
+OUTPUT_FILES = {
+    "team_stats": "nct_2025_team_stats_clean.csv",
+    "game_record": "nct_2025_game_record_clean.csv",
+    "player_stats": "nct_2025_player_stats_clean.csv",
+    "summary": "nct_2025_summary_clean.csv",
+}
+
+# Team summary rows: (marker in the scraped text, metric name) - first match wins,
+# so the opponent rows come first ('2FGP% |' also matches 'Opponent 2FGP% |')
+TEAM_METRICS = [
+    ("Opponent 2FGP% |", "Opponent 2FG%"),
+    ("Opponent 3FGP% |", "Opponent 3FG%"),
+    ("Points per game |", "Points per game"),
+    ("2FGP% |", "2FG%"),
+    ("3FGP% |", "3FG%"),
+    ("FT% |", "FT%"),
+    ("Off rebounds |", "Offensive Rebounds"),
+    ("Def rebounds |", "Defensive Rebounds"),
+    ("Total rebounds |", "Total Rebounds"),
+    ("Assists per game |", "Assists per game"),
+    ("Turnovers per game |", "Turnovers per game"),
+    ("Steals per game |", "Steals per game"),
+    ("Blocks per game |", "Blocks per game"),
+    ("Points per game of opponent |", "Opponent Points per game"),
+]
+
+# Player rows: pipe-separated fields in page order (RNK is optional)
+PLAYER_FIELDS = ['Jersey', 'Name', 'Games', 'MIN', 'FGM-A', 'FG%', '3PM-A', '3P%', 'FTM-A', 'FT%',
+                 'ORB', 'DRB', 'REB', 'AST', 'PF', 'STL', 'BLK', 'TO', 'PTS']
+
+# Made-attempted splits -> numeric columns (Afrobasket's FGM-A is 2-pointers)
+SHOOTING_SPLITS = [
+    ('FGM-A', '2PM', '2PA'),
+    ('3PM-A', '3PM', '3PA'),
+    ('FTM-A', 'FTM', 'FTA'),
+]
+
+PLAYER_COLUMNS = ['Jersey', 'Name', 'Games', 'MIN', '2PM', '2PA', '2P%', '3PM', '3PA', '3P%',
+                  'FTM', 'FTA', 'FT%', 'ORB', 'DRB', 'REB', 'AST', 'PF', 'STL', 'BLK', 'TO', 'PTS', 'RNK']
+
+GAME_RECORD_MARKER = 'Basketball Africa League | 6 |'
+GAME_RECORD_FIELDS = ['Competition', 'Total Games', 'Home Won', 'Home Lost', 'Away Won', 'Away Lost']
+
+# Summary sheet: fixed season facts, then column -> team metric
+SEASON_FACTS = {
     'Team': 'Nairobi City Thunder',
     'Season': '2025 BAL',
-    'Games Played': '6',
+    'Games Played': 6,
     'Record': '1-5',
-    'PPG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Points per game'), 'N/A'),
-    'Opp PPG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Opponent Points per game'), 'N/A'),
-    'FG%': next((item['Value'] for item in team_stats_data if item['Metric'] == '2FG%'), 'N/A'),
-    '3P%': next((item['Value'] for item in team_stats_data if item['Metric'] == '3FG%'), 'N/A'),
-    'FT%': next((item['Value'] for item in team_stats_data if item['Metric'] == 'FT%'), 'N/A'),
-    'RPG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Total Rebounds'), 'N/A'),
-    'APG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Assists per game'), 'N/A'),
-    'SPG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Steals per game'), 'N/A'),
-    'BPG': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Blocks per game'), 'N/A'),
-    'TOV': next((item['Value'] for item in team_stats_data if item['Metric'] == 'Turnovers per game'), 'N/A'),
 }
+SUMMARY_METRICS = {
+    'PPG': 'Points per game',
+    'Opp PPG': 'Opponent Points per game',
+    'FG%': '2FG%',
+    '3P%': '3FG%',
+    'FT%': 'FT%',
+    'RPG': 'Total Rebounds',
+    'APG': 'Assists per game',
+    'SPG': 'Steals per game',
+    'BPG': 'Blocks per game',
+    'TOV': 'Turnovers per game',
+}
+
+# -----------------------------------------------------------------
+# TYPING FUNCTIONS
+# -----------------------------------------------------------------
+
+def to_numeric_values(series):
+    """'46.6%' / '+65' / '79.0' strings -> floats (display formatting is applied at upload)"""
+    return pd.to_numeric(series.astype(str).str.strip().str.rstrip('%'), errors='coerce')
+
+
+def type_player_stats(df_players):
+    """Split 'M-A' strings into made/attempted columns and make every stat numeric"""
+    df_players = df_players.drop_duplicates().rename(columns={'FG%': '2P%'})
+    for split, made, attempted in SHOOTING_SPLITS:
+        parts = df_players.pop(split).str.split('-', expand=True)
+        df_players[made], df_players[attempted] = parts[0], parts[1]
+
+    numeric = [c for c in PLAYER_COLUMNS if c != 'Name']
+    df_players[numeric] = df_players[numeric].apply(to_numeric_values)
+    counts = ['Jersey', 'Games'] + [c for _, made, attempted in SHOOTING_SPLITS for c in (made, attempted)]
+    df_players[counts] = df_players[counts].astype('Int64')
+    return df_players[PLAYER_COLUMNS].reset_index(drop=True)
+
+# -----------------------------------------------------------------
+# EXTRACTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def _text_rows(raw):
+    return [data for data in raw['data'] if isinstance(data, str)]
+
+
+def extract_team_stats(raw):
+    """Metric/Value table of the team summary rows (values numeric)"""
+    rows = []
+    for data in _text_rows(raw):
+        for marker, metric in TEAM_METRICS:
+            if marker in data:
+                rows.append({'Metric': metric, 'Value': data.split('|')[1].strip()})
+                break
+    df_team = pd.DataFrame(rows, columns=['Metric', 'Value'])
+    df_team['Value'] = to_numeric_values(df_team['Value'])
+    return df_team
+
+
+def extract_player_stats(raw):
+    """Typed player table from the rows that start with a jersey number"""
+    rows = []
+    for data in _text_rows(raw):
+        parts = [part.strip() for part in data.split(' | ')]
+        if len(parts) >= len(PLAYER_FIELDS) and parts[0].isdigit():
+            player = dict(zip(PLAYER_FIELDS, parts))
+            player['RNK'] = parts[19] if len(parts) > 19 else ''
+            rows.append(player)
+    if not rows:
+        return pd.DataFrame(columns=PLAYER_COLUMNS)
+    return type_player_stats(pd.DataFrame(rows))
+
+
+def extract_game_record(raw):
+    """One-row home/away win-loss record (empty if the row wasn't scraped)"""
+    record = None
+    for data in _text_rows(raw):
+        parts = data.split(' | ')
+        if GAME_RECORD_MARKER in data and len(parts) >= len(GAME_RECORD_FIELDS):
+            record = dict(zip(GAME_RECORD_FIELDS, (part.strip() for part in parts)))
+    if record is None:
+        return pd.DataFrame(columns=GAME_RECORD_FIELDS)
+    df_record = pd.DataFrame([record])
+    numeric = df_record.columns.drop('Competition')
+    df_record[numeric] = df_record[numeric].apply(pd.to_numeric, errors='coerce')
+    return df_record
+
+
+def build_summary(df_team):
+    """One-row key metrics sheet (None for metrics that were not scraped)"""
+    team_value = dict(zip(df_team['Metric'], df_team['Value']))
+
+    def metric_value(metric):
+        value = to_numeric_values(pd.Series([team_value.get(metric)]))[0]
+        return None if pd.isna(value) else float(value)
+
+    key_metrics = dict(SEASON_FACTS)
+    key_metrics.update({column: metric_value(metric) for column, metric in SUMMARY_METRICS.items()})
+    return pd.DataFrame([key_metrics])
+
+
+@profiled("parse", rows="out")
+def clean_nct_stats(raw=RAW_FILE):
+    """
+    Cleaned tables from the scraped page (a DataFrame or the CSV path)
+
+    Returns {"team_stats", "game_record", "player_stats", "summary"} as
+    DataFrames; nothing is written (see save_clean_stats).
+    """
+    if not isinstance(raw, pd.DataFrame):
+        raw = read_table(raw)
+    df_team = extract_team_stats(raw)
+    return {
+        "team_stats": df_team,
+        "game_record": extract_game_record(raw),
+        "player_stats": extract_player_stats(raw),
+        "summary": build_summary(df_team),
+    }
+
+
+def save_clean_stats(tables, output_files=OUTPUT_FILES):
+    """Publish every non-empty table; returns the files written"""
+    written = []
+    for name, df in tables.items():
+        if not df.empty:
+            publish(df, output_files[name])
+            written.append(output_files[name])
+    return written
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    tables = clean_nct_stats()
+    save_clean_stats(tables)
+
+    print("="*70)
+    print("NCT 2025 BAL SEASON - CLEANED DATA")
+    print("="*70)
+
+    sections = [("team_stats", "1. TEAM SUMMARY STATS"), ("game_record", "2. GAME RECORD (2025 BAL)"),
+                ("player_stats", "3. PLAYER STATS")]
+    for name, title in sections:
+        if not tables[name].empty:
+            print(f"\n{title}")
+            print("-"*70)
+            print(tables[name].to_string(index=False))
+            print(f"\n✓ Saved: {OUTPUT_FILES[name]}")
+
+    print("\n" + "="*70)
+    print("CREATING COMPREHENSIVE SUMMARY")
+    print("="*70)
+    print(f"\n✓ Saved: {OUTPUT_FILES['summary']}")
+    print("\nKEY METRICS:")
+    for key, value in tables["summary"].iloc[0].items():
+        print(f"  {key}: {value}")
+
+    if not tables["player_stats"].empty:
+        print("\nTOP 3 SCORERS:")
+        top_scorers = tables["player_stats"].nlargest(3, 'PTS')
+        for i, (_, player) in enumerate(top_scorers.iterrows(), 1):
+            print(f"  {i}. {player['Name']}: {player['PTS']:.1f} PPG")
 
-df_summary = pd.DataFrame([key_metrics])
-df_summary.to_csv('nct_2025_summary_clean.csv', index=False)
-print("\n✓ Saved: nct_2025_summary_clean.csv")
-print("\nKEY METRICS:")
-for key, value in key_metrics.items():
-    print(f"  {key}: {value}")
-
-# Top 3 scorers
-if player_stats:
-    print("\nTOP 3 SCORERS:")
-    top_scorers = sorted(player_stats, key=lambda x: float(x['PTS']), reverse=True)[:3]
-    for i, player in enumerate(top_scorers, 1):
-        print(f"  {i}. {player['Name']}: {player['PTS']} PPG")
-
-print("\n" + "="*70)
-print("DATA CLEANING COMPLETE!")
-print("="*70)
-print("\nFiles created:")
-print("  1. nct_2025_team_stats_clean.csv")
-print("  2. nct_2025_game_record_clean.csv")
-print("  3. nct_2025_player_stats_clean.csv")
-print("  4. nct_2025_summary_clean.csv")
-print("\nReady to upload to Google Sheets!")
+    print("\n" + "="*70)
+    print("DATA CLEANING COMPLETE!")
+    print("="*70)
+    print("\nFiles created:")
+    for i, csv_file in enumerate(OUTPUT_FILES.values(), 1):
+        print(f"  {i}. {csv_file}")
+    print("\nReady to upload to Google Sheets!")
@@ -5,68 +5,69 @@ Combines preliminary group stats with Elite 16 stats
 
 import pandas as pd
 
-print("\n" + "="*70)
-print("ELITE 16 COMPREHENSIVE STATS - 3 TEAMS")
-print("="*70)
+from game_results import GAME_SOURCES, load_game_rows, game_key
+from league_db import open_database, team_games as team_games_for
+from parquet_store import read_dataset, write_dataset, export_csv
+from rolling_form import refresh_form, form_for
+from team_registry import team_name, team_code
 
-# Load existing data
-prelim_df = pd.read_csv("road_to_bal_2026_summary.csv")
-games_df = pd.read_csv("elite16_case_study_games_completed.csv")
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+CASE_STUDY_GAMES = "elite16_case_study_games_completed.csv"
+TARGET_CODES = ["NCT", "FBE", "BHB"]
+PRELIM_COLUMNS = ["Team", "Tier", "Country", "Preliminary_Group", "Games_Played", "Wins", "Losses",
+                  "Points_For", "Points_Against", "Point_Diff", "PPG"]
 
-# Filter for our 3 target teams
-target_teams = ["Nairobi City Thunder", "Ferroviario da Beira", "Bravehearts"]
+# -----------------------------------------------------------------
+# BUILD FUNCTIONS
+# -----------------------------------------------------------------
 
-# Create comprehensive stats
-comprehensive_stats = []
+def case_study_keys(csv_file=CASE_STUDY_GAMES):
+    """Game keys of the case-study games (the db may keep another source's copy of each)"""
+    sources = [source for source in GAME_SOURCES if source["csv_file"] == csv_file]
+    games = load_game_rows(sources)
+    return game_key(games).tolist() if not games.empty else []
 
-for team in target_teams:
+
+def load_prelim_stats(teams):
+    """Preliminary-round rows for the given teams (pushed down to the Parquet store)"""
+    return read_dataset("road_to_bal_summary", columns=PRELIM_COLUMNS, filters=[("Team", "in", teams)])
+
+
+def team_record(team, prelim_df, team_games, form_state):
+    """One team's preliminary, Elite 16 (team_games from league_db), combined and form stats"""
     # Get preliminary stats
     prelim_stats = prelim_df[prelim_df["Team"] == team].iloc[0] if team in prelim_df["Team"].values else None
-    
-    # Get Elite 16 games
-    team_games = games_df[
-        (games_df["Team_A"] == team) | (games_df["Team_B"] == team)
-    ]
-    
+
     # Calculate Elite 16 stats
     elite16_wins = 0
     elite16_losses = 0
     elite16_pf = 0
     elite16_pa = 0
     elite16_games_list = []
-    
+
     for _, game in team_games.iterrows():
-        if game["Team_A"] == team:
-            score_for = game["Score_A"]
-            score_against = game["Score_B"]
-            opponent = game["Team_B"]
-            if game["Winner"] == game["Team_A_Code"]:
-                elite16_wins += 1
-                result = "W"
-            else:
-                elite16_losses += 1
-                result = "L"
+        score_for = game["points_for"]
+        score_against = game["points_against"]
+        opponent = game["opponent"]
+        if score_for > score_against:
+            elite16_wins += 1
+            result = "W"
         else:
-            score_for = game["Score_B"]
-            score_against = game["Score_A"]
-            opponent = game["Team_A"]
-            if game["Winner"] == game["Team_B_Code"]:
-                elite16_wins += 1
-                result = "W"
-            else:
-                elite16_losses += 1
-                result = "L"
-        
+            elite16_losses += 1
+            result = "L"
+
         elite16_pf += score_for
         elite16_pa += score_against
-        elite16_games_list.append(f"{result} {score_for}-{score_against} vs {opponent} ({game['Date']})")
-    
+        elite16_games_list.append(f"{result} {score_for}-{score_against} vs {opponent} ({game['game_date']})")
+
     # Build comprehensive record
     stats = {
         "Team": team,
         "Tier": prelim_stats["Tier"] if prelim_stats is not None else "N/A",
         "Country": prelim_stats["Country"] if prelim_stats is not None else "N/A",
-        
+
         # Preliminary Round
         "Prelim_Group": prelim_stats["Preliminary_Group"] if prelim_stats is not None else "N/A",
         "Prelim_GP": int(prelim_stats["Games_Played"]) if prelim_stats is not None else 0,
@@ -76,7 +77,7 @@ for team in target_teams:
         "Prelim_PA": int(prelim_stats["Points_Against"]) if prelim_stats is not None else 0,
         "Prelim_PD": int(prelim_stats["Point_Diff"]) if prelim_stats is not None else 0,
         "Prelim_PPG": float(prelim_stats["PPG"]) if prelim_stats is not None else 0.0,
-        
+
         # Elite 16
         "Elite16_GP": len(team_games),
         "Elite16_Wins": elite16_wins,
@@ -86,17 +87,25 @@ for team in target_teams:
         "Elite16_PD": elite16_pf - elite16_pa,
         "Elite16_PPG": round(elite16_pf / len(team_games), 1) if len(team_games) > 0 else 0.0,
         "Elite16_OppPPG": round(elite16_pa / len(team_games), 1) if len(team_games) > 0 else 0.0,
-        
+
         # Combined Total
         "Total_GP": (int(prelim_stats["Games_Played"]) if prelim_stats is not None else 0) + len(team_games),
         "Total_Wins": (int(prelim_stats["Wins"]) if prelim_stats is not None else 0) + elite16_wins,
         "Total_Losses": (int(prelim_stats["Losses"]) if prelim_stats is not None else 0) + elite16_losses,
         "Total_PF": (int(prelim_stats["Points_For"]) if prelim_stats is not None else 0) + elite16_pf,
         "Total_PA": (int(prelim_stats["Points_Against"]) if prelim_stats is not None else 0) + elite16_pa,
-        
+
         "Elite16_Games": " | ".join(elite16_games_list) if elite16_games_list else "No games yet"
     }
-    
+
+    # Rolling form over every game on record
+    form = form_for(form_state, team)
+    stats["Last5_Record"] = form.get("Last5_Record", "0-0")
+    stats["Last5_PPG"] = form.get("Last5_PPG", 0.0)
+    stats["Last5_OppPPG"] = form.get("Last5_OppPPG", 0.0)
+    stats["Last5_Margin"] = form.get("Last5_Margin", 0.0)
+    stats["Streak"] = form.get("Streak", "-")
+
     # Calculate totals
     if stats["Total_GP"] > 0:
         stats["Total_PD"] = stats["Total_PF"] - stats["Total_PA"]
@@ -106,42 +115,81 @@ for team in target_teams:
         stats["Total_PD"] = 0
         stats["Total_PPG"] = 0.0
         stats["Total_Win_Pct"] = 0.000
-    
-    comprehensive_stats.append(stats)
-
-# Create DataFrame
-df = pd.DataFrame(comprehensive_stats)
-
-# Save to CSV
-df.to_csv("elite16_comprehensive_nct_fbe_bhb.csv", index=False)
-
-print(f"\n✓ Created comprehensive stats for {len(df)} teams\n")
-print(df[["Team", "Tier", "Prelim_GP", "Prelim_Wins", "Elite16_GP", "Elite16_Wins", "Total_GP", "Total_Wins", "Total_PPG"]].to_string(index=False))
-
-print("\n" + "="*70)
-print("DETAILED BREAKDOWN")
-print("="*70)
-
-for _, row in df.iterrows():
-    print(f"\n{row['Team']} ({row['Tier']}) - {row['Country']}")
-    print("-" * 60)
-    print(f"PRELIMINARY ROUND ({row['Prelim_Group']}):")
-    print(f"  Record: {row['Prelim_Wins']}-{row['Prelim_Losses']} in {row['Prelim_GP']} games")
-    print(f"  Scoring: {row['Prelim_PPG']} PPG | {row['Prelim_PD']:+d} PD")
-    
-    print(f"\nELITE 16:")
-    print(f"  Record: {row['Elite16_Wins']}-{row['Elite16_Losses']} in {row['Elite16_GP']} games")
-    if row['Elite16_GP'] > 0:
-        print(f"  Scoring: {row['Elite16_PPG']} PPG | {row['Elite16_PD']:+d} PD")
-        print(f"  Games: {row['Elite16_Games']}")
-    else:
-        print(f"  Status: Games not yet started")
-    
-    print(f"\nTOTAL ROAD TO BAL 2026:")
-    print(f"  Overall Record: {row['Total_Wins']}-{row['Total_Losses']} ({row['Total_Win_Pct']:.1%})")
-    print(f"  Total Games: {row['Total_GP']}")
-    print(f"  Average: {row['Total_PPG']} PPG | {row['Total_PD']:+d} PD")
-
-print("\n" + "="*70)
-print("✅ COMPREHENSIVE STATS SAVED: elite16_comprehensive_nct_fbe_bhb.csv")
-print("="*70)
+
+    return stats
+
+
+def create_elite16_comprehensive(prelim_df=None, db=None, form_state=None, codes=TARGET_CODES):
+    """
+    Comprehensive stats DataFrame for the case-study teams
+
+    prelim_df, db (league_db connection) and form_state are loaded when
+    not passed, so a long-running process can hand in its warm copies.
+    """
+    target_teams = [team_name(code) for code in codes]
+    if prelim_df is None:
+        prelim_df = load_prelim_stats(target_teams)
+    if db is None:
+        db = open_database()
+    if form_state is None:
+        form_state, _ = refresh_form()
+
+    keys = case_study_keys()
+    rows = []
+    for team in target_teams:
+        # Elite 16 games: index seek on team code instead of a name scan
+        team_games = team_games_for(db, team_code(team), keys=keys)
+        rows.append(team_record(team, prelim_df, team_games, form_state))
+    return pd.DataFrame(rows)
+
+
+def save_elite16_comprehensive(df):
+    """Save to the store, then export the CSV for Sheets"""
+    write_dataset("elite16_comprehensive", df)
+    return export_csv("elite16_comprehensive")
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("ELITE 16 COMPREHENSIVE STATS - 3 TEAMS")
+    print("="*70)
+
+    df = create_elite16_comprehensive()
+    save_elite16_comprehensive(df)
+
+    print(f"\n✓ Created comprehensive stats for {len(df)} teams\n")
+    print(df[["Team", "Tier", "Prelim_GP", "Prelim_Wins", "Elite16_GP", "Elite16_Wins", "Total_GP", "Total_Wins", "Total_PPG"]].to_string(index=False))
+
+    print("\n" + "="*70)
+    print("DETAILED BREAKDOWN")
+    print("="*70)
+
+    for _, row in df.iterrows():
+        print(f"\n{row['Team']} ({row['Tier']}) - {row['Country']}")
+        print("-" * 60)
+        print(f"PRELIMINARY ROUND ({row['Prelim_Group']}):")
+        print(f"  Record: {row['Prelim_Wins']}-{row['Prelim_Losses']} in {row['Prelim_GP']} games")
+        print(f"  Scoring: {row['Prelim_PPG']} PPG | {row['Prelim_PD']:+d} PD")
+
+        print(f"\nELITE 16:")
+        print(f"  Record: {row['Elite16_Wins']}-{row['Elite16_Losses']} in {row['Elite16_GP']} games")
+        if row['Elite16_GP'] > 0:
+            print(f"  Scoring: {row['Elite16_PPG']} PPG | {row['Elite16_PD']:+d} PD")
+            print(f"  Games: {row['Elite16_Games']}")
+        else:
+            print(f"  Status: Games not yet started")
+
+        print(f"\nTOTAL ROAD TO BAL 2026:")
+        print(f"  Overall Record: {row['Total_Wins']}-{row['Total_Losses']} ({row['Total_Win_Pct']:.1%})")
+        print(f"  Total Games: {row['Total_GP']}")
+        print(f"  Average: {row['Total_PPG']} PPG | {row['Total_PD']:+d} PD")
+
+        print(f"\nRECENT FORM (last 5):")
+        print(f"  {row['Last5_Record']} | {row['Last5_PPG']} PPG | {row['Last5_OppPPG']} Opp PPG | "
+              f"{row['Last5_Margin']:+.1f} | Streak {row['Streak']}")
+
+    print("\n" + "="*70)
+    print("✅ COMPREHENSIVE STATS SAVED: elite16_comprehensive_nct_fbe_bhb.csv")
+    print("="*70)
@@ -4,19 +4,18 @@ plus targeted scraping for teams with confirmed BAL history
 """
 
 import pandas as pd
-import requests
-from bs4 import BeautifulSoup
-import time
 
-# Read existing qualification data
-print("="*70)
-print("CREATING COMPREHENSIVE TEAM PROFILES")
-print("="*70)
+from advanced_metrics import compute_all_metrics, format_key_stats
+from arrow_handoff import publish
+from head_to_head_index import refresh_head_to_head
+from schema_registry import read_table
+from team_registry import team_id
 
-# Load the qualification data we already have
-qual_data = pd.read_csv("bal_2026_qualification_data.csv")
-
-print(f"\n✓ Loaded {len(qual_data)} qualification records")
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+QUALIFICATION_FILE = "bal_2026_qualification_data.csv"
+OUTPUT_FILE = "comprehensive_team_profiles.csv"
 
 # Define comprehensive team profiles
 TEAM_PROFILES = {
@@ -27,7 +26,7 @@ TEAM_PROFILES = {
         "country": "Kenya",
         "bal_history": "2025 BAL (1-5 record, 79.0 PPG, 89.8 Opp PPG)",
         "qualifier_2026": "Elite 16 - Group A",
-        "key_stats": "ORtg: 97.0, DRtg: 110.3, Net: -13.3",
+        "key_stats": "ORtg: 93.3, DRtg: 106.1, Net: -12.8, Pace: 82.9",
         "top_players": "Iroegbu (14.0 PPG), Odero (14.0 PPG), Ongwae (11.5 PPG)",
         "strengths": "Rebounding (39.7 RPG), Assists (18.7 APG)",
         "weaknesses": "3PT% (28.2%), FT% (58.2%), Defense (89.8 Opp PPG)",
@@ -66,11 +65,13 @@ TEAM_PROFILES = {
         "country": "Mozambique",
         "bal_history": "2022 BAL, 2023 BAL (2x participant)",
         "qualifier_2026": "Elite 16 - Group B (4-1 in Group E)",
-        "group_e_stats": "W: 4, L: 1, PF: 432, PA: 378, PD: +54",
-        "h2h_results": "Beat Matero Magic 94-83",
+        "group_e_stats": "Elite 16: W: 1, L: 0, PF: 94, PA: 60, PD: +34 | Group E: W: 4, L: 1, PF: 432, PA: 378, PD: +54",
+        "h2h_results": "Beat Matero Magic 94-83 in Group E qualifiers",
         "2023_players": "Will Perry, Jermel Kennedy, Ayad Munguambe (leaders)",
-        "strengths": "BAL experience, high scoring (432 PF)",
-        "storyline": "Clear favorite - proven BAL pedigree"
+        "strengths": "BAL experience, high scoring (86.4 PPG in Group E), Elite 16 win vs Basket Hounds 94-60",
+        "weaknesses": "Lost to Giants 68-77 in Elite 16",
+        "x_factor": "Elite 16 momentum test",
+        "storyline": "Clear favorite - proven BAL pedigree with 2022 & 2023 main tournament experience"
     },
     
     "Matero Magic": {
@@ -107,103 +108,147 @@ TEAM_PROFILES = {
         "country": "Malawi",
         "bal_history": "Previous Elite 16 experience (struggled)",
         "qualifier_2026": "Elite 16 - Group B (2-3 in Group E)",
-        "group_e_stats": "W: 2, L: 3, PF: 346, PA: 354, PD: -8",
-        "h2h_history": "Lost to NCT 68-91 in previous qualifier",
+        "group_e_stats": "Elite 16: W: 0, L: 1, PF: 59, PA: 74, PD: -15 | Group E: W: 2, L: 3, PF: 346, PA: 354, PD: -8",
+        "h2h_history": "Lost to NCT 68-91 in previous qualifier, Lost to Matero Magic 59-74 in Elite 16",
         "domestic_success": "5x Malawian champions",
-        "weaknesses": "Negative point differential (-8), Elite 16 struggles",
-        "storyline": "Domestic dominance hasn't translated to continental success"
+        "strengths": "5x Malawian domestic champions, Elite 16 qualification",
+        "weaknesses": "Negative point differential, defensive struggles (70.8 PPG allowed in Group E), "
+                      "0-1 in Elite 16 (lost to Matero 59-74)",
+        "x_factor": "Continental breakthrough needed",
+        "storyline": "Domestic dominance hasn't translated to continental success - seeking first Elite 16 win"
     }
 }
 
-# Create comprehensive DataFrame
-teams_list = []
-for team_name, profile in TEAM_PROFILES.items():
-    teams_list.append({
-        "Team": team_name,
-        "Tier": profile["tier"],
-        "Group": profile["group"],
-        "Country": profile["country"],
-        "Narrative": profile["narrative"],
-        "BAL History": profile["bal_history"],
-        "2026 Qualifier Status": profile["qualifier_2026"],
-        "Key Stats": profile.get("group_e_stats", profile.get("key_stats", "N/A")),
-        "Top Players": profile.get("top_players", profile.get("2023_players", profile.get("key_players", "N/A"))),
-        "Strengths": profile.get("strengths", "N/A"),
-        "Weaknesses": profile.get("weaknesses", "N/A"),
-        "H2H Notes": profile.get("h2h_results", profile.get("h2h_history", profile.get("h2h_notes", "N/A"))),
-        "X-Factor": profile.get("x_factor", "N/A"),
-        "Storyline": profile["storyline"]
-    })
-
-df_profiles = pd.DataFrame(teams_list)
-
-# Save comprehensive profiles
-df_profiles.to_csv("comprehensive_team_profiles.csv", index=False)
-
-print("\n" + "="*70)
-print("COMPREHENSIVE TEAM PROFILES CREATED")
-print("="*70)
-print(f"\n✓ comprehensive_team_profiles.csv")
-print(f"  {len(df_profiles)} teams with full profiles\n")
-
-# Display summary
-print("TEAM BREAKDOWN:")
-print("-"*70)
-for _, row in df_profiles.iterrows():
-    print(f"\n{row['Team']} ({row['Tier']})")
-    print(f"  Group: {row['Group']}")
-    print(f"  BAL History: {row['BAL History']}")
-    print(f"  Storyline: {row['Storyline']}")
-
-# Create comparison matrix
-print("\n" + "="*70)
-print("HEAD-TO-HEAD & COMPARISON DATA")
-print("="*70)
-
-h2h_data = [
-    {"Team A": "Johannesburg Giants", "Team B": "Matero Magic", "Result": "Giants 84-62", "Margin": "+22", "Date": "Nov 1", "Significance": "Giants dominance"},
-    {"Team A": "Ferroviario Da Beira", "Team B": "Matero Magic", "Result": "Beira 94-83", "Margin": "+11", "Significance": "Beira experience edge"},
-    {"Team A": "Nairobi City Thunder", "Team B": "Bravehearts", "Result": "NCT 91-68", "Margin": "+23", "Date": "Previous qualifier", "Significance": "Historical matchup"},
-]
-
-df_h2h = pd.DataFrame(h2h_data)
-df_h2h.to_csv("head_to_head_results.csv", index=False)
-print("\n✓ head_to_head_results.csv")
-print(f"  {len(df_h2h)} documented H2H results\n")
-
-# Create tier rankings
-print("="*70)
-print("TIER ANALYSIS")
-print("="*70)
-
-tier_analysis = df_profiles.groupby('Tier').agg({
-    'Team': lambda x: ', '.join(x),
-    'Group': lambda x: list(x)
-}).reset_index()
-
-print("\nTier 1 (BAL Veterans):")
-tier1 = df_profiles[df_profiles['Tier'].str.contains('Tier 1')]
-for _, team in tier1.iterrows():
-    print(f"  • {team['Team']}: {team['BAL History']}")
-
-print("\nTier 2 (New Guard/Strong Contenders):")
-tier2 = df_profiles[df_profiles['Tier'].str.contains('Tier 2')]
-for _, team in tier2.iterrows():
-    print(f"  • {team['Team']}: {team['Storyline'][:50]}...")
-
-print("\nTier 3 (Underdogs/Dark Horses):")
-tier3 = df_profiles[df_profiles['Tier'].str.contains('Tier 3')]
-for _, team in tier3.iterrows():
-    print(f"  • {team['Team']}: {team['Storyline'][:50]}...")
-
-print("\n" + "="*70)
-print("ALL FILES READY FOR UPLOAD!")
-print("="*70)
-print("\nCreated files:")
-print("  1. comprehensive_team_profiles.csv - Full team profiles")
-print("  2. head_to_head_results.csv - H2H matchup data")
-print("\nCombine with existing:")
-print("  • bal_2026_qualification_data.csv")
-print("  • nct_2025_summary_clean.csv")
-print("  • nct_2025_player_stats_clean.csv")
-print("\nReady to upload all to Google Sheets!")
+# -----------------------------------------------------------------
+# BUILD FUNCTIONS
+# -----------------------------------------------------------------
+
+def recompute_key_stats(profiles, team_metrics=None):
+    """
+    Profiles with possession-based Key Stats from box scores (advanced_metrics.py)
+
+    team_metrics is compute_all_metrics()'s team table (computed if not
+    given). Returns updated copies and the (team, season) rows applied.
+    """
+    if team_metrics is None:
+        team_metrics, _ = compute_all_metrics()
+    profiles = {name: dict(profile) for name, profile in profiles.items()}
+    latest_metrics = team_metrics.drop_duplicates("Team", keep="last")
+    profile_keys = {team_id(name): name for name in profiles}
+    applied = []
+    for _, metrics in latest_metrics.iterrows():
+        profile_key = profile_keys.get(team_id(metrics["Team"]))
+        if profile_key is not None:
+            profiles[profile_key]["key_stats"] = format_key_stats(metrics)
+            applied.append((metrics["Team"], metrics["Season"]))
+    return profiles, applied
+
+
+def profiles_frame(profiles):
+    """One row per team in the upload column layout"""
+    teams_list = []
+    for team_name, profile in profiles.items():
+        teams_list.append({
+            "Team": team_name,
+            "Tier": profile["tier"],
+            "Group": profile["group"],
+            "Country": profile["country"],
+            "Narrative": profile["narrative"],
+            "BAL History": profile["bal_history"],
+            "2026 Qualifier Status": profile["qualifier_2026"],
+            "Key Stats": profile.get("group_e_stats", profile.get("key_stats", "N/A")),
+            "Top Players": profile.get("top_players", profile.get("2023_players", profile.get("key_players", "N/A"))),
+            "Strengths": profile.get("strengths", "N/A"),
+            "Weaknesses": profile.get("weaknesses", "N/A"),
+            "H2H Notes": profile.get("h2h_results", profile.get("h2h_history", profile.get("h2h_notes", "N/A"))),
+            "X-Factor": profile.get("x_factor", "N/A"),
+            "Storyline": profile["storyline"]
+        })
+    return pd.DataFrame(teams_list)
+
+
+def create_team_profiles(team_metrics=None, profiles=TEAM_PROFILES):
+    """Comprehensive profiles DataFrame (Key Stats recomputed from team_metrics)"""
+    profiles, _ = recompute_key_stats(profiles, team_metrics)
+    return profiles_frame(profiles)
+
+
+def save_team_profiles(df_profiles, output_file=OUTPUT_FILE):
+    """Publish the profiles CSV (and its Arrow hand-off); True if it changed"""
+    return publish(df_profiles, output_file)
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("="*70)
+    print("CREATING COMPREHENSIVE TEAM PROFILES")
+    print("="*70)
+
+    # Load the qualification data we already have
+    qual_data = read_table(QUALIFICATION_FILE)
+    print(f"\n✓ Loaded {len(qual_data)} qualification records")
+
+    profiles, applied = recompute_key_stats(TEAM_PROFILES)
+    for team, season in applied:
+        print(f"✓ Key Stats recomputed for {team} ({season})")
+
+    df_profiles = profiles_frame(profiles)
+    save_team_profiles(df_profiles)
+
+    print("\n" + "="*70)
+    print("COMPREHENSIVE TEAM PROFILES CREATED")
+    print("="*70)
+    print(f"\n✓ comprehensive_team_profiles.csv")
+    print(f"  {len(df_profiles)} teams with full profiles\n")
+
+    # Display summary
+    print("TEAM BREAKDOWN:")
+    print("-"*70)
+    for _, row in df_profiles.iterrows():
+        print(f"\n{row['Team']} ({row['Tier']})")
+        print(f"  Group: {row['Group']}")
+        print(f"  BAL History: {row['BAL History']}")
+        print(f"  Storyline: {row['Storyline']}")
+
+    # Create comparison matrix
+    print("\n" + "="*70)
+    print("HEAD-TO-HEAD & COMPARISON DATA")
+    print("="*70)
+
+    # Derived from every game record (see head_to_head_index.py)
+    df_h2h, new_games = refresh_head_to_head()
+    print(f"\n✓ head_to_head_results.csv ({new_games} new games indexed)")
+    print(f"  {len(df_h2h)} documented H2H results\n")
+
+    # Create tier rankings
+    print("="*70)
+    print("TIER ANALYSIS")
+    print("="*70)
+
+    print("\nTier 1 (BAL Veterans):")
+    tier1 = df_profiles[df_profiles['Tier'].str.contains('Tier 1')]
+    for _, team in tier1.iterrows():
+        print(f"  • {team['Team']}: {team['BAL History']}")
+
+    print("\nTier 2 (New Guard/Strong Contenders):")
+    tier2 = df_profiles[df_profiles['Tier'].str.contains('Tier 2')]
+    for _, team in tier2.iterrows():
+        print(f"  • {team['Team']}: {team['Storyline'][:50]}...")
+
+    print("\nTier 3 (Underdogs/Dark Horses):")
+    tier3 = df_profiles[df_profiles['Tier'].str.contains('Tier 3')]
+    for _, team in tier3.iterrows():
+        print(f"  • {team['Team']}: {team['Storyline'][:50]}...")
+
+    print("\n" + "="*70)
+    print("ALL FILES READY FOR UPLOAD!")
+    print("="*70)
+    print("\nCreated files:")
+    print("  1. comprehensive_team_profiles.csv - Full team profiles")
+    print("  2. head_to_head_results.csv - H2H matchup data")
+    print("\nCombine with existing:")
+    print("  • bal_2026_qualification_data.csv")
+    print("  • nct_2025_summary_clean.csv")
+    print("  • nct_2025_player_stats_clean.csv")
+    print("\nReady to upload all to Google Sheets!")
@@ -0,0 +1,433 @@
+"""
+Declarative data-quality validation across every team dataset
+Rules are data (column types, ranges, W+L=GP style identities, agreement
+between datasets and with the game lists); each rule runs as one vectorized
+pass over a whole dataset and the results roll up into a per-team report
+"""
+
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from game_results import load_game_results
+from parquet_store import DATASETS as STORE_DATASETS
+from schema_registry import column_types, na_values, write_table
+from team_registry import as_team_category
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+REPORT_FILE = "data_quality_report.csv"
+ISSUES_FILE = "data_quality_issues.csv"
+
+# Dataset -> CSV (Parquet store datasets name theirs there) and the team
+# column, or the one team a file covers. Types come from schema_registry.
+VALIDATION_DATASETS = {
+    "road_to_bal_summary": {"team_column": "Team"},
+    "qualification": {"team_column": "Team"},
+    "standings": {"team_column": "Team_Name"},
+    "elite16_comprehensive": {"team_column": "Team"},
+    "nct_player_stats": {"team": "Nairobi City Thunder"},
+    "case_study_games": {"team_column": "Team_A"},
+    "elite16_stats": {"csv_file": "elite16_nct_fbe_bhb_stats.csv", "team_column": "Team"},
+    "nct_summary": {"csv_file": "nct_2025_summary_clean.csv", "team_column": "Team"},
+}
+
+# check: range     - column within [min, max]
+#        sum       - columns add up to equals (within tolerance)
+#        diff      - columns[0] - columns[1] == equals
+#        ratio     - numerator / denominator == equals (rounded figures)
+#        not_above - column <= limit column (made <= attempted)
+#        agree     - same team's columns match in another dataset
+#        games     - PF/PA match the game lists when they hold every game
+# severity: error blocks uploads, warning is reported only
+RULES = [
+    # Road to BAL summary
+    {"dataset": "road_to_bal_summary", "check": "sum", "columns": ["Wins", "Losses"], "equals": "Games_Played"},
+    {"dataset": "road_to_bal_summary", "check": "diff", "columns": ["Points_For", "Points_Against"], "equals": "Point_Diff"},
+    {"dataset": "road_to_bal_summary", "check": "range", "column": "Win_Pct", "min": 0, "max": 1},
+    {"dataset": "road_to_bal_summary", "check": "ratio", "numerator": "Wins", "denominator": "Games_Played", "equals": "Win_Pct", "tolerance": 0.001},
+    {"dataset": "road_to_bal_summary", "check": "ratio", "numerator": "Points_For", "denominator": "Games_Played", "equals": "PPG", "tolerance": 0.05},
+    {"dataset": "road_to_bal_summary", "check": "ratio", "numerator": "Points_Against", "denominator": "Games_Played", "equals": "Opp_PPG", "tolerance": 0.05},
+    {"dataset": "road_to_bal_summary", "check": "games", "gp": "Games_Played", "pf": "Points_For", "pa": "Points_Against", "severity": "warning"},
+
+    # Qualification tables
+    {"dataset": "qualification", "check": "sum", "columns": ["Won", "Lost"], "equals": "Played"},
+    {"dataset": "qualification", "check": "diff", "columns": ["Points_For", "Points_Against"], "equals": "Point_Diff"},
+    {"dataset": "qualification", "check": "range", "column": "Played", "min": 0, "max": 20},
+    {"dataset": "qualification", "check": "agree", "other": "road_to_bal_summary",
+     "where": ("Stage", "Preliminary Groups"),
+     "columns": {"Played": "Games_Played", "Won": "Wins", "Lost": "Losses",
+                 "Points_For": "Points_For", "Points_Against": "Points_Against"}},
+
+    # Standings
+    {"dataset": "standings", "check": "diff", "columns": ["PF", "PA"], "equals": "PD"},
+    {"dataset": "standings", "check": "range", "column": "PTS", "min": 0, "max": 40},
+
+    # Elite 16 comprehensive
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Prelim_Wins", "Prelim_Losses"], "equals": "Prelim_GP"},
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Elite16_Wins", "Elite16_Losses"], "equals": "Elite16_GP"},
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Total_Wins", "Total_Losses"], "equals": "Total_GP"},
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Prelim_GP", "Elite16_GP"], "equals": "Total_GP"},
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Prelim_PF", "Elite16_PF"], "equals": "Total_PF"},
+    {"dataset": "elite16_comprehensive", "check": "sum", "columns": ["Prelim_PA", "Elite16_PA"], "equals": "Total_PA"},
+    {"dataset": "elite16_comprehensive", "check": "diff", "columns": ["Total_PF", "Total_PA"], "equals": "Total_PD"},
+    {"dataset": "elite16_comprehensive", "check": "range", "column": "Total_Win_Pct", "min": 0, "max": 1},
+    {"dataset": "elite16_comprehensive", "check": "agree", "other": "road_to_bal_summary",
+     "columns": {"Prelim_GP": "Games_Played", "Prelim_PF": "Points_For", "Prelim_PA": "Points_Against"},
+     "severity": "warning"},
+
+    # Elite 16 stats (3 teams)
+    {"dataset": "elite16_stats", "check": "sum", "columns": ["Wins", "Losses"], "equals": "Games_Played"},
+    {"dataset": "elite16_stats", "check": "diff", "columns": ["Points_For", "Points_Against"], "equals": "Point_Diff"},
+    {"dataset": "elite16_stats", "check": "range", "column": "Win_Pct", "min": 0, "max": 1},
+
+    # NCT season box scores
+    {"dataset": "nct_player_stats", "check": "range", "column": "2P%", "min": 0, "max": 100},
+    {"dataset": "nct_player_stats", "check": "range", "column": "3P%", "min": 0, "max": 100},
+    {"dataset": "nct_player_stats", "check": "range", "column": "FT%", "min": 0, "max": 100},
+    {"dataset": "nct_player_stats", "check": "range", "column": "MIN", "min": 0, "max": 50},
+    {"dataset": "nct_player_stats", "check": "not_above", "column": "2PM", "limit": "2PA"},
+    {"dataset": "nct_player_stats", "check": "not_above", "column": "3PM", "limit": "3PA"},
+    {"dataset": "nct_player_stats", "check": "not_above", "column": "FTM", "limit": "FTA"},
+    {"dataset": "nct_player_stats", "check": "sum", "columns": ["ORB", "DRB"], "equals": "REB", "tolerance": 0.15},
+    {"dataset": "nct_summary", "check": "range", "column": "FG%", "min": 0, "max": 100},
+    {"dataset": "nct_summary", "check": "range", "column": "3P%", "min": 0, "max": 100},
+    {"dataset": "nct_summary", "check": "range", "column": "FT%", "min": 0, "max": 100},
+
+    # Game lists
+    {"dataset": "case_study_games", "check": "range", "column": "Score_A", "min": 0, "max": 200},
+    {"dataset": "case_study_games", "check": "range", "column": "Score_B", "min": 0, "max": 200},
+]
+
+# Scrape coverage grading (scrape_open_source_teams): first matching grade wins
+COVERAGE_GRADES = [
+    ("Good", {"Sources_With_Data": 2, "Players_Found": 5}, "all"),
+    ("Fair", {"Sources_With_Data": 1, "Players_Found": 3}, "any"),
+]
+COVERAGE_RECOMMENDATIONS = [
+    ("poor", ["Manual data entry required",
+              "Contact {country} Basketball Federation",
+              "Check local news sites and sports media"]),
+    ("no_players", ["Search for team roster on social media",
+                    "Check recent game lineups"]),
+    ("no_stats", ["Manual stat tracking during live games",
+                  "Use Elite 16 official stats when available"]),
+]
+
+# -----------------------------------------------------------------
+# LOADING FUNCTIONS
+# -----------------------------------------------------------------
+
+def dataset_spec(name):
+    """Validation spec with csv_file, types and NA sentinels filled in"""
+    spec = dict(VALIDATION_DATASETS[name])
+    spec.setdefault("csv_file", STORE_DATASETS.get(name, {}).get("csv_file"))
+    spec["types"] = column_types(spec["csv_file"]) if spec["csv_file"] else {}
+    spec["na_values"] = na_values(spec["csv_file"]) if spec["csv_file"] else []
+    return spec
+
+
+def load_frames(names=None):
+    """{dataset: raw DataFrame (strings)} for every dataset whose CSV exists"""
+    frames = {}
+    for name in names or VALIDATION_DATASETS:
+        spec = dataset_spec(name)
+        if spec["csv_file"] and os.path.exists(spec["csv_file"]):
+            frames[name] = pd.read_csv(spec["csv_file"], dtype=str, keep_default_na=False)
+    return frames
+
+
+def typed_frame(raw, spec):
+    """Numeric columns coerced in one pass; returns (typed frame, type-failure mask per column)"""
+    columns = [c for c, kind in spec["types"].items() if c in raw.columns and kind in ("int", "float")]
+    text = raw[columns].to_numpy(dtype=str)
+    blank = np.isin(np.char.strip(text), spec["na_values"] + [""])
+    flat = pd.to_numeric(pd.Series(np.where(blank, "", text).ravel()), errors="coerce")
+    values = flat.to_numpy(dtype=float).reshape(text.shape)
+
+    failed = ~blank & np.isnan(values)
+    is_int = np.array([spec["types"][c] == "int" for c in columns], dtype=bool)
+    failed |= is_int & ~np.isnan(values) & (values % 1 != 0)
+
+    typed = raw.copy()
+    typed[columns] = values
+    failures = {c: failed[:, i] for i, c in enumerate(columns)}
+    return typed, failures
+
+
+def team_labels(frame, spec):
+    """Canonical team names for each row ('Unknown: <raw>' when the registry has no match)"""
+    if "team" in spec:
+        return pd.Series(spec["team"], index=frame.index)
+    raw = frame[spec["team_column"]]
+    canonical = as_team_category(raw, strict=False).astype(object)
+    return canonical.where(canonical.notna(), "Unknown: " + raw.astype(str))
+
+# -----------------------------------------------------------------
+# CHECK FUNCTIONS
+# -----------------------------------------------------------------
+# Each check returns (applicable mask, failed mask, describe) - describe()
+# builds the detail strings and is only called when something failed
+
+def _fmt(values):
+    """Numbers as short text for issue details (3.0 -> '3')"""
+    return values.map(lambda value: f"{value:g}" if isinstance(value, float) else str(value))
+
+
+def _close(left, right, tolerance):
+    return (left - right).abs() <= tolerance + 1e-9
+
+
+def _check_range(df, rule, context):
+    values = df[rule["column"]]
+    applicable = values.notna()
+    failed = applicable & ((values < rule["min"]) | (values > rule["max"]))
+    describe = lambda: rule["column"] + "=" + _fmt(values) + f" outside {rule['min']}-{rule['max']}"
+    return applicable, failed, describe
+
+
+def _check_sum(df, rule, context):
+    parts = df[rule["columns"]]
+    total = df[rule["equals"]]
+    applicable = parts.notna().all(axis=1) & total.notna()
+    computed = parts.sum(axis=1)
+    failed = applicable & ~_close(computed, total, rule.get("tolerance", 0))
+    describe = lambda: ("+".join(rule["columns"]) + "=" + _fmt(computed.round(2))
+                        + f" but {rule['equals']}=" + _fmt(total))
+    return applicable, failed, describe
+
+
+def _check_diff(df, rule, context):
+    first, second = rule["columns"]
+    total = df[rule["equals"]]
+    computed = df[first] - df[second]
+    applicable = computed.notna() & total.notna()
+    failed = applicable & ~_close(computed, total, rule.get("tolerance", 0))
+    describe = lambda: f"{first}-{second}=" + _fmt(computed) + f" but {rule['equals']}=" + _fmt(total)
+    return applicable, failed, describe
+
+
+def _check_ratio(df, rule, context):
+    denominator = df[rule["denominator"]]
+    expected = df[rule["equals"]]
+    applicable = (denominator > 0) & df[rule["numerator"]].notna() & expected.notna()
+    computed = df[rule["numerator"]] / denominator.where(denominator > 0)
+    failed = applicable & ~_close(computed, expected, rule.get("tolerance", 0))
+    describe = lambda: (f"{rule['numerator']}/{rule['denominator']}=" + _fmt(computed.round(3))
+                        + f" but {rule['equals']}=" + _fmt(expected))
+    return applicable, failed, describe
+
+
+def _check_not_above(df, rule, context):
+    values, limit = df[rule["column"]], df[rule["limit"]]
+    applicable = values.notna() & limit.notna()
+    failed = applicable & (values > limit)
+    describe = lambda: f"{rule['column']}=" + _fmt(values) + f" > {rule['limit']}=" + _fmt(limit)
+    return applicable, failed, describe
+
+
+def _check_agree(df, rule, context):
+    other = context["typed"].get(rule["other"])
+    if other is None:
+        empty = pd.Series(False, index=df.index)
+        return empty, empty, None
+    columns = rule["columns"]
+    right = other[list(columns.values())].copy()
+    right.columns = list(columns)
+    right.index = context["teams"][rule["other"]].values
+    right = right[~right.index.duplicated(keep="first")]
+
+    teams = context["teams"][rule["dataset"]]
+    matched = right.reindex(teams.values).set_axis(df.index)
+    applicable = teams.isin(right.index)
+    if "where" in rule:
+        column, value = rule["where"]
+        applicable &= context["raw"][rule["dataset"]][column] == value
+
+    left = df[list(columns)]
+    mismatch = (left != matched) & left.notna() & matched.notna()
+    failed = applicable & mismatch.any(axis=1)
+
+    def describe():
+        detail = pd.Series("", index=df.index)
+        for column, other_column in columns.items():
+            detail += np.where(mismatch[column],
+                               f"{column}=" + _fmt(left[column]) + f" vs {rule['other']}.{other_column}="
+                               + _fmt(matched[column]) + "; ", "")
+        return detail.str.rstrip("; ")
+    return applicable, failed, describe
+
+
+def game_list_totals(games):
+    """Per-team games, PF and PA from the game lists (both sides of every game)"""
+    sides = pd.concat([
+        pd.DataFrame({"Team": games["Team_A"].astype(str), "PF": games["Score_A"], "PA": games["Score_B"]}),
+        pd.DataFrame({"Team": games["Team_B"].astype(str), "PF": games["Score_B"], "PA": games["Score_A"]}),
+    ], ignore_index=True)
+    return sides.groupby("Team").agg(Listed=("PF", "size"), Listed_PF=("PF", "sum"), Listed_PA=("PA", "sum"))
+
+
+def _check_games(df, rule, context):
+    totals = context["game_totals"].reindex(context["teams"][rule["dataset"]].values).set_axis(df.index)
+    applicable = totals["Listed"] == df[rule["gp"]]
+    failed = applicable & ((totals["Listed_PF"] != df[rule["pf"]]) | (totals["Listed_PA"] != df[rule["pa"]]))
+    describe = lambda: (f"{rule['pf']}/{rule['pa']}=" + _fmt(df[rule["pf"]]) + "/" + _fmt(df[rule["pa"]])
+                        + " but game lists total " + _fmt(totals["Listed_PF"]) + "/" + _fmt(totals["Listed_PA"]))
+    return applicable.fillna(False), failed.fillna(False), describe
+
+
+CHECKS = {
+    "range": _check_range,
+    "sum": _check_sum,
+    "diff": _check_diff,
+    "ratio": _check_ratio,
+    "not_above": _check_not_above,
+    "agree": _check_agree,
+    "games": _check_games,
+}
+
+
+def _rule_name(rule):
+    target = rule.get("column") or rule.get("equals") or rule.get("other") or rule.get("pf")
+    return f"{rule['check']}:{target}"
+
+# -----------------------------------------------------------------
+# VALIDATION FUNCTIONS
+# -----------------------------------------------------------------
+
+def validate(names=None, rules=None, games=None):
+    """
+    Run every rule over every loaded dataset
+
+    Returns (issues, checks): one row per failed check, and the number of
+    checks run per dataset/team (the report denominator).
+    """
+    rules = rules if rules is not None else RULES
+    raw = load_frames(names)
+    context = {"raw": raw, "typed": {}, "teams": {}}
+    records, counted = [], []
+
+    def add_issues(name, teams, failed, rule, severity, describe):
+        if failed.any():
+            records.append(pd.DataFrame({"Dataset": name, "Team": teams[failed], "Rule": rule,
+                                         "Severity": severity, "Detail": describe()[failed]}))
+
+    for name, frame in raw.items():
+        spec = dataset_spec(name)
+        typed, type_failures = typed_frame(frame, spec)
+        teams = team_labels(frame, spec)
+        context["typed"][name] = typed
+        context["teams"][name] = teams
+
+        for _ in range(len(type_failures) + 1):
+            counted.append((name, teams.to_numpy()))
+        add_issues(name, teams, teams.str.startswith("Unknown: ").to_numpy(), "registry:team", "error",
+                   lambda: pd.Series("team not in team_registry", index=teams.index))
+        for column, failed in type_failures.items():
+            add_issues(name, teams, failed, f"type:{column}", "error",
+                       lambda: f"{column}='" + frame[column] + f"' is not {spec['types'][column]}")
+
+    if any(rule["check"] == "games" for rule in rules):
+        context["game_totals"] = game_list_totals(games if games is not None else load_game_results())
+
+    for rule in rules:
+        name = rule["dataset"]
+        if name not in raw:
+            continue
+        applicable, failed, describe = CHECKS[rule["check"]](context["typed"][name], rule, context)
+        teams = context["teams"][name]
+        counted.append((name, teams[applicable].to_numpy()))
+        add_issues(name, teams, failed.to_numpy(), _rule_name(rule), rule.get("severity", "error"), describe)
+
+    issues = (pd.concat(records, ignore_index=True) if records
+              else pd.DataFrame(columns=["Dataset", "Team", "Rule", "Severity", "Detail"]))
+    checks = pd.DataFrame({
+        "Dataset": np.concatenate([np.full(len(t), name, dtype=object) for name, t in counted]),
+        "Team": np.concatenate([t for _, t in counted]),
+    }).groupby(["Dataset", "Team"]).size().rename("Checks").reset_index()
+    return issues, checks
+
+
+def quality_report(issues, checks):
+    """Per-team checks, errors, warnings, pass rate and grade"""
+    report = checks.groupby("Team")["Checks"].sum().to_frame()
+    report["Datasets"] = checks.groupby("Team")["Dataset"].nunique()
+    severity = issues.groupby(["Team", "Severity"]).size().unstack(fill_value=0)
+    for level in ["error", "warning"]:
+        column = severity[level] if level in severity.columns else 0
+        report[level.title() + "s"] = pd.Series(column, index=severity.index).reindex(report.index, fill_value=0)
+    report["Pass_Rate"] = (1 - (report["Errors"] + report["Warnings"]) / report["Checks"]).clip(lower=0).round(3)
+    report["Data_Quality"] = np.select([report["Errors"] > 0, report["Warnings"] > 0], ["Poor", "Fair"], "Good")
+    return report.reset_index().sort_values(["Errors", "Warnings", "Team"], ascending=[False, False, True])
+
+
+def upload_errors(csv_file, issues=None):
+    """Error-level issues for the dataset behind one CSV (empty if it has no rules)"""
+    names = [name for name in VALIDATION_DATASETS if dataset_spec(name)["csv_file"] == csv_file]
+    if not names:
+        return pd.DataFrame(columns=["Dataset", "Team", "Rule", "Severity", "Detail"])
+    if issues is None:
+        issues, _ = validate()
+    return issues[issues["Dataset"].isin(names) & (issues["Severity"] == "error")]
+
+# -----------------------------------------------------------------
+# SCRAPE COVERAGE
+# -----------------------------------------------------------------
+
+def coverage_quality(summary):
+    """
+    Grade scraped-source coverage for a frame of teams
+
+    summary needs Sources_With_Data, Players_Found, Stats_Available and
+    Country; returns Data_Quality and a Recommendations list per row.
+    """
+    conditions = []
+    for _, minimums, mode in COVERAGE_GRADES:
+        met = pd.concat([summary[column] >= value for column, value in minimums.items()], axis=1)
+        conditions.append(met.all(axis=1) if mode == "all" else met.any(axis=1))
+    quality = pd.Series(np.select(conditions, [grade for grade, _, _ in COVERAGE_GRADES], "Poor"),
+                        index=summary.index)
+
+    flags = {
+        "poor": quality == "Poor",
+        "no_players": summary["Players_Found"] == 0,
+        "no_stats": ~summary["Stats_Available"].astype(bool),
+    }
+    recommendations = pd.Series([[] for _ in range(len(summary))], index=summary.index)
+    for flag, texts in COVERAGE_RECOMMENDATIONS:
+        for index in summary.index[flags[flag]]:
+            country = summary.at[index, "Country"]
+            recommendations[index] = recommendations[index] + [t.format(country=country) for t in texts]
+    return pd.DataFrame({"Data_Quality": quality, "Recommendations": recommendations})
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("DATA QUALITY VALIDATION")
+    print("=" * 70)
+
+    started = time.perf_counter()
+    all_issues, all_checks = validate()
+    df_report = quality_report(all_issues, all_checks)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n✓ {int(all_checks['Checks'].sum())} checks over "
+          f"{all_checks['Dataset'].nunique()} datasets in {elapsed * 1000:.0f} ms\n")
+    print(df_report.to_string(index=False))
+
+    if not all_issues.empty:
+        print("\nISSUES")
+        print("-" * 70)
+        for _, issue in all_issues.iterrows():
+            print(f"  [{issue['Severity']}] {issue['Dataset']} / {issue['Team']}: "
+                  f"{issue['Rule']} - {issue['Detail']}")
+
+    write_table(df_report, REPORT_FILE)
+    write_table(all_issues, ISSUES_FILE)
+    print(f"\n✓ Saved: {REPORT_FILE}, {ISSUES_FILE}")
+    sys.exit(1 if (all_issues["Severity"] == "error").any() else 0)
@@ -0,0 +1,75 @@
+"""
+Display formatting for numeric datasets
+CSVs store plain numbers; this renders "13-37", "46.6%" and "+65"
+only when a table is uploaded to Google Sheets or shown to the graphics team
+"""
+
+import pandas as pd
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+
+# (made, attempted, display column)
+MADE_ATTEMPTED_PAIRS = [
+    ("2PM", "2PA", "2PM-A"),
+    ("3PM", "3PA", "3PM-A"),
+    ("FTM", "FTA", "FTM-A"),
+]
+
+# Differentials shown with an explicit sign
+SIGNED_COLUMNS = {
+    "Point_Diff", "PD", "Prelim_PD", "Elite16_PD", "Total_PD", "Margin",
+    "Net", "Avg_Margin", "Spread_A", "Last3_Margin", "Last5_Margin",
+}
+
+# -----------------------------------------------------------------
+# FORMATTING FUNCTIONS
+# -----------------------------------------------------------------
+
+def _signed(value):
+    if pd.isna(value):
+        return ""
+    return f"{value:+g}" if value else "0"
+
+
+def _win_pct(value):
+    return "" if pd.isna(value) else f"{value:.3f}"
+
+
+def _percent(value):
+    return "" if pd.isna(value) else f"{value:.1f}%"
+
+
+def format_for_display(df):
+    """
+    Copy of df with display strings for splits, percentages and differentials
+
+    Columns come back as object dtype so nullable ints and categoricals
+    take fillna("") for the Sheets upload.
+    """
+    out = df.copy()
+
+    for made, attempted, label in MADE_ATTEMPTED_PAIRS:
+        if made in out.columns and attempted in out.columns:
+            position = out.columns.get_loc(made)
+            played = out[made].notna() & out[attempted].notna()
+            split = out[made].astype("Int64").astype(str) + "-" + out[attempted].astype("Int64").astype(str)
+            out = out.drop(columns=[made, attempted])
+            out.insert(position, label, split.where(played, ""))
+
+    for column in out.columns:
+        if column in SIGNED_COLUMNS and pd.api.types.is_numeric_dtype(out[column]):
+            out[column] = out[column].map(_signed)
+        elif column.endswith("Win_Pct") and pd.api.types.is_numeric_dtype(out[column]):
+            out[column] = out[column].map(_win_pct)
+        elif column.endswith("%") and pd.api.types.is_numeric_dtype(out[column]):
+            out[column] = out[column].map(_percent)
+
+    # Long Metric/Value tables (nct_2025_team_stats_clean.csv)
+    if {"Metric", "Value"}.issubset(out.columns):
+        is_pct = out["Metric"].astype(str).str.endswith("%")
+        values = pd.to_numeric(out["Value"], errors="coerce")
+        out["Value"] = out["Value"].astype(object).where(~is_pct, values.map(_percent))
+
+    return out.astype(object)
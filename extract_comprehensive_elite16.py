@@ -3,6 +3,14 @@ import re
 import pandas as pd
 from datetime import datetime
 
+from profiling import profiled
+from team_registry import CASE_STUDY_CODES, team_name
+
+# One game object in the standings script: id, team A code/name, team B
+# code/name, scores, group and scheduled tip-off (gameDateTime)
+GAME_PATTERN = r'\{\"gameId\":(\d+),.*?\"teamA\":\{.*?\"code\":\"([A-Z]+)\",\"officialName\":\"([^\"]+)\".*?\},\"teamB\":\{.*?\"code\":\"([A-Z]+)\",\"officialName\":\"([^\"]+)\".*?\},\"teamAScore\":(\d+),\"teamBScore\":(\d+).*?\"groupPairingCode\":\"([A-Z]?)\".*?\"gameDateTime\":\"([^\"]+)\"'
+
+@profiled("parse", rows="out")
 def extract_games_from_json(file_path='standings_script_105.js'):
     """Extract all game data from the JavaScript file"""
     
@@ -26,9 +34,7 @@ def extract_games_from_json(file_path='standings_script_105.js'):
         
         # Manual parsing since it's complex nested structure
         # Extract individual game objects
-        game_pattern = r'\{\"gameId\":(\d+),.*?\"teamA\":\{.*?\"code\":\"([A-Z]+)\",\"officialName\":\"([^\"]+)\".*?\},\"teamB\":\{.*?\"code\":\"([A-Z]+)\",\"officialName\":\"([^\"]+)\".*?\},\"teamAScore\":(\d+),\"teamBScore\":(\d+).*?\"groupPairingCode\":\"([A-Z]?)\".*?\"gameDateTime\":\"([^\"]+)\"'
-        
-        games = re.findall(game_pattern, content)
+        games = re.findall(GAME_PATTERN, content)
         
         print(f"\n✓ Found {len(games)} games")
         
@@ -134,17 +140,7 @@ def calculate_standings(games_df, case_study_teams):
     case_study_df = standings_df[standings_df['Team_Code'].isin(case_study_teams)].copy()
     
     # Add full names
-    team_names = {
-        'NCT': 'Nairobi City Thunder',
-        'NAM': 'Namuwongo Blazers',
-        'JOH': 'Johannesburg Giants',
-        'FBE': 'Ferroviario da Beira',
-        'MMA': 'Matero Magic',
-        'DAR': 'Dar City',
-        'BHB': 'Bravehearts'
-    }
-    
-    case_study_df['Team_Name'] = case_study_df['Team_Code'].map(team_names)
+    case_study_df['Team_Name'] = case_study_df['Team_Code'].map(team_name)
     
     return standings_df, case_study_df
 
@@ -179,7 +175,7 @@ def main():
     print("=" * 80)
     
     # Case study teams
-    case_study_teams = ['NCT', 'NAM', 'JOH', 'FBE', 'MMA', 'DAR', 'BHB']
+    case_study_teams = CASE_STUDY_CODES
     
     # Extract all games
     games_df = extract_games_from_json()
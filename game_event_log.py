@@ -0,0 +1,243 @@
+"""
+Append-only log of game facts with periodic compacted snapshots
+Every change to a game (scheduled, result posted, score corrected,
+details updated, retracted) is one
+JSON line; any past state is a snapshot plus the events after it, and
+incremental consumers tail the log from a saved byte offset
+"""
+
+import json
+import os
+from datetime import datetime
+import pandas as pd
+
+from game_results import GAME_COLUMNS, load_game_results, game_key
+from team_registry import resolve_ids, ids_to_category
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+LOG_FILE = "game_events.jsonl"
+SNAPSHOT_DIR = "game_event_snapshots"
+SNAPSHOT_EVERY = 50           # Events between compacted snapshots
+
+EVENT_TYPES = ["scheduled", "result_posted", "score_corrected", "details_updated", "result_retracted"]
+
+# -----------------------------------------------------------------
+# EVENT FUNCTIONS
+# -----------------------------------------------------------------
+
+def _game_record(game):
+    """One games-table row -> JSON-safe dict"""
+    record = {}
+    for column in GAME_COLUMNS:
+        value = game[column]
+        if column == "Date":
+            value = None if pd.isna(value) else value.strftime("%Y-%m-%d")
+        elif pd.isna(value):
+            value = None
+        elif hasattr(value, "item"):
+            value = value.item()
+        record[column] = value
+    return record
+
+
+def _is_played(record):
+    return (record["Score_A"] or 0) > 0 or (record["Score_B"] or 0) > 0
+
+
+def _scores(record):
+    """Team -> score, independent of which side a source listed first"""
+    return {record["Team_A"]: record["Score_A"], record["Team_B"]: record["Score_B"]}
+
+
+def read_events(offset=0, log_file=LOG_FILE):
+    """Events from a byte offset onwards; returns (events, new offset)"""
+    if not os.path.exists(log_file):
+        return [], offset
+    events = []
+    with open(log_file, "r", encoding="utf-8") as f:
+        f.seek(offset)
+        for line in iter(f.readline, ""):
+            if line.strip():
+                events.append(json.loads(line))
+        return events, f.tell()
+
+
+def last_seq(log_file=LOG_FILE):
+    """Sequence number of the last event (0 for an empty log)"""
+    snapshot = latest_snapshot(log_file=log_file)
+    events, _ = read_events(snapshot["offset"], log_file)
+    return events[-1]["seq"] if events else snapshot["seq"]
+
+
+def append_events(events, log_file=LOG_FILE):
+    """Append events (seq and timestamp assigned here); snapshot when due"""
+    if not events:
+        return []
+    seq = last_seq(log_file)
+    stamp = datetime.now().isoformat(timespec="seconds")
+    with open(log_file, "a", encoding="utf-8") as f:
+        for event in events:
+            seq += 1
+            event["seq"] = seq
+            event["recorded_at"] = stamp
+            f.write(json.dumps(event) + "\n")
+
+    if seq - latest_snapshot(log_file=log_file)["seq"] >= SNAPSHOT_EVERY:
+        write_snapshot(log_file=log_file)
+    return events
+
+
+def diff_events(state, games):
+    """
+    Events that take state to the scraped games table
+
+    A game whose key no longer appears in any source is retracted.
+    """
+    events = []
+    keys = game_key(games)
+    for key, (_, game) in zip(keys, games.iterrows()):
+        record = _game_record(game)
+        known = state.get(key)
+        if known is None:
+            kind = "result_posted" if _is_played(record) else "scheduled"
+        elif not _is_played(record):
+            continue
+        elif not _is_played(known):
+            kind = "result_posted"
+        elif _scores(known) != _scores(record):
+            kind = "score_corrected"
+        elif known != record:
+            kind = "details_updated"
+        else:
+            continue
+        events.append({"type": kind, "game_key": key, "game": record})
+
+    current = set(keys)
+    events += [{"type": "result_retracted", "game_key": key, "game": known}
+               for key, known in state.items() if key not in current]
+    return events
+
+
+def sync_from_sources(log_file=LOG_FILE):
+    """Compare the scraped game files with the log and append what changed"""
+    state = state_at(log_file=log_file)
+    return append_events(diff_events(state, load_game_results(include_unplayed=True)), log_file)
+
+# -----------------------------------------------------------------
+# SNAPSHOT / REPLAY FUNCTIONS
+# -----------------------------------------------------------------
+
+def apply_event(state, event):
+    """Fold one event into a {game_key: game record} state"""
+    if event["type"] == "result_retracted":
+        state.pop(event["game_key"], None)
+    else:
+        state[event["game_key"]] = event["game"]
+    return state
+
+
+def _snapshot_files(snapshot_dir=SNAPSHOT_DIR):
+    if not os.path.isdir(snapshot_dir):
+        return []
+    return sorted((int(name.split("_")[1].split(".")[0]), os.path.join(snapshot_dir, name))
+                  for name in os.listdir(snapshot_dir) if name.startswith("snapshot_"))
+
+
+def latest_snapshot(max_seq=None, log_file=LOG_FILE, snapshot_dir=SNAPSHOT_DIR):
+    """Newest snapshot at or before max_seq (empty state at offset 0 if none)"""
+    for seq, path in reversed(_snapshot_files(snapshot_dir)):
+        if max_seq is None or seq <= max_seq:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    return {"seq": 0, "offset": 0, "games": {}}
+
+
+def state_at(seq=None, log_file=LOG_FILE, snapshot_dir=SNAPSHOT_DIR):
+    """
+    Game state after event seq (latest if None)
+
+    Starts from the nearest snapshot, so the cost is the events since it.
+    """
+    snapshot = latest_snapshot(seq, log_file, snapshot_dir)
+    state = dict(snapshot["games"])
+    events, _ = read_events(snapshot["offset"], log_file)
+    for event in events:
+        if seq is not None and event["seq"] > seq:
+            break
+        apply_event(state, event)
+    return state
+
+
+def write_snapshot(log_file=LOG_FILE, snapshot_dir=SNAPSHOT_DIR):
+    """Compact the log up to its current end into a snapshot file"""
+    snapshot = latest_snapshot(log_file=log_file, snapshot_dir=snapshot_dir)
+    state = dict(snapshot["games"])
+    events, offset = read_events(snapshot["offset"], log_file)
+    for event in events:
+        apply_event(state, event)
+    seq = events[-1]["seq"] if events else snapshot["seq"]
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = os.path.join(snapshot_dir, f"snapshot_{seq:08d}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"seq": seq, "offset": offset, "games": state}, f)
+    return path
+
+
+def events_to_games(events):
+    """Event list -> standard games table (same columns and dtypes as load_game_results)"""
+    games = pd.DataFrame([event["game"] for event in events], columns=GAME_COLUMNS)
+    games["Date"] = pd.to_datetime(games["Date"], errors="coerce")
+    for side in ["A", "B"]:
+        ids = resolve_ids(games[f"Team_{side}"])
+        games[f"Team_{side}_ID"] = ids
+        games[f"Team_{side}"] = ids_to_category(ids)
+    return games
+
+
+def state_to_games(state, include_unplayed=False):
+    """{game_key: record} -> standard games table sorted like load_game_results"""
+    records = [r for r in state.values() if include_unplayed or _is_played(r)]
+    games = events_to_games([{"game": r} for r in records])
+    return games.sort_values(["Season", "Date"], kind="stable", na_position="first").reset_index(drop=True)
+
+
+def tail(offset, log_file=LOG_FILE):
+    """
+    New events for an incremental consumer
+
+    Returns (played games to fold in, changed game keys, new offset).
+    A game posted in the window comes back once with its latest score (or
+    not at all if it was retracted again); changed keys are games posted
+    before the window that were corrected or retracted, and a consumer
+    that already counted one must rebuild. details_updated events don't
+    touch scores, so they are skipped.
+    """
+    events, offset = read_events(offset, log_file)
+    posted, changed = {}, set()
+    for event in events:
+        key, kind = event["game_key"], event["type"]
+        if kind == "result_posted" or (kind == "score_corrected" and key in posted):
+            posted[key] = event
+        elif kind == "score_corrected":
+            changed.add(key)
+        elif kind == "result_retracted" and posted.pop(key, None) is None:
+            changed.add(key)
+    return events_to_games(list(posted.values())), changed, offset
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("GAME EVENT LOG")
+    print("=" * 70)
+
+    new_events = sync_from_sources()
+    counts = {kind: sum(e["type"] == kind for e in new_events) for kind in EVENT_TYPES}
+    print(f"\n✓ {len(new_events)} new events "
+          f"({', '.join(f'{n} {kind}' for kind, n in counts.items())})")
+    print(f"✓ Log at seq {last_seq()} - {len(state_at())} games known")
+    print(f"\n✓ Log: {LOG_FILE}")
@@ -0,0 +1,262 @@
+"""
+Game identity resolver across game files and scraped result text
+A game is keyed by its FIBA gameId when a source carries one, otherwise by
+(date, unordered teams, score); every mention is matched with hashed
+lookups in one pass, so duplicates merge in linear time and disagreeing
+sources are flagged instead of being counted twice
+"""
+
+import re
+import pandas as pd
+
+from schema_registry import read_table, write_table
+from team_registry import find_team, TEAMS_BY_ID
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+IDENTITY_FILE = "game_identities.csv"
+CONFLICT_FILE = "game_identity_conflicts.csv"
+
+# Columns every mention is reduced to before matching
+MENTION_COLUMNS = ["Source", "Kind", "Game_ID", "Date", "Team_A_ID", "Team_B_ID",
+                   "Score_A", "Score_B", "Text"]
+
+# Free-text result columns: the row's team scored the first number
+TEXT_SOURCES = [
+    {
+        "csv_file": "road_to_bal_2026_summary.csv",
+        "team_column": "Team",
+        "text_column": "Notable_Results"
+    },
+    {
+        "csv_file": "elite16_nct_fbe_bhb_stats.csv",
+        "team_column": "Team",
+        "text_column": "Notable_Games"
+    },
+]
+RESULT_PATTERN = re.compile(
+    r"(?:Beat|Lost to|win vs|loss to|vs)\s+(?P<opponent>[A-Z][\w' .-]*?)\s+"
+    r"(?:in Elite 16\s+)?\(?(?P<team_score>\d+)-(?P<opp_score>\d+)\)?"
+)
+
+PARTIAL_STATS_FILE = "partial_stats.csv"      # Stat "vs X", Value "77-68 W", Source "Nov 1 2025"
+HEAD_TO_HEAD_FILE = "head_to_head_results.csv"  # Result "Winner 91-68", Date "Oct 17 2025"
+TEXT_DATE_FORMAT = "%b %d %Y"
+
+# -----------------------------------------------------------------
+# MENTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def _mentions(rows, source, kind="mention"):
+    """List of dicts -> mention frame in MENTION_COLUMNS order"""
+    frame = pd.DataFrame(rows, columns=MENTION_COLUMNS[2:])
+    frame.insert(0, "Kind", kind)
+    frame.insert(0, "Source", source)
+    frame["Date"] = pd.to_datetime(frame["Date"], errors="coerce")
+    return frame
+
+
+def _text_date(values):
+    return pd.to_datetime(pd.Series(values, dtype="str"), format=TEXT_DATE_FORMAT, errors="coerce")
+
+
+def game_row_mentions(games):
+    """Standardised game-file rows (game_results) -> mentions that can create games"""
+    frame = pd.DataFrame({
+        "Source": games["Source"],
+        "Kind": "game",
+        "Game_ID": games["Game_ID"] if "Game_ID" in games.columns else pd.NA,
+        "Date": games["Date"],
+        "Team_A_ID": games["Team_A_ID"],
+        "Team_B_ID": games["Team_B_ID"],
+        "Score_A": games["Score_A"],
+        "Score_B": games["Score_B"],
+        "Text": "",
+    }, index=games.index)
+    return frame
+
+
+def text_mentions(spec):
+    """'Beat Djabal Club 102-50, Lost to Dar City 70-83' columns -> mentions"""
+    df = read_table(spec["csv_file"], columns=[spec["team_column"], spec["text_column"]])
+    rows = []
+    for team, text in zip(df[spec["team_column"]], df[spec["text_column"]].fillna("")):
+        for match in RESULT_PATTERN.finditer(text):
+            rows.append({"Game_ID": None, "Date": None,
+                         "Team_A_ID": find_team(team), "Team_B_ID": find_team(match["opponent"]),
+                         "Score_A": int(match["team_score"]), "Score_B": int(match["opp_score"]),
+                         "Text": match.group(0)})
+    return _mentions(rows, spec["csv_file"])
+
+
+def partial_stats_mentions(csv_file=PARTIAL_STATS_FILE):
+    """'vs X' rows with '77-68 W' values -> mentions (dated when Source is a date)"""
+    df = read_table(csv_file, columns=["Team", "Stat", "Value", "Source"])
+    scores = df["Value"].str.extract(r"^(\d+)-(\d+) [WL]$")
+    rows = df[df["Stat"].str.startswith("vs ") & scores[0].notna()]
+    dates = _text_date(rows["Source"]).to_numpy()
+    return _mentions([
+        {"Game_ID": None, "Date": date, "Team_A_ID": find_team(team), "Team_B_ID": find_team(stat[3:]),
+         "Score_A": int(scores.at[i, 0]), "Score_B": int(scores.at[i, 1]), "Text": f"{stat} {value}"}
+        for i, team, stat, value, date in zip(rows.index, rows["Team"], rows["Stat"], rows["Value"], dates)
+    ], csv_file)
+
+
+def head_to_head_mentions(csv_file=HEAD_TO_HEAD_FILE):
+    """Last-meeting results ('Dar City 102-50') -> mentions"""
+    df = read_table(csv_file, columns=["Team A", "Team B", "Result", "Date"])
+    parts = df["Result"].str.extract(r"^(?P<winner>.+) (?P<w>\d+)-(?P<l>\d+)$")
+    dates = _text_date(df["Date"]).to_numpy()
+    rows = []
+    for i, team_a, team_b, date in zip(df.index, df["Team A"], df["Team B"], dates):
+        if pd.isna(parts.at[i, "winner"]):
+            continue
+        winner = find_team(parts.at[i, "winner"])
+        loser = find_team(team_b) if winner == find_team(team_a) else find_team(team_a)
+        rows.append({"Game_ID": None, "Date": date, "Team_A_ID": winner, "Team_B_ID": loser,
+                     "Score_A": int(parts.at[i, "w"]), "Score_B": int(parts.at[i, "l"]),
+                     "Text": df.at[i, "Result"]})
+    return _mentions(rows, csv_file)
+
+
+def collect_mentions():
+    """Every game mention: game files first (they define games), then the text sources"""
+    from game_results import load_game_rows
+
+    frames = [game_row_mentions(load_game_rows())]
+    frames += [text_mentions(spec) for spec in TEXT_SOURCES]
+    frames += [partial_stats_mentions(), head_to_head_mentions()]
+    return pd.concat([f for f in frames if not f.empty], ignore_index=True)
+
+# -----------------------------------------------------------------
+# RESOLUTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def _describe(identity):
+    date, low, high, score_low, score_high = identity["key"]
+    return (f"{date or 'undated'} {TEAMS_BY_ID[low]['code']} {score_low}-{score_high} "
+            f"{TEAMS_BY_ID[high]['code']}")
+
+
+def resolve(mentions):
+    """
+    Assign every mention a game identity
+
+    Lookups, in order: FIBA gameId; exact (date, teams, score); same teams
+    and score where one side is undated; same date (or both undated) and
+    teams with another score - a conflict, still the same game. Only
+    "game" mentions may create a new identity; a text mention that matches
+    nothing is flagged.
+    Returns (identity per mention, identities table, conflicts table).
+    """
+    by_id, by_full, by_date_teams, by_teams_score = {}, {}, {}, {}
+    identities, assigned, conflicts = [], [], []
+
+    def flag(kind, row, identity, detail):
+        conflicts.append({"Conflict": kind, "Identity": identity, "Source": row.Source,
+                          "Text": row.Text, "Detail": detail})
+
+    def register(number, game_id, date, low, high, score):
+        if game_id is not None:
+            by_id.setdefault(game_id, number)
+        day = date or "undated"
+        by_full.setdefault((day, low, high) + score, number)
+        by_date_teams.setdefault((day, low, high), number)
+        by_teams_score.setdefault((low, high) + score, {})[number] = True  # ordered set
+
+    for row in mentions.itertuples(index=False):
+        if pd.isna(row.Team_A_ID) or pd.isna(row.Team_B_ID) or pd.isna(row.Score_A) or pd.isna(row.Score_B):
+            assigned.append(None)
+            flag("unresolved", row, None, "team or score not recognised")
+            continue
+
+        team_a, team_b = int(row.Team_A_ID), int(row.Team_B_ID)
+        low, high = min(team_a, team_b), max(team_a, team_b)
+        score = (int(row.Score_A), int(row.Score_B)) if team_a == low else (int(row.Score_B), int(row.Score_A))
+        date = None if pd.isna(row.Date) else row.Date.strftime("%Y-%m-%d")
+        game_id = None if pd.isna(row.Game_ID) else str(row.Game_ID)
+
+        day = date or "undated"
+        number = by_id.get(game_id) if game_id is not None else None
+        if number is not None and identities[number]["key"][3:] != score:
+            flag("score_mismatch", row, identities[number]["identity"],
+                 f"{score[0]}-{score[1]} vs {_describe(identities[number])}")
+        if number is None:
+            number = by_full.get((day, low, high) + score)
+        if number is None:
+            candidates = [n for n in by_teams_score.get((low, high) + score, {})
+                          if date is None or identities[n]["key"][0] is None]
+            if len(candidates) > 1:
+                flag("ambiguous", row, identities[candidates[0]]["identity"],
+                     f"matches {len(candidates)} games: " + ", ".join(_describe(identities[n]) for n in candidates))
+            number = candidates[0] if candidates else None
+        if number is None and (day, low, high) in by_date_teams:
+            number = by_date_teams[(day, low, high)]
+            flag("score_mismatch", row, identities[number]["identity"],
+                 f"{score[0]}-{score[1]} vs {_describe(identities[number])}")
+
+        if number is None:
+            if row.Kind != "game":
+                assigned.append(None)
+                flag("unmatched", row, None, f"no game {date or 'undated'} "
+                     f"{TEAMS_BY_ID[low]['code']} {score[0]}-{score[1]} {TEAMS_BY_ID[high]['code']}")
+                continue
+            number = len(identities)
+            identity = f"fiba:{game_id}" if game_id is not None else \
+                f"{date or 'undated'}|{TEAMS_BY_ID[low]['code']}|{TEAMS_BY_ID[high]['code']}|{score[0]}-{score[1]}"
+            identities.append({"identity": identity, "key": (date, low, high) + score,
+                               "game_id": game_id, "sources": []})
+        else:
+            # A dated or FIBA-keyed mention fills in what the identity lacked
+            entry = identities[number]
+            if entry["key"][0] is None and date is not None:
+                entry["key"] = (date,) + entry["key"][1:]
+            if entry["game_id"] is None and game_id is not None:
+                entry["game_id"] = game_id
+
+        register(number, game_id, identities[number]["key"][0], low, high, identities[number]["key"][3:])
+        identities[number]["sources"].append(row.Source)
+        assigned.append(identities[number]["identity"])
+
+    table = pd.DataFrame([{
+        "Identity": entry["identity"], "Game_ID": entry["game_id"], "Date": entry["key"][0],
+        "Team_Low": TEAMS_BY_ID[entry["key"][1]]["name"], "Team_High": TEAMS_BY_ID[entry["key"][2]]["name"],
+        "Score_Low": entry["key"][3], "Score_High": entry["key"][4],
+        "Mentions": len(entry["sources"]), "Sources": " | ".join(dict.fromkeys(entry["sources"]))
+    } for entry in identities])
+    conflicts = pd.DataFrame(conflicts, columns=["Conflict", "Identity", "Source", "Text", "Detail"])
+    return pd.Series(assigned, index=mentions.index, dtype="object"), table, conflicts
+
+
+def dedupe_games(games):
+    """Keep the first row of each game identity (standardised game-file rows)"""
+    if games.empty:
+        return games
+    identity, _, _ = resolve(game_row_mentions(games))
+    return games[~identity.duplicated(keep="first") | identity.isna()]
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("GAME IDENTITY RESOLUTION")
+    print("=" * 70)
+
+    all_mentions = collect_mentions()
+    _, df_identities, df_conflicts = resolve(all_mentions)
+
+    print(f"\n✓ {len(all_mentions)} mentions from {all_mentions['Source'].nunique()} sources "
+          f"-> {len(df_identities)} games\n")
+    print(df_identities.drop(columns=["Game_ID"]).to_string(index=False))
+
+    if not df_conflicts.empty:
+        print("\nCONFLICTS")
+        print("-" * 70)
+        for _, conflict in df_conflicts.iterrows():
+            print(f"  [{conflict['Conflict']}] {conflict['Source']}: '{conflict['Text']}' - {conflict['Detail']}")
+
+    write_table(df_identities, IDENTITY_FILE)
+    write_table(df_conflicts, CONFLICT_FILE)
+    print(f"\n✓ Saved: {IDENTITY_FILE}, {CONFLICT_FILE}")
@@ -0,0 +1,190 @@
+"""
+Load every scraped game result into one standard table
+Shared by the rating engine, head-to-head index and form trackers
+"""
+
+import os
+import pandas as pd
+
+from game_identity import dedupe_games
+from schema_registry import read_table
+from team_registry import resolve_ids, ids_to_category, ids_to_codes
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+
+# Standard columns for a single game, one row per game
+GAME_COLUMNS = [
+    "Date", "Competition", "Season", "Stage", "Group",
+    "Team_A_ID", "Team_A_Code", "Team_A", "Score_A",
+    "Team_B_ID", "Team_B_Code", "Team_B", "Score_B",
+    "Venue", "Source"
+]
+
+# Game files produced by the scrapers (missing files are skipped)
+GAME_SOURCES = [
+    {
+        "csv_file": "elite16_all_games.csv",
+        "competition": "Road to BAL",
+        "season": "2026",
+        "stage": "Elite 16",
+        "description": "All Road to BAL 2026 games (extract_comprehensive_elite16.py)"
+    },
+    {
+        "csv_file": "elite16_case_study_games_completed.csv",
+        "competition": "Road to BAL",
+        "season": "2026",
+        "stage": "Group Phase",
+        "description": "Completed case study games"
+    },
+    {
+        "csv_file": "team_games_history.csv",
+        "competition": "Road to BAL",
+        "season": "2026",
+        "stage": "Group Phase",
+        "description": "Per-team game cards (historical_team_scraper.py)"
+    },
+    {
+        "csv_file": "manual_game_results.csv",
+        "competition": "Road to BAL",
+        "season": "2026",
+        "stage": "",
+        "description": "Hand-entered results with no scraped source (undated; Round keeps "
+                       "the original date label, blank where none was recorded)"
+    }
+]
+
+# -----------------------------------------------------------------
+# LOADING FUNCTIONS
+# -----------------------------------------------------------------
+
+def _from_fixture_table(df, source):
+    """Standardise a Team_A/Team_B fixture table (elite16 game files)"""
+    games = pd.DataFrame({
+        "Date": pd.to_datetime(df["Date"], errors="coerce"),
+        "Competition": source["competition"],
+        "Season": df["Season"].fillna(source["season"]).astype(str) if "Season" in df.columns else source["season"],
+        "Stage": df["Round"].fillna(source["stage"]) if "Round" in df.columns else source["stage"],
+        "Group": df["Group"].fillna("N/A").astype(str) if "Group" in df.columns else "N/A",
+        "Team_A_Code": df.get("Team_A_Code", pd.Series("", index=df.index)),
+        "Team_A": df["Team_A"],
+        "Score_A": pd.to_numeric(df["Score_A"], errors="coerce"),
+        "Team_B_Code": df.get("Team_B_Code", pd.Series("", index=df.index)),
+        "Team_B": df["Team_B"],
+        "Score_B": pd.to_numeric(df["Score_B"], errors="coerce"),
+        "Venue": df["Venue"] if "Venue" in df.columns else "",
+        "Source": source["csv_file"],
+        "Game_ID": (pd.to_numeric(df["Game_ID"], errors="coerce").astype("Int64").astype("string")
+                    if "Game_ID" in df.columns else pd.NA)
+    })
+    return games
+
+
+def _from_team_cards(df, source):
+    """Standardise team/opponent/score rows from historical_team_scraper.py"""
+    scores = df["score"].astype(str).str.extract(r"(\d+)\s*-\s*(\d+)")
+    games = pd.DataFrame({
+        "Date": pd.to_datetime(df["date"], errors="coerce"),
+        "Competition": source["competition"],
+        "Season": source["season"],
+        "Stage": source["stage"],
+        "Group": "N/A",
+        "Team_A_Code": "",
+        "Team_A": df["team"],
+        "Score_A": pd.to_numeric(scores[0], errors="coerce"),
+        "Team_B_Code": "",
+        "Team_B": df["opponent"],
+        "Score_B": pd.to_numeric(scores[1], errors="coerce"),
+        "Venue": "",
+        "Source": source["csv_file"],
+        "Game_ID": pd.NA
+    })
+    return games
+
+
+def game_key(games):
+    """
+    Date + unordered team pair key (league_db and the game event log)
+
+    The score is left out, so editing a game's score keeps its key and the
+    event log records a score_corrected. Two undated meetings of a pair
+    can't both reach here: load_game_results merges them (game_identity
+    treats them as one game with conflicting scores).
+    """
+    team_a = games["Team_A"].astype(str)
+    team_b = games["Team_B"].astype(str)
+    first = team_a.where(team_a <= team_b, team_b)
+    second = team_b.where(team_a <= team_b, team_a)
+    return games["Date"].dt.strftime("%Y-%m-%d").fillna("TBD") + "|" + first + "|" + second
+
+
+def load_game_rows(sources=None):
+    """
+    Every game row from every game file, before dedupe
+
+    Standard GAME_COLUMNS plus the FIBA Game_ID where the file carries one;
+    team columns are registry IDs, codes and categorical canonical names.
+    """
+    sources = sources if sources is not None else GAME_SOURCES
+    frames = []
+
+    for source in sources:
+        if not os.path.exists(source["csv_file"]):
+            continue
+        df = read_table(source["csv_file"])
+        if df.empty:
+            continue
+        if "Team_A" in df.columns:
+            frames.append(_from_fixture_table(df, source))
+        elif {"team", "opponent", "score"}.issubset(df.columns):
+            frames.append(_from_team_cards(df, source))
+
+    if not frames:
+        return pd.DataFrame(columns=GAME_COLUMNS + ["Game_ID"])
+
+    games = pd.concat(frames, ignore_index=True)
+
+    # Every spelling/code resolved to one registry ID (unknown teams raise)
+    for side in ["A", "B"]:
+        ids = resolve_ids(games[f"Team_{side}"])
+        games[f"Team_{side}_ID"] = ids
+        games[f"Team_{side}_Code"] = ids_to_codes(ids)
+        games[f"Team_{side}"] = ids_to_category(ids)
+    return games[GAME_COLUMNS + ["Game_ID"]]
+
+
+def load_game_results(sources=None, include_unplayed=False):
+    """
+    Load all game files into one chronologically sorted DataFrame
+
+    Unplayed fixtures (0-0) are dropped unless include_unplayed is set.
+    The same game seen in several files is kept once (first source wins),
+    matched by game_identity on FIBA gameId or date, teams and score.
+    """
+    games = load_game_rows(sources)
+
+    played = (games["Score_A"].fillna(0) > 0) | (games["Score_B"].fillna(0) > 0)
+    if not include_unplayed:
+        games = games[played]
+
+    games = dedupe_games(games)[GAME_COLUMNS]
+    games = games.sort_values(["Season", "Date"], kind="stable", na_position="first")
+    return games.reset_index(drop=True)
+
+
+def load_team_countries(csv_file="bal_2026_qualification_data.csv"):
+    """Team -> country lookup from the qualification data"""
+    if not os.path.exists(csv_file):
+        return {}
+    qual = read_table(csv_file, columns=["Team", "Country"])
+    return qual.drop_duplicates("Team").set_index("Team")["Country"].to_dict()
+
+
+if __name__ == "__main__":
+    all_games = load_game_results()
+    print("=" * 70)
+    print("ALL GAME RESULTS")
+    print("=" * 70)
+    print(all_games.to_string(index=False))
+    print(f"\n✓ {len(all_games)} completed games loaded")
@@ -0,0 +1,193 @@
+"""
+Game-day daemon - poll FIBA tightly around tip-offs and final buzzers
+Reads each game's gameDateTime from standings_script_105.js, re-scrapes the
+standings and results pages every minute or so inside a game's live windows
+and only every few hours otherwise, and pushes new results through the
+standings, head-to-head and commentary card stages as soon as they land
+"""
+
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from artifact_manifest import file_hash
+from extract_comprehensive_elite16 import GAME_PATTERN
+from pipeline import DEFAULT_WORKERS, STAGES_BY_NAME, print_report, run
+from watch import changed_files, rebuild
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+SCHEDULE_FILE = "standings_script_105.js"
+
+# gameDateTime is venue-local with no offset; Elite 16 venues are on
+# Central/East Africa time, so UTC+2 errs towards polling early
+SCHEDULE_UTC_OFFSET = timedelta(hours=2)
+UNSCHEDULED = "0001-01-01T00:00:00"
+
+# Polling windows relative to tip-off (minutes) and the interval inside
+# them (seconds). The final-buzzer window runs long enough for overtime.
+POLL_WINDOWS = [
+    {"name": "tip-off", "start": -20, "end": 20, "interval": 60},
+    {"name": "in play", "start": 20, "end": 95, "interval": 300},
+    {"name": "final buzzer", "start": 95, "end": 180, "interval": 30},
+]
+IDLE_INTERVAL = 6 * 3600      # Outside every window (schedule changes, late results)
+
+# Scrape stages polled -> minimum seconds between runs (the results pages
+# are four requests, so they trail the single standings request)
+POLL_STAGES = {
+    "scrape_standings": 0,
+    "scrape_elite16_stats": 300,
+}
+
+# -----------------------------------------------------------------
+# SCHEDULE FUNCTIONS
+# -----------------------------------------------------------------
+
+def parse_tip_off(value, utc_offset=SCHEDULE_UTC_OFFSET):
+    """gameDateTime as an aware UTC datetime (None when the game is unscheduled)"""
+    if value.startswith(UNSCHEDULED[:10]):
+        return None
+    tip_off = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if tip_off.tzinfo is None:
+        tip_off = tip_off.replace(tzinfo=timezone(utc_offset))
+    return tip_off.astimezone(timezone.utc)
+
+
+def load_schedule(path=SCHEDULE_FILE):
+    """Games in the standings script: {game id: {teams, scores, tip-off}} ({} if not scraped yet)"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return {}
+    schedule = {}
+    for game_id, code_a, _, code_b, _, score_a, score_b, _, date in re.findall(GAME_PATTERN, content):
+        schedule[game_id] = {
+            "Team_A_Code": code_a, "Team_B_Code": code_b,
+            "Score_A": int(score_a), "Score_B": int(score_b),
+            "Tip_Off": parse_tip_off(date),
+        }
+    return schedule
+
+
+def new_results(before, after):
+    """Games whose score appeared or changed between two schedule loads"""
+    return [(game_id, game) for game_id, game in after.items()
+            if (game["Score_A"] or game["Score_B"])
+            and (game["Score_A"], game["Score_B"]) != (before.get(game_id, {}).get("Score_A"),
+                                                       before.get(game_id, {}).get("Score_B"))]
+
+
+def next_poll(schedule, now, windows=POLL_WINDOWS, idle=IDLE_INTERVAL):
+    """
+    Seconds until the next poll and why
+
+    Inside any game's window the shortest of their intervals wins;
+    otherwise sleep until the next window opens, capped at idle.
+    """
+    delay, reason = idle, "idle"
+    for game in schedule.values():
+        if game["Tip_Off"] is None:
+            continue
+        label = f"{game['Team_A_Code']} v {game['Team_B_Code']}"
+        for window in windows:
+            opens = game["Tip_Off"] + timedelta(minutes=window["start"])
+            closes = game["Tip_Off"] + timedelta(minutes=window["end"])
+            if opens <= now < closes:
+                wait = window["interval"]
+                why = f"{window['name']} {label}"
+            elif now < opens:
+                wait = (opens - now).total_seconds()
+                why = f"{window['name']} window opens for {label}"
+            else:
+                continue
+            if wait < delay:
+                delay, reason = wait, why
+    return max(delay, 1.0), reason
+
+
+def upcoming_windows(schedule, now, limit=5, windows=POLL_WINDOWS):
+    """The next few (opens, window name, game) not yet closed, soonest first"""
+    upcoming = []
+    for game in schedule.values():
+        if game["Tip_Off"] is None:
+            continue
+        for window in windows:
+            if game["Tip_Off"] + timedelta(minutes=window["end"]) > now:
+                upcoming.append((game["Tip_Off"] + timedelta(minutes=window["start"]), window["name"],
+                                 f"{game['Team_A_Code']} v {game['Team_B_Code']}"))
+    return sorted(upcoming)[:limit]
+
+# -----------------------------------------------------------------
+# POLLING FUNCTIONS
+# -----------------------------------------------------------------
+
+def poll(last_polled, workers=DEFAULT_WORKERS):
+    """Re-scrape the stages due under POLL_STAGES (updates last_polled); returns the outcomes"""
+    now = time.monotonic()
+    due = [name for name, spacing in POLL_STAGES.items()
+           if now - last_polled.get(name, float("-inf")) >= spacing]
+    started_at = time.perf_counter()
+    outcomes, timings = run(due, ["scrape"], force=True, workers=workers)
+    print_report(outcomes, timings, time.perf_counter() - started_at, workers)
+    for name in due:
+        last_polled[name] = now
+    return outcomes
+
+
+def gameday(offline=False, workers=DEFAULT_WORKERS, once=False):
+    """Poll on the schedule-driven interval and rebuild on new results (until Ctrl+C)"""
+    scraped = [path for name in POLL_STAGES for path in STAGES_BY_NAME[name]["outputs"]]
+    hashes = {path: file_hash(path) for path in scraped}
+    schedule = load_schedule()
+    last_polled = {}
+
+    now = datetime.now(timezone.utc)
+    print(f"{sum(game['Tip_Off'] is not None for game in schedule.values())} scheduled games"
+          + (" (offline: no uploads)" if offline else ""))
+    for opens, window, label in upcoming_windows(schedule, now):
+        print(f"  • {opens:%Y-%m-%d %H:%M} UTC  {window:<13} {label}")
+
+    try:
+        while True:
+            print(f"\n[{time.strftime('%H:%M:%S')}] Polling")
+            outcomes = poll(last_polled, workers)
+            if any(outcome == "failed" for outcome in outcomes.values()):
+                print("  ✗ Scrape failed - keeping the last results")
+
+            latest = load_schedule()
+            for _, game in new_results(schedule, latest):
+                print(f"  ✓ Result: {game['Team_A_Code']} {game['Score_A']}-{game['Score_B']} "
+                      f"{game['Team_B_Code']}")
+            schedule = latest
+
+            changed = changed_files(scraped, hashes)
+            if changed:
+                print(f"  Changed: {', '.join(changed)}")
+                rebuild(changed, offline, workers)
+            else:
+                print("  no new results")
+
+            if once:
+                break
+            delay, reason = next_poll(schedule, datetime.now(timezone.utc))
+            print(f"  next poll in {timedelta(seconds=round(delay))} ({reason})")
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        print("\n✓ Stopped game-day polling")
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("GAME-DAY POLLING")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    gameday(offline="--offline" in args,
+            workers=int(args[args.index("--workers") + 1]) if "--workers" in args else DEFAULT_WORKERS,
+            once="--once" in args)
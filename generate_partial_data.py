@@ -5,158 +5,192 @@ Combines game results, performance metrics, and known player information
 
 import pandas as pd
 
-print("\n" + "="*70)
-print("GENERATING PARTIAL ROSTERS AND STATS")
-print("="*70)
-
-# Load data
-rosters_df = pd.read_csv("partial_rosters.csv")
-stats_df = pd.read_csv("partial_stats.csv")
-games_df = pd.read_csv("elite16_case_study_games_completed.csv")
-summary_df = pd.read_csv("road_to_bal_2026_summary.csv")
-
-print("\n✓ Loaded data files")
-
-# Display rosters
-print("\n" + "="*70)
-print("PARTIAL ROSTERS")
-print("="*70)
-
-for team in rosters_df['Team'].unique():
-    team_roster = rosters_df[rosters_df['Team'] == team]
-    print(f"\n{team} ({len(team_roster)} players identified)")
-    print("-" * 60)
-    for _, player in team_roster.iterrows():
-        if player['Player_Name'] != 'Unknown Player 1' and 'Unknown' not in player['Player_Name']:
-            print(f"  ✓ {player['Player_Name']} - {player['Position']} ({player['Notes']})")
-        else:
-            print(f"  ? {player['Player_Name']} - {player['Position']} (TBD - {player['Data_Source']})")
-
-# Display stats
-print("\n" + "="*70)
-print("PARTIAL STATS SUMMARY")
-print("="*70)
-
-for team in stats_df['Team'].unique():
-    team_stats = stats_df[stats_df['Team'] == team]
-    print(f"\n{team}")
-    print("-" * 60)
-    
-    # Team stats
-    team_stat_rows = team_stats[team_stats['Category'] == 'Team Stats']
-    if len(team_stat_rows) > 0:
-        print("  TEAM STATISTICS:")
-        for _, stat in team_stat_rows.iterrows():
-            print(f"    {stat['Stat']}: {stat['Value']}")
-    
-    # Key performances
-    elite16_rows = team_stats[team_stats['Category'] == 'Elite 16']
-    if len(elite16_rows) > 0:
-        print("\n  ELITE 16 PERFORMANCES:")
-        for _, stat in elite16_rows.iterrows():
-            print(f"    {stat['Stat']}: {stat['Value']}")
-    
-    # Trends
-    trend_rows = team_stats[team_stats['Category'] == 'Trends']
-    if len(trend_rows) > 0:
-        print("\n  PERFORMANCE TRENDS:")
-        for _, stat in trend_rows.iterrows():
-            print(f"    {stat['Stat']}: {stat['Value']} - {stat['Notes']}")
-
-# Generate commentary cards
-print("\n" + "="*70)
-print("LIVE COMMENTARY CARDS")
-print("="*70)
-
-commentary_cards = []
-
-# Namuwongo Blazers card
-commentary_cards.append({
-    "Team": "Namuwongo Blazers",
-    "Quick Stats": "1-1 | 101.0 PPG | +61 PD",
-    "Star Fact": "Historic 132-58 blowout win - 74-point margin",
-    "Storyline": "The Kingslayers - First NBL Uganda title, ended 10-year dynasty",
-    "Key Matchup": "Offensive firepower vs defensive schemes",
-    "Watch For": "High-scoring guards, fast break opportunities",
-    "Roster Status": "5 players identified (numbers TBD during games)"
-})
-
-# Johannesburg Giants card
-commentary_cards.append({
-    "Team": "Johannesburg Giants",
-    "Quick Stats": "5-0 | 72.4 PPG | +82 PD | 56.0 Opp PPG",
-    "Star Fact": "Only undefeated team - perfect 5-0 record",
-    "Storyline": "The Undefeated - Dominant defense and consistency",
-    "Key Matchup": "Elite defense vs high-powered offenses",
-    "Watch For": "Defensive rotations, transition defense, paint protection",
-    "Roster Status": "5 players identified (numbers TBD during games)"
-})
-
-# Matero Magic card
-commentary_cards.append({
-    "Team": "Matero Magic",
-    "Quick Stats": "5-2 overall | 76.6 PPG | +103 PD (prelim)",
-    "Star Fact": "Home court advantage in Lusaka, 2-0 in Elite 16",
-    "Storyline": "The Road Warriors - Host team with mixed results vs elite",
-    "Key Matchup": "Closing gap vs Tier 1 teams (-11 to -22 margins)",
-    "Watch For": "Performance under pressure, clutch execution",
-    "Roster Status": "Full roster needed - observe during games"
-})
-
-# Dar City card
-commentary_cards.append({
-    "Team": "Dar City",
-    "Quick Stats": "2-0 | 92.5 PPG | +65 PD",
-    "Star Fact": "Solo Diabate - Former BAL champion brings experience",
-    "Storyline": "Star-Powered Unknown - Elite talent meets team chemistry",
-    "Key Matchup": "Star power (Diabate/Putney) vs team systems",
-    "Watch For": "Diabate's leadership, Putney's scoring, role player development",
-    "Roster Status": "2 confirmed (Diabate, Putney) + 3 TBD"
-})
-
-for card in commentary_cards:
-    print(f"\n{'='*60}")
-    print(f"{card['Team'].upper()}")
-    print(f"{'='*60}")
-    print(f"Stats:      {card['Quick Stats']}")
-    print(f"Star Fact:  {card['Star Fact']}")
-    print(f"Story:      {card['Storyline']}")
-    print(f"Matchup:    {card['Key Matchup']}")
-    print(f"Watch For:  {card['Watch For']}")
-    print(f"Roster:     {card['Roster Status']}")
-
-# Save commentary cards
-commentary_df = pd.DataFrame(commentary_cards)
-commentary_df.to_csv("live_commentary_cards.csv", index=False)
-print(f"\n✓ Saved commentary cards to: live_commentary_cards.csv")
-
-# Save all partial data summary
-print("\n" + "="*70)
-print("SUMMARY")
-print("="*70)
-print(f"\nRoster Status:")
-print(f"  Namuwongo Blazers:     5 players (0 confirmed, 5 TBD)")
-print(f"  Johannesburg Giants:   5 players (0 confirmed, 5 TBD)")
-print(f"  Matero Magic:          0 players (needs full observation)")
-print(f"  Dar City:              5 players (2 confirmed, 3 TBD)")
-
-print(f"\nStats Availability:")
-print(f"  Namuwongo Blazers:     8 team stats (Group D games)")
-print(f"  Johannesburg Giants:   8 team stats (Group E + Elite 16)")
-print(f"  Matero Magic:          12 detailed stats (most comprehensive)")
-print(f"  Dar City:              10 team stats + star player info")
-
-print("\n" + "="*70)
-print("FILES CREATED")
-print("="*70)
-print("  1. partial_rosters.csv - Player information")
-print("  2. partial_stats.csv - Detailed statistics")
-print("  3. live_commentary_cards.csv - Quick reference cards")
-
-print("\n" + "="*70)
-print("NEXT STEPS")
-print("="*70)
-print("""
+from parquet_store import read_dataset, write_dataset, export_csv
+from rolling_form import refresh_form, form_line
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+ROSTER_COLUMNS = ["Team", "Player_Name", "Position", "Notes", "Data_Source"]
+STATS_COLUMNS = ["Team", "Category", "Stat", "Value", "Notes"]
+
+# Hand-written cards; "Recent Form" is added from the rolling windows
+COMMENTARY_CARDS = [
+    {
+        "Team": "Namuwongo Blazers",
+        "Quick Stats": "1-1 | 101.0 PPG | +61 PD",
+        "Star Fact": "Historic 132-58 blowout win - 74-point margin",
+        "Storyline": "The Kingslayers - First NBL Uganda title, ended 10-year dynasty",
+        "Key Matchup": "Offensive firepower vs defensive schemes",
+        "Watch For": "High-scoring guards, fast break opportunities",
+        "Roster Status": "5 players identified (numbers TBD during games)"
+    },
+    {
+        "Team": "Johannesburg Giants",
+        "Quick Stats": "5-0 | 72.4 PPG | +82 PD | 56.0 Opp PPG",
+        "Star Fact": "Only undefeated team - perfect 5-0 record",
+        "Storyline": "The Undefeated - Dominant defense and consistency",
+        "Key Matchup": "Elite defense vs high-powered offenses",
+        "Watch For": "Defensive rotations, transition defense, paint protection",
+        "Roster Status": "5 players identified (numbers TBD during games)"
+    },
+    {
+        "Team": "Matero Magic",
+        "Quick Stats": "5-2 overall | 76.6 PPG | +103 PD (prelim)",
+        "Star Fact": "Home court advantage in Lusaka, 2-0 in Elite 16",
+        "Storyline": "The Road Warriors - Host team with mixed results vs elite",
+        "Key Matchup": "Closing gap vs Tier 1 teams (-11 to -22 margins)",
+        "Watch For": "Performance under pressure, clutch execution",
+        "Roster Status": "Full roster needed - observe during games"
+    },
+    {
+        "Team": "Dar City",
+        "Quick Stats": "2-0 | 92.5 PPG | +65 PD",
+        "Star Fact": "Solo Diabate - Former BAL champion brings experience",
+        "Storyline": "Star-Powered Unknown - Elite talent meets team chemistry",
+        "Key Matchup": "Star power (Diabate/Putney) vs team systems",
+        "Watch For": "Diabate's leadership, Putney's scoring, role player development",
+        "Roster Status": "2 confirmed (Diabate, Putney) + 3 TBD"
+    },
+]
+
+# Stat categories shown per team: (category, heading, show notes)
+STAT_SECTIONS = [
+    ("Team Stats", "TEAM STATISTICS", False),
+    ("Elite 16", "ELITE 16 PERFORMANCES", False),
+    ("Trends", "PERFORMANCE TRENDS", True),
+]
+
+# -----------------------------------------------------------------
+# BUILD FUNCTIONS
+# -----------------------------------------------------------------
+
+def load_partial_data():
+    """(rosters, stats) from the Parquet store (only the columns used here)"""
+    return (read_dataset("partial_rosters", columns=ROSTER_COLUMNS),
+            read_dataset("partial_stats", columns=STATS_COLUMNS))
+
+
+def build_commentary_cards(form_state=None):
+    """Commentary cards with each team's recent form (refreshes the form state if not given)"""
+    if form_state is None:
+        form_state, _ = refresh_form()
+    cards = [dict(card) for card in COMMENTARY_CARDS]
+    for card in cards:
+        card["Recent Form"] = form_line(form_state, card["Team"])
+    return pd.DataFrame(cards)
+
+
+def save_commentary_cards(cards):
+    """Write the cards to the store and export live_commentary_cards.csv"""
+    write_dataset("commentary_cards", cards)
+    return export_csv("commentary_cards")
+
+
+def generate_partial_data(form_state=None, save=True):
+    """(rosters, stats, commentary cards) as DataFrames; saves the cards unless save=False"""
+    rosters, stats = load_partial_data()
+    cards = build_commentary_cards(form_state)
+    if save:
+        save_commentary_cards(cards)
+    return rosters, stats, cards
+
+# -----------------------------------------------------------------
+# DISPLAY FUNCTIONS
+# -----------------------------------------------------------------
+
+def print_rosters(rosters_df):
+    for team in rosters_df['Team'].unique():
+        team_roster = rosters_df[rosters_df['Team'] == team]
+        print(f"\n{team} ({len(team_roster)} players identified)")
+        print("-" * 60)
+        for _, player in team_roster.iterrows():
+            if player['Player_Name'] != 'Unknown Player 1' and 'Unknown' not in player['Player_Name']:
+                print(f"  ✓ {player['Player_Name']} - {player['Position']} ({player['Notes']})")
+            else:
+                print(f"  ? {player['Player_Name']} - {player['Position']} (TBD - {player['Data_Source']})")
+
+
+def print_stats(stats_df):
+    for team in stats_df['Team'].unique():
+        team_stats = stats_df[stats_df['Team'] == team]
+        print(f"\n{team}")
+        print("-" * 60)
+        for i, (category, heading, show_notes) in enumerate(STAT_SECTIONS):
+            rows = team_stats[team_stats['Category'] == category]
+            if len(rows) > 0:
+                print(("\n" if i else "") + f"  {heading}:")
+                for _, stat in rows.iterrows():
+                    notes = f" - {stat['Notes']}" if show_notes else ""
+                    print(f"    {stat['Stat']}: {stat['Value']}{notes}")
+
+
+def print_cards(cards):
+    for _, card in cards.iterrows():
+        print(f"\n{'='*60}")
+        print(f"{card['Team'].upper()}")
+        print(f"{'='*60}")
+        print(f"Stats:      {card['Quick Stats']}")
+        print(f"Form:       {card['Recent Form']}")
+        print(f"Star Fact:  {card['Star Fact']}")
+        print(f"Story:      {card['Storyline']}")
+        print(f"Matchup:    {card['Key Matchup']}")
+        print(f"Watch For:  {card['Watch For']}")
+        print(f"Roster:     {card['Roster Status']}")
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("\n" + "="*70)
+    print("GENERATING PARTIAL ROSTERS AND STATS")
+    print("="*70)
+
+    rosters_df, stats_df, commentary_df = generate_partial_data()
+    print("\n✓ Loaded data files")
+
+    print("\n" + "="*70)
+    print("PARTIAL ROSTERS")
+    print("="*70)
+    print_rosters(rosters_df)
+
+    print("\n" + "="*70)
+    print("PARTIAL STATS SUMMARY")
+    print("="*70)
+    print_stats(stats_df)
+
+    print("\n" + "="*70)
+    print("LIVE COMMENTARY CARDS")
+    print("="*70)
+    print_cards(commentary_df)
+    print(f"\n✓ Saved commentary cards to: live_commentary_cards.csv")
+
+    print("\n" + "="*70)
+    print("SUMMARY")
+    print("="*70)
+    print(f"\nRoster Status:")
+    print(f"  Namuwongo Blazers:     5 players (0 confirmed, 5 TBD)")
+    print(f"  Johannesburg Giants:   5 players (0 confirmed, 5 TBD)")
+    print(f"  Matero Magic:          0 players (needs full observation)")
+    print(f"  Dar City:              5 players (2 confirmed, 3 TBD)")
+
+    print(f"\nStats Availability:")
+    print(f"  Namuwongo Blazers:     8 team stats (Group D games)")
+    print(f"  Johannesburg Giants:   8 team stats (Group E + Elite 16)")
+    print(f"  Matero Magic:          12 detailed stats (most comprehensive)")
+    print(f"  Dar City:              10 team stats + star player info")
+
+    print("\n" + "="*70)
+    print("FILES CREATED")
+    print("="*70)
+    print("  1. partial_rosters.csv - Player information")
+    print("  2. partial_stats.csv - Detailed statistics")
+    print("  3. live_commentary_cards.csv - Quick reference cards")
+
+    print("\n" + "="*70)
+    print("NEXT STEPS")
+    print("="*70)
+    print("""
 1. DURING GAMES:
    - Note jersey numbers for unnamed players
    - Identify top scorers, rebounders, assist leaders
@@ -180,4 +214,4 @@ print("""
    - Add performance notes
 """)
 
-print("\n✅ PARTIAL ROSTERS AND STATS GENERATED SUCCESSFULLY!")
+    print("\n✅ PARTIAL ROSTERS AND STATS GENERATED SUCCESSFULLY!")
@@ -0,0 +1,219 @@
+"""
+Head-to-head index derived from every game record we have
+One entry per unordered team pair that has actually met (sparse),
+stored in a dict for O(1) lookup and updated incrementally as games arrive
+"""
+
+import json
+import os
+import pandas as pd
+
+from game_event_log import sync_from_sources, tail, state_at, state_to_games
+from game_results import game_key
+from schema_registry import read_table, write_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+INDEX_FILE = "head_to_head_index.json"
+OUTPUT_FILE = "head_to_head_results.csv"
+
+# Columns kept from the original hand-maintained CSV come first
+OUTPUT_COLUMNS = [
+    "Team A", "Team B", "Result", "Margin", "Date", "Significance",
+    "Series", "Games", "Avg_Margin", "Biggest_Win", "Biggest_Win_Date"
+]
+
+# -----------------------------------------------------------------
+# INDEX FUNCTIONS
+# -----------------------------------------------------------------
+
+def pair_key(team_a, team_b):
+    """Unordered pair key - the same for (A, B) and (B, A)"""
+    first, second = sorted((team_a, team_b))
+    return f"{first}|{second}"
+
+
+def _display_date(date, stage):
+    """'Oct 18 2025' style date, or the stage name for undated games"""
+    if pd.isna(date):
+        return stage
+    return f"{date:%b} {date.day} {date.year}"
+
+
+def new_index():
+    """Empty index: pair entries, the game keys already counted and the log position"""
+    return {"pairs": {}, "seen": [], "log_offset": 0}
+
+
+def add_game(index, game, key, seen=None):
+    """Fold one game into its pair entry (skipped if key was already counted)"""
+    seen = seen if seen is not None else set(index["seen"])
+    if key in seen:
+        return False
+
+    team_1, team_2 = sorted((game["Team_A"], game["Team_B"]))
+    score_1, score_2 = ((game["Score_A"], game["Score_B"]) if team_1 == game["Team_A"]
+                        else (game["Score_B"], game["Score_A"]))
+    score_1, score_2 = int(score_1), int(score_2)
+    margin_1 = score_1 - score_2
+    date = _display_date(game["Date"], game["Stage"])
+    sort_date = "" if pd.isna(game["Date"]) else game["Date"].strftime("%Y-%m-%d")
+
+    entry = index["pairs"].setdefault(pair_key(team_1, team_2), {
+        "team_1": team_1, "team_2": team_2,
+        "wins_1": 0, "wins_2": 0, "games": 0, "margin_sum_1": 0,
+        "last_meeting": None, "biggest_win": None
+    })
+    entry["games"] += 1
+    entry["margin_sum_1"] += margin_1
+    if margin_1 > 0:
+        entry["wins_1"] += 1
+    elif margin_1 < 0:
+        entry["wins_2"] += 1
+
+    winner, loser = (team_1, team_2) if margin_1 >= 0 else (team_2, team_1)
+    meeting = {
+        "winner": winner, "loser": loser,
+        "score": f"{max(score_1, score_2)}-{min(score_1, score_2)}",
+        "margin": abs(margin_1), "date": date, "sort_date": sort_date
+    }
+    last = entry["last_meeting"]
+    if last is None or sort_date >= last["sort_date"]:
+        entry["last_meeting"] = meeting
+    biggest = entry["biggest_win"]
+    if biggest is None or meeting["margin"] > biggest["margin"]:
+        entry["biggest_win"] = meeting
+
+    seen.add(key)
+    index["seen"].append(key)
+    return True
+
+
+def update_index(index, games):
+    """
+    Add only games not yet counted; returns the number of new games
+
+    Score corrections or retractions of an already-counted game need a
+    rebuild (build_index); refresh_head_to_head does this when the event
+    log reports one.
+    """
+    seen = set(index["seen"])
+    keys = game_key(games)
+    added = 0
+    for key, (_, game) in zip(keys, games.iterrows()):
+        added += add_game(index, game, key, seen)
+    return added
+
+
+def build_index(games):
+    """Build a fresh index over a games table"""
+    index = new_index()
+    update_index(index, games)
+    return index
+
+
+def lookup(index, team_a, team_b):
+    """Pair entry for two teams in either order, or None if they never met"""
+    return index["pairs"].get(pair_key(team_a, team_b))
+
+
+def load_index(path=INDEX_FILE):
+    """Load the persisted index (empty if none saved yet)"""
+    if not os.path.exists(path):
+        return new_index()
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_index(index, path=INDEX_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+# -----------------------------------------------------------------
+# OUTPUT FUNCTIONS
+# -----------------------------------------------------------------
+
+def load_significance(path=OUTPUT_FILE):
+    """Hand-written Significance notes from the current CSV, keyed by pair"""
+    if not os.path.exists(path):
+        return {}
+    old = read_table(path).fillna("")
+    if "Significance" not in old.columns:
+        return {}
+    return {pair_key(a, b): note for a, b, note in zip(old["Team A"], old["Team B"], old["Significance"])}
+
+
+def to_dataframe(index, significance=None):
+    """One row per pair, series leader listed as Team A"""
+    significance = significance or {}
+    rows = []
+    for key, entry in index["pairs"].items():
+        last, biggest = entry["last_meeting"], entry["biggest_win"]
+        leader_is_1 = (entry["wins_1"] > entry["wins_2"] or
+                       (entry["wins_1"] == entry["wins_2"] and last["winner"] == entry["team_1"]))
+        team_a, team_b = ((entry["team_1"], entry["team_2"]) if leader_is_1
+                          else (entry["team_2"], entry["team_1"]))
+        wins_a, wins_b = ((entry["wins_1"], entry["wins_2"]) if leader_is_1
+                          else (entry["wins_2"], entry["wins_1"]))
+        avg_margin_a = entry["margin_sum_1"] / entry["games"] * (1 if leader_is_1 else -1)
+        last_margin_a = last["margin"] if last["winner"] == team_a else -last["margin"]
+
+        rows.append({
+            "Team A": team_a,
+            "Team B": team_b,
+            "Result": f"{last['winner']} {last['score']}",
+            "Margin": last_margin_a,
+            "Date": last["date"],
+            "Significance": significance.get(key, ""),
+            "Series": f"{wins_a}-{wins_b}",
+            "Games": entry["games"],
+            "Avg_Margin": round(avg_margin_a, 1),
+            "Biggest_Win": f"{biggest['winner']} {biggest['score']} (+{biggest['margin']})",
+            "Biggest_Win_Date": biggest["date"],
+            "_sort": last["sort_date"]
+        })
+
+    if not rows:
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+    df = pd.DataFrame(rows).sort_values("_sort", kind="stable")
+    return df[OUTPUT_COLUMNS].reset_index(drop=True)
+
+
+def refresh_head_to_head(output_file=OUTPUT_FILE, index_file=INDEX_FILE):
+    """
+    Tail the game event log into the saved index and regenerate the CSV
+
+    A score correction or retraction of an already-counted game triggers
+    a rebuild from the current log state.
+    """
+    index = load_index(index_file)
+    sync_from_sources()
+    games, changed, offset = tail(index.get("log_offset", 0))
+    if changed & set(index["seen"]):
+        counted = len(index["seen"])
+        index = build_index(state_to_games(state_at()))
+        added = len(index["seen"]) - counted
+    else:
+        added = update_index(index, games)
+    index["log_offset"] = offset
+    save_index(index, index_file)
+
+    df = to_dataframe(index, load_significance(output_file))
+    write_table(df, output_file)
+    return df, added
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("HEAD-TO-HEAD INDEX")
+    print("=" * 70)
+
+    df_h2h, new_games = refresh_head_to_head()
+
+    print(f"\n✓ {new_games} new games indexed")
+    print(f"✓ {len(df_h2h)} team pairs with at least one meeting\n")
+    print(df_h2h.to_string(index=False))
+    print(f"\n✓ Saved: {OUTPUT_FILE}")
@@ -3,12 +3,16 @@ Scrape historical BAL and Road to BAL data for specific teams
 Focuses on the 7 teams in Groups A & B with their performance metrics
 """
 
-import requests
 import pandas as pd
 from bs4 import BeautifulSoup
+import sys
 import time
 import json
 
+from provenance import fetch, record_fields
+from scrape_checkpoints import checkpoint, finish_run, resume_run
+from team_registry import team_name
+
 # -----------------------------------------------------------------
 # 1. CONFIGURATION
 # -----------------------------------------------------------------
@@ -18,38 +22,38 @@ BASE_URL = "https://www.fiba.basketball"
 TARGET_TEAMS = {
     # Group A
     "nairobi-city-thunder": {
-        "name": "Nairobi City Thunder",
+        "name": team_name("nairobi-city-thunder"),
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Hosts - 2025 BAL debutants"
     },
     "namuwongo-blazers": {
-        "name": "Namuwongo Blazers",
+        "name": team_name("namuwongo-blazers"),
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Kingslayers - First Ugandan NBL title"
     },
     "johannesburg-giants": {
-        "name": "Johannesburg Giants",
+        "name": team_name("johannesburg-giants"),
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Undefeated - Perfect 5-0 in qualifiers"
     },
     # Group B
     "ferroviario-da-beira": {
-        "name": "Ferroviario Da Beira",
+        "name": team_name("ferroviario-da-beira"),
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Juggernaut - 2x BAL main tournament (2022, 2023)"
     },
     "matero-magic": {
-        "name": "Matero Magic",
+        "name": team_name("matero-magic"),
         "tier": "Tier 2",
         "narrative": "The Road Warriors - Zambian champions"
     },
     "dar-city": {
-        "name": "Dar City",
+        "name": team_name("dar-city"),
         "tier": "Tier 3 (Dark Horse)",
         "narrative": "Star-Powered Unknown with elite talent"
     },
     "bravehearts-basketball-club": {
-        "name": "Bravehearts Basketball Club",
+        "name": team_name("bravehearts-basketball-club"),
         "tier": "Tier 3",
         "narrative": "The Underdogs - 5x Malawian champions"
     }
@@ -76,6 +80,11 @@ ROAD_TO_BAL_EVENTS = [
 ]
 
 OUTPUT_FILE = "historical_teams_data.csv"
+PROVENANCE_SOURCE = "fiba_team_history"
+CHECKPOINT_NAME = "historical_team_scraper"
+
+# Discard checkpoints from an interrupted run and scrape every team again
+RESTART = "--restart" in sys.argv
 
 # -----------------------------------------------------------------
 # 2. SCRAPING FUNCTIONS
@@ -84,11 +93,7 @@ OUTPUT_FILE = "historical_teams_data.csv"
 def get_page(url):
     """Fetch page with error handling"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = fetch(url, PROVENANCE_SOURCE, timeout=10)
         return BeautifulSoup(response.text, "html.parser")
     except Exception as e:
         print(f"Error fetching {url}: {e}")
@@ -223,17 +228,34 @@ def scrape_road_to_bal_history(team_slug):
     time.sleep(1)  # Rate limiting
     return rtb_appearances
 
-def scrape_all_teams():
-    """Main scraper for all target teams"""
+def scrape_all_teams(restart=RESTART):
+    """
+    Main scraper for all target teams
+
+    Each team is checkpointed as it finishes; teams finished by an
+    interrupted run are reloaded instead of scraped again.
+    """
     all_data = []
     all_appearances = []
     all_games = []
+    done = resume_run(CHECKPOINT_NAME, restart)
     
     print("="*60)
     print("SCRAPING HISTORICAL DATA FOR 7 TARGET TEAMS")
     print("="*60)
+    if done:
+        print(f"Resuming: {len(done)} of {len(TARGET_TEAMS)} teams already checkpointed")
     
-    for team_slug, team_info in TARGET_TEAMS.items():
+    for position, (team_slug, team_info) in enumerate(TARGET_TEAMS.items()):
+        if team_slug in done:
+            unit = done[team_slug]
+            print(f"\n✓ {team_info['name']} - from checkpoint")
+            if unit["profile"]:
+                all_data.append(unit["profile"])
+            all_appearances.extend(unit["appearances"])
+            all_games.extend(unit["games"])
+            continue
+        
         print(f"\n{'='*60}")
         print(f"Processing: {team_info['name']} ({team_info['tier']})")
         print(f"{'='*60}")
@@ -255,10 +277,19 @@ def scrape_all_teams():
         games = scrape_team_games(team_slug, ROAD_TO_BAL_EVENTS[0])
         all_games.extend(games)
         
+        checkpoint(CHECKPOINT_NAME, team_slug, {
+            "profile": profile_data, "appearances": bal_history + rtb_history, "games": games
+        }, position)
+        
         time.sleep(2)  # Rate limiting between teams
     
     return all_data, all_appearances, all_games
 
+def appearance_pages(df_appearances):
+    """Page each appearance was found on (Road to BAL rows come from the event's teams page)"""
+    urls = df_appearances["url"]
+    return urls.where(df_appearances["tournament"] == "BAL Main", urls + "/teams")
+
 # -----------------------------------------------------------------
 # 3. EXECUTION
 # -----------------------------------------------------------------
@@ -277,20 +308,26 @@ if __name__ == "__main__":
     if teams_data:
         df_teams = pd.DataFrame(teams_data)
         df_teams.to_csv("teams_overview.csv", index=False)
+        record_fields(df_teams, "teams_overview.csv", PROVENANCE_SOURCE, url=df_teams["profile_url"])
         print(f"\n✓ Teams Overview: teams_overview.csv ({len(df_teams)} teams)")
     
     # Save tournament appearances
     if appearances:
         df_appearances = pd.DataFrame(appearances)
         df_appearances.to_csv("tournament_appearances.csv", index=False)
+        record_fields(df_appearances, "tournament_appearances.csv", PROVENANCE_SOURCE,
+                      url=appearance_pages(df_appearances))
         print(f"✓ Tournament Appearances: tournament_appearances.csv ({len(df_appearances)} records)")
     
     # Save games data
     if games:
         df_games = pd.DataFrame(games)
         df_games.to_csv("team_games_history.csv", index=False)
+        record_fields(df_games, "team_games_history.csv", PROVENANCE_SOURCE, url=df_games["event_url"] + "/games")
         print(f"✓ Games History: team_games_history.csv ({len(df_games)} games)")
     
+    finish_run(CHECKPOINT_NAME)
+    
     # Create summary report
     print("\n" + "="*60)
     print("SUMMARY BY TEAM")
@@ -0,0 +1,324 @@
+"""
+SQLite league database - one consistent store for teams, games,
+player stats, standings snapshots and commentary notes
+Indexed on team code, game date and group so lookups are index seeks;
+WAL mode lets several scripts read while one writes
+"""
+
+import os
+import sqlite3
+from datetime import date
+import pandas as pd
+
+from game_results import load_game_results, game_key
+from schema_registry import read_table
+from team_registry import registry_frame, resolve_ids, team_code as registry_code
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+DB_FILE = "road_to_bal.db"
+
+TEAM_SOURCES = {
+    "standings": "elite16_case_study_standings_current.csv",
+    "qualification": "bal_2026_qualification_data.csv",
+}
+
+# Player box files: team code + season each file covers
+PLAYER_STAT_SOURCES = [
+    {"csv_file": "nct_2025_player_stats_clean.csv", "team_code": "NCT", "season": "2025"},
+]
+
+COMMENTARY_SOURCE = "live_commentary_cards.csv"
+COMMENTARY_CATEGORIES = ["Quick Stats", "Star Fact", "Storyline", "Key Matchup",
+                         "Watch For", "Roster Status", "Recent Form"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    team_code TEXT PRIMARY KEY,
+    team_id   INTEGER NOT NULL UNIQUE,  -- team_registry.py ID
+    name      TEXT NOT NULL UNIQUE,
+    country   TEXT,
+    tier      TEXT
+);
+
+CREATE TABLE IF NOT EXISTS games (
+    game_id     INTEGER PRIMARY KEY,
+    game_key    TEXT NOT NULL UNIQUE,  -- game_results.game_key (date|team|team, TBD when undated)
+    game_date   TEXT,
+    competition TEXT,
+    season      TEXT,
+    stage       TEXT,
+    grp         TEXT,
+    team_a_code TEXT REFERENCES teams(team_code),
+    team_a      TEXT,
+    score_a     INTEGER,
+    team_b_code TEXT REFERENCES teams(team_code),
+    team_b      TEXT,
+    score_b     INTEGER,
+    venue       TEXT,
+    source      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_games_team_a ON games(team_a_code, stage);
+CREATE INDEX IF NOT EXISTS idx_games_team_b ON games(team_b_code, stage);
+CREATE INDEX IF NOT EXISTS idx_games_date   ON games(game_date);
+CREATE INDEX IF NOT EXISTS idx_games_group  ON games(grp);
+
+-- game_id is NULL for season-aggregate rows (per-game box scores not published)
+CREATE TABLE IF NOT EXISTS player_game_stats (
+    game_id   INTEGER REFERENCES games(game_id),
+    team_code TEXT REFERENCES teams(team_code),
+    season    TEXT,
+    player    TEXT NOT NULL,
+    jersey    INTEGER,
+    games     INTEGER,
+    minutes   REAL,
+    fg2m INTEGER, fg2a INTEGER, fg3m INTEGER, fg3a INTEGER, ftm INTEGER, fta INTEGER,
+    orb REAL, drb REAL, ast REAL, stl REAL, blk REAL, tov REAL, pts REAL
+);
+CREATE INDEX IF NOT EXISTS idx_player_stats_team ON player_game_stats(team_code, season);
+CREATE INDEX IF NOT EXISTS idx_player_stats_game ON player_game_stats(game_id);
+
+CREATE TABLE IF NOT EXISTS standings (
+    snapshot_date TEXT NOT NULL,
+    team_code     TEXT NOT NULL REFERENCES teams(team_code),
+    grp           TEXT,
+    w INTEGER, l INTEGER, pf INTEGER, pa INTEGER, pd INTEGER, pts INTEGER,
+    status        TEXT,
+    PRIMARY KEY (snapshot_date, team_code)
+);
+CREATE INDEX IF NOT EXISTS idx_standings_group ON standings(grp, snapshot_date);
+
+CREATE TABLE IF NOT EXISTS commentary_notes (
+    note_id    INTEGER PRIMARY KEY,
+    team_code  TEXT REFERENCES teams(team_code),
+    category   TEXT,
+    note       TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_notes_team ON commentary_notes(team_code);
+"""
+
+# -----------------------------------------------------------------
+# CONNECTION
+# -----------------------------------------------------------------
+
+def connect(path=DB_FILE):
+    """Open the database (WAL mode, waits on a busy writer instead of failing)"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _clean(value):
+    """NaN/NA -> None so sqlite stores NULL; numpy scalars -> Python types"""
+    if pd.isna(value):
+        return None
+    return value.item() if hasattr(value, "item") else value
+
+# -----------------------------------------------------------------
+# BUILD FUNCTIONS
+# -----------------------------------------------------------------
+
+def load_teams():
+    """Registry teams with country and tier from the qualification data"""
+    teams = registry_frame()[["team_id", "code", "name"]].rename(columns={"code": "team_code"})
+    if os.path.exists(TEAM_SOURCES["qualification"]):
+        qual = read_table(TEAM_SOURCES["qualification"], columns=["Team", "Country", "Tier"])
+        qual = qual.assign(team_id=resolve_ids(qual["Team"])).drop_duplicates("team_id")
+        teams = teams.merge(qual[["team_id", "Country", "Tier"]].set_axis(["team_id", "country", "tier"], axis=1),
+                            on="team_id", how="left")
+    else:
+        teams = teams.assign(country=None, tier=None)
+    return teams
+
+
+def build_database(path=DB_FILE):
+    """
+    Rebuild every table from the current scraped files in one transaction
+
+    Readers on other connections keep seeing the previous snapshot until
+    the commit, so a rebuild never exposes a half-loaded database.
+    """
+    games = load_game_results()
+    games = games.assign(Key=game_key(games))
+    teams = load_teams()
+
+    conn = connect(path)
+    with conn:
+        # Standings are kept as dated snapshots; everything else is reloaded
+        for table in ["commentary_notes", "player_game_stats", "games"]:
+            conn.execute(f"DELETE FROM {table}")
+
+        conn.executemany(
+            """INSERT INTO teams (team_code, team_id, name, country, tier) VALUES (?, ?, ?, ?, ?)
+               ON CONFLICT(team_code) DO UPDATE SET
+                   name = excluded.name, country = excluded.country, tier = excluded.tier""",
+            [tuple(_clean(v) for v in row)
+             for row in teams[["team_code", "team_id", "name", "country", "tier"]].itertuples(index=False)]
+        )
+
+        game_rows = []
+        for g in games.itertuples(index=False):
+            game_rows.append((
+                g.Key, None if pd.isna(g.Date) else g.Date.strftime("%Y-%m-%d"),
+                g.Competition, g.Season, g.Stage, _clean(g.Group),
+                g.Team_A_Code, g.Team_A, int(g.Score_A),
+                g.Team_B_Code, g.Team_B, int(g.Score_B),
+                _clean(g.Venue), g.Source
+            ))
+        conn.executemany(
+            """INSERT INTO games (game_key, game_date, competition, season, stage, grp,
+                                  team_a_code, team_a, score_a, team_b_code, team_b, score_b, venue, source)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            game_rows
+        )
+
+        for source in PLAYER_STAT_SOURCES:
+            if not os.path.exists(source["csv_file"]):
+                continue
+            box = read_table(source["csv_file"]).drop_duplicates()
+            conn.executemany(
+                """INSERT INTO player_game_stats (game_id, team_code, season, player, jersey, games, minutes,
+                                                  fg2m, fg2a, fg3m, fg3a, ftm, fta,
+                                                  orb, drb, ast, stl, blk, tov, pts)
+                   VALUES (NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(source["team_code"], source["season"], r["Name"], _clean(r["Jersey"]), _clean(r["Games"]),
+                  _clean(r["MIN"]), _clean(r["2PM"]), _clean(r["2PA"]), _clean(r["3PM"]), _clean(r["3PA"]),
+                  _clean(r["FTM"]), _clean(r["FTA"]), _clean(r["ORB"]), _clean(r["DRB"]), _clean(r["AST"]),
+                  _clean(r["STL"]), _clean(r["BLK"]), _clean(r["TO"]), _clean(r["PTS"]))
+                 for _, r in box.iterrows()]
+            )
+
+        if os.path.exists(TEAM_SOURCES["standings"]):
+            snapshot = date.today().isoformat()
+            standings = read_table(TEAM_SOURCES["standings"])
+            conn.executemany(
+                """INSERT OR REPLACE INTO standings (snapshot_date, team_code, grp, w, l, pf, pa, pd, pts, status)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                [(snapshot, registry_code(r["Team_Code"]), r["Group"], int(r["W"]), int(r["L"]), int(r["PF"]),
+                  int(r["PA"]), int(r["PD"]), int(r["PTS"]), r["Status"]) for _, r in standings.iterrows()]
+            )
+
+        if os.path.exists(COMMENTARY_SOURCE):
+            created = date.today().isoformat()
+            cards = read_table(COMMENTARY_SOURCE)
+            conn.executemany(
+                "INSERT INTO commentary_notes (team_code, category, note, created_at) VALUES (?, ?, ?, ?)",
+                [(registry_code(card["Team"]), category, card[category], created)
+                 for _, card in cards.iterrows()
+                 for category in COMMENTARY_CATEGORIES
+                 if category in cards.columns and not pd.isna(card[category])]
+            )
+    return conn
+
+
+def open_database(path=DB_FILE):
+    """Connect, building the database first if it doesn't exist yet"""
+    if not os.path.exists(path):
+        build_database(path).close()
+    return connect(path)
+
+# -----------------------------------------------------------------
+# QUERY LAYER
+# -----------------------------------------------------------------
+
+def query(conn, sql, params=()):
+    """Run any SELECT and return a DataFrame"""
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def team_code(conn, name):
+    """Team code for a team name (None if unknown)"""
+    row = conn.execute("SELECT team_code FROM teams WHERE name = ?", (name,)).fetchone()
+    return row["team_code"] if row else None
+
+
+def team_games(conn, code, stage=None, source=None, keys=None):
+    """
+    Every game a team played, from its own point of view (newest last)
+
+    Each side of the UNION is a seek on idx_games_team_a / idx_games_team_b.
+    keys limits it to those game_keys, whichever source's row was kept.
+    """
+    filters, params = "", []
+    if stage is not None:
+        filters += " AND stage = ?"
+        params.append(stage)
+    if source is not None:
+        filters += " AND source = ?"
+        params.append(source)
+    if keys is not None:
+        keys = list(keys)
+        filters += f" AND game_key IN ({', '.join('?' * len(keys))})"
+        params.extend(keys)
+
+    sql = f"""
+        SELECT game_id, game_date, season, stage, grp, team_b_code AS opponent_code, team_b AS opponent,
+               score_a AS points_for, score_b AS points_against, venue
+        FROM games WHERE team_a_code = ?{filters}
+        UNION ALL
+        SELECT game_id, game_date, season, stage, grp, team_a_code, team_a,
+               score_b, score_a, venue
+        FROM games WHERE team_b_code = ?{filters}
+        ORDER BY season, game_date, game_id
+    """
+    return query(conn, sql, [code, *params, code, *params])
+
+
+def group_games(conn, group):
+    """All games in a group, by date"""
+    return query(conn, "SELECT * FROM games WHERE grp = ? ORDER BY game_date", (group,))
+
+
+def games_on(conn, game_date):
+    """All games on one date (YYYY-MM-DD)"""
+    return query(conn, "SELECT * FROM games WHERE game_date = ? ORDER BY game_id", (game_date,))
+
+
+def latest_standings(conn, group=None):
+    """Most recent standings snapshot, optionally for one group"""
+    sql = """SELECT s.*, t.name FROM standings s JOIN teams t USING (team_code)
+             WHERE snapshot_date = (SELECT MAX(snapshot_date) FROM standings)"""
+    params = ()
+    if group is not None:
+        sql += " AND grp = ?"
+        params = (group,)
+    return query(conn, sql + " ORDER BY grp, pts DESC, pd DESC", params)
+
+
+def player_stats(conn, code, season=None):
+    """Player rows for a team (optionally one season)"""
+    sql = "SELECT * FROM player_game_stats WHERE team_code = ?"
+    params = [code]
+    if season is not None:
+        sql += " AND season = ?"
+        params.append(season)
+    return query(conn, sql + " ORDER BY pts DESC", params)
+
+
+def commentary_notes(conn, code):
+    """Commentary notes for one team"""
+    return query(conn, "SELECT category, note, created_at FROM commentary_notes WHERE team_code = ? "
+                       "ORDER BY note_id", (code,))
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("LEAGUE DATABASE BUILD")
+    print("=" * 70)
+
+    db = build_database()
+    for table_name in ["teams", "games", "player_game_stats", "standings", "commentary_notes"]:
+        count = db.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0]
+        print(f"  ✓ {table_name:<20} {count:>4} rows")
+
+    print("\nSample: all FBE games")
+    print(team_games(db, "FBE").to_string(index=False))
+    db.close()
+    print(f"\n✓ Saved: {DB_FILE}")
@@ -1,8 +1,15 @@
 """
 Manual data collection template for live commentary
 Fill in during games or from social media/news sources
+Running it exports the talking points for the commentary worksheet
 """
 
+import pandas as pd
+
+from arrow_handoff import publish
+
+POINTS_FILE = "manual_commentary_points.csv"
+
 # NAMUWONGO BLAZERS (Uganda)
 # ==========================================
 
@@ -293,3 +300,18 @@ HOW TO USE THIS TEMPLATE:
    - Note MVP performances
    - Record for future reference
 """
+
+
+def talking_points(teams=ALL_TEAMS):
+    """One row per commentary point (Team, Storyline, Point_Number, Talking_Point)"""
+    rows = [{"Team": team["team_name"], "Storyline": team["storyline"], "Point_Number": number,
+             "Talking_Point": point}
+            for team in teams.values()
+            for number, point in enumerate(team["commentary_points"], 1)]
+    return pd.DataFrame(rows, columns=["Team", "Storyline", "Point_Number", "Talking_Point"])
+
+
+if __name__ == "__main__":
+    points = talking_points()
+    publish(points, POINTS_FILE)
+    print(f"✓ Saved: {POINTS_FILE} ({len(points)} talking points, {points['Team'].nunique()} teams)")
@@ -0,0 +1,243 @@
+"""
+Columnar Parquet store for the pipeline datasets
+Every dataset has a declared schema and is partitioned by Competition and
+Season; stages read it with column projection and predicate pushdown and
+CSV is only an export format (Sheets upload, graphics team)
+"""
+
+import os
+import shutil
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from artifact_manifest import load_manifest, record_stage, stage_is_current
+from profiling import count, profiled, span
+from schema_registry import schema_columns, read_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+STORE_DIR = "data_store"
+PARTITION_COLUMNS = ["Competition", "Season"]
+
+ARROW_TYPES = {
+    "string": pa.string(),
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "date": pa.timestamp("ns"),
+    "category": pa.string(),
+}
+
+# Dataset name -> source CSV, partition values for CSVs that don't carry
+# them, and the (column, type) schema in CSV column order (from the
+# schema registry for CSV-backed datasets)
+DATASETS = {
+    "games": {
+        "csv_file": None,  # built from game_results.load_game_results()
+        "schema": [
+            ("Date", "date"), ("Competition", "string"), ("Season", "string"),
+            ("Stage", "string"), ("Group", "string"),
+            ("Team_A_ID", "int"), ("Team_A_Code", "string"), ("Team_A", "string"), ("Score_A", "int"),
+            ("Team_B_ID", "int"), ("Team_B_Code", "string"), ("Team_B", "string"), ("Score_B", "int"),
+            ("Venue", "string"), ("Source", "string"),
+        ]
+    },
+    "case_study_games": {
+        "csv_file": "elite16_case_study_games_completed.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("elite16_case_study_games_completed.csv")
+    },
+    "road_to_bal_summary": {
+        "csv_file": "road_to_bal_2026_summary.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("road_to_bal_2026_summary.csv")
+    },
+    "qualification": {
+        "csv_file": "bal_2026_qualification_data.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("bal_2026_qualification_data.csv")
+    },
+    "standings": {
+        "csv_file": "elite16_case_study_standings_current.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("elite16_case_study_standings_current.csv")
+    },
+    "elite16_comprehensive": {
+        "csv_file": "elite16_comprehensive_nct_fbe_bhb.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("elite16_comprehensive_nct_fbe_bhb.csv")
+    },
+    "partial_rosters": {
+        "csv_file": "partial_rosters.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("partial_rosters.csv")
+    },
+    "partial_stats": {
+        "csv_file": "partial_stats.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("partial_stats.csv")
+    },
+    "commentary_cards": {
+        "csv_file": "live_commentary_cards.csv",
+        "competition": "Road to BAL", "season": "2026",
+        "schema": schema_columns("live_commentary_cards.csv")
+    },
+    "nct_player_stats": {
+        "csv_file": "nct_2025_player_stats_clean.csv",
+        "competition": "BAL", "season": "2025",
+        "schema": schema_columns("nct_2025_player_stats_clean.csv")
+    },
+}
+
+# -----------------------------------------------------------------
+# SCHEMA FUNCTIONS
+# -----------------------------------------------------------------
+
+def dataset_columns(name):
+    """Declared columns in CSV order (partition columns included if declared)"""
+    return [column for column, _ in DATASETS[name]["schema"]]
+
+
+def dataset_schema(name):
+    """Arrow schema for a dataset: declared columns plus the partition keys"""
+    fields = [pa.field(column, ARROW_TYPES[kind]) for column, kind in DATASETS[name]["schema"]]
+    declared = {f.name for f in fields}
+    fields += [pa.field(column, pa.string()) for column in PARTITION_COLUMNS if column not in declared]
+    return pa.schema(fields)
+
+
+def coerce_to_schema(df, name):
+    """Cast a raw DataFrame to the declared types ('N/A', '' -> null)"""
+    spec = DATASETS[name]
+    out = pd.DataFrame(index=df.index)
+    for column, kind in spec["schema"]:
+        values = df[column] if column in df.columns else pd.Series(pd.NA, index=df.index)
+        if kind == "int":
+            out[column] = pd.to_numeric(values, errors="coerce").round().astype("Int64")
+        elif kind == "float":
+            out[column] = pd.to_numeric(values, errors="coerce").astype(float)
+        elif kind == "date":
+            out[column] = pd.to_datetime(values, errors="coerce")
+        else:
+            out[column] = values.astype("string")
+    if "Competition" not in out.columns:
+        out["Competition"] = spec.get("competition", "Unknown")
+    if "Season" not in out.columns:
+        out["Season"] = spec.get("season", "Unknown")
+    for column in PARTITION_COLUMNS:
+        out[column] = out[column].astype("string").fillna("Unknown")
+    return out
+
+# -----------------------------------------------------------------
+# STORE FUNCTIONS
+# -----------------------------------------------------------------
+
+def dataset_path(name, store_dir=STORE_DIR):
+    return os.path.join(store_dir, name)
+
+
+def _manifest_key(name):
+    return f"parquet:{name}"
+
+
+def csv_changed(name):
+    """True when the dataset's CSV was edited since it was last imported or exported"""
+    csv_file = DATASETS[name]["csv_file"]
+    if csv_file is None or not os.path.exists(csv_file):
+        return False
+    key = _manifest_key(name)
+    return key in load_manifest()["stages"] and not stage_is_current(key, [csv_file])
+
+
+def write_dataset(name, df, store_dir=STORE_DIR):
+    """Replace a dataset's partitions with df (coerced to the declared schema)"""
+    path = dataset_path(name, store_dir)
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    table = pa.Table.from_pandas(coerce_to_schema(df, name), schema=dataset_schema(name),
+                                 preserve_index=False)
+    with span("write", f"write_dataset({name})"):
+        count(rows_out=table.num_rows)
+        pq.write_to_dataset(table, path, partition_cols=PARTITION_COLUMNS)
+    return table.num_rows
+
+
+def _as_expression(filters):
+    """[(column, op, value), ...] -> pyarrow filter expression (ANDed)"""
+    ops = {
+        "==": lambda f, v: f == v, "!=": lambda f, v: f != v,
+        "<": lambda f, v: f < v, "<=": lambda f, v: f <= v,
+        ">": lambda f, v: f > v, ">=": lambda f, v: f >= v,
+        "in": lambda f, v: f.isin(list(v)),
+    }
+    expression = None
+    for column, op, value in filters:
+        term = ops[op](ds.field(column), value)
+        expression = term if expression is None else expression & term
+    return expression
+
+
+@profiled("read", rows="in")
+def read_dataset(name, columns=None, filters=None, store_dir=STORE_DIR, refresh=True):
+    """
+    Read a dataset with column projection and predicate pushdown
+
+    filters are (column, op, value) tuples, e.g. [("Season", "==", "2026")].
+    Partition filters skip whole directories; other filters use the
+    Parquet row-group statistics. Imports the source CSV on first use, and
+    again (refresh) when the CSV's hash differs from its last import/export.
+    """
+    path = dataset_path(name, store_dir)
+    if not os.path.exists(path) or (refresh and csv_changed(name)):
+        import_dataset(name, store_dir)
+
+    dataset = ds.dataset(path, schema=dataset_schema(name), format="parquet", partitioning="hive")
+    table = dataset.to_table(columns=columns, filter=_as_expression(filters) if filters else None)
+    return table.to_pandas(types_mapper={pa.int64(): pd.Int64Dtype(), pa.string(): pd.StringDtype()}.get)
+
+
+def export_csv(name, csv_file=None, store_dir=STORE_DIR):
+    """Write a dataset back out as CSV in its declared column order"""
+    spec = DATASETS[name]
+    csv_file = csv_file or spec["csv_file"] or f"{name}.csv"
+    df = read_dataset(name, columns=dataset_columns(name), store_dir=store_dir, refresh=False)
+    df.to_csv(csv_file, index=False)
+    if csv_file == spec["csv_file"]:
+        record_stage(_manifest_key(name), [csv_file])
+    return csv_file
+
+
+def import_dataset(name, store_dir=STORE_DIR):
+    """Load a dataset's source (CSV or game_results) into the store"""
+    spec = DATASETS[name]
+    if spec["csv_file"] is None:
+        from game_results import load_game_results
+        df = load_game_results()
+    elif os.path.exists(spec["csv_file"]):
+        df = read_table(spec["csv_file"])
+    else:
+        df = pd.DataFrame(columns=dataset_columns(name))
+    rows = write_dataset(name, df, store_dir)
+    if spec["csv_file"] is not None and os.path.exists(spec["csv_file"]):
+        record_stage(_manifest_key(name), [spec["csv_file"]])
+    return rows
+
+
+def import_all(store_dir=STORE_DIR):
+    """Import every declared dataset; returns {name: rows}"""
+    return {name: import_dataset(name, store_dir) for name in DATASETS}
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("PARQUET STORE - IMPORT ALL DATASETS")
+    print("=" * 70)
+
+    counts = import_all()
+    for dataset_name, rows in counts.items():
+        print(f"  ✓ {dataset_name:<25} {rows:>4} rows")
+    print(f"\n✓ Store written to: {STORE_DIR}/")
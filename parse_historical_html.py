@@ -2,6 +2,9 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import re
 
+from profiling import profiled
+
+@profiled("parse", rows="out")
 def parse_bal_nba_teams_html():
     """Parse the saved BAL.NBA.com teams HTML"""
     
@@ -74,6 +77,7 @@ def parse_bal_nba_teams_html():
         print(f"✗ Error: {e}")
         return None
 
+@profiled("parse", rows="out")
 def parse_fiba_history_html():
     """Parse the saved FIBA history HTML for Ferroviario"""
     
@@ -0,0 +1,453 @@
+"""
+Declarative pipeline runner - scrape -> parse -> clean -> build -> upload
+Each stage declares the files it reads and writes; the runner orders the
+stages by those edges and, like make, rebuilds only stages whose inputs
+changed (content hashes) or whose outputs are missing. Scrape stages are
+due when their provenance TTL has expired; --profile records where the
+run's time, memory and requests went (see profiling.py)
+"""
+
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from artifact_manifest import stage_is_current, record_stage
+from game_results import GAME_SOURCES
+from profiling import execute_profiled, load_report, new_run_dir, print_profile, span_file, write_report
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+GAME_FILES = [source["csv_file"] for source in GAME_SOURCES]
+QUALIFICATION = "bal_2026_qualification_data.csv"
+
+# Parallel execution: worker processes, and how many stages may hold each
+# resource tag at once (network scrapes stay polite, one Sheets client,
+# one writer on the game event log / rolling form state)
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+RESOURCE_LIMITS = {"network": 2, "cpu": os.cpu_count() or 1, "sheets": 1, "event_log": 1}
+KIND_RESOURCES = {
+    "scrape": ["network"],
+    "parse": ["cpu"],
+    "clean": ["cpu"],
+    "build": ["cpu"],
+    "upload": ["network", "sheets"],
+}
+
+# Inputs a stage can run without (game_results skips game files that don't exist)
+OPTIONAL_INPUTS = set(GAME_FILES)
+
+# Live SQLite databases: they order stages like any other output, but are
+# never hashed or copied into artifacts/ - the stage that builds one already
+# hashes everything it is built from
+DATABASE_FILES = {"road_to_bal.db"}
+
+# kind: scrape / parse / clean / build / upload
+# source: provenance.py source whose TTL decides when a scrape stage is due
+# resources: overrides the kind's resource tags
+STAGES = [
+    # Scrape (network)
+    {
+        "name": "scrape_qualification", "kind": "scrape", "script": "scrape_wikipedia_bal.py",
+        "source": "wikipedia_qualification",
+        "inputs": [], "outputs": [QUALIFICATION]
+    },
+    {
+        "name": "scrape_standings", "kind": "scrape", "script": "scrape_elite16_standings.py",
+        "source": "fiba_standings",
+        "inputs": [], "outputs": ["elite16_standings_raw.csv", "standings_script_105.js"]
+    },
+    {
+        "name": "scrape_elite16_stats", "kind": "scrape", "script": "scrape_elite16_team_stats.py",
+        "source": "fiba_elite16_stats",
+        "inputs": [], "outputs": ["elite16_team_stats_scraped.csv", "elite16_team_games_scraped.csv"]
+    },
+    {
+        "name": "scrape_team_history", "kind": "scrape", "script": "historical_team_scraper.py",
+        "source": "fiba_team_history",
+        "inputs": [], "outputs": ["teams_overview.csv", "tournament_appearances.csv", "team_games_history.csv"]
+    },
+    {
+        "name": "scrape_open_source_teams", "kind": "scrape", "script": "scrape_open_source_teams.py",
+        "source": "open_source_teams",
+        "inputs": [], "outputs": ["open_source_teams_data_summary.csv"]
+    },
+    {
+        "name": "scrape_bal_history", "kind": "scrape", "script": "scrape_bal_nba_historical.py",
+        "source": "bal_historical",
+        "inputs": [], "outputs": ["bal_nba_teams.html"]
+    },
+
+    # Parse
+    {
+        "name": "parse_elite16_games", "kind": "parse", "script": "extract_comprehensive_elite16.py",
+        "inputs": ["standings_script_105.js"],
+        "outputs": ["elite16_all_games.csv", "elite16_calculated_standings.csv",
+                    "elite16_case_study_standings.csv", "elite16_case_study_games.csv"]
+    },
+    {
+        "name": "parse_bal_history", "kind": "parse", "script": "parse_historical_html.py",
+        "inputs": ["bal_nba_teams.html"],
+        "outputs": ["bal_nba_all_teams.csv", "ferroviario_beira_historical_summary.csv",
+                    "bravehearts_historical_summary.csv"]
+    },
+
+    # Clean
+    {
+        "name": "clean_nct_stats", "kind": "clean", "script": "clean_nct_stats.py",
+        "inputs": ["nct_2025_bal_stats.csv"],
+        "outputs": ["nct_2025_team_stats_clean.csv", "nct_2025_game_record_clean.csv",
+                    "nct_2025_player_stats_clean.csv", "nct_2025_summary_clean.csv"]
+    },
+
+    # Build
+    {
+        "name": "advanced_metrics", "kind": "build", "script": "advanced_metrics.py",
+        "inputs": ["nct_2025_player_stats_clean.csv", "nct_2025_summary_clean.csv"],
+        "outputs": ["team_advanced_metrics.csv", "player_advanced_metrics.csv"]
+    },
+    {
+        "name": "ratings", "kind": "build", "script": "rating_engine.py",
+        "inputs": GAME_FILES + [QUALIFICATION],
+        "outputs": ["team_ratings.csv", "predicted_spreads.csv"]
+    },
+    {
+        "name": "head_to_head", "kind": "build", "script": "head_to_head_index.py",
+        "inputs": GAME_FILES, "outputs": ["head_to_head_results.csv"],
+        "resources": ["cpu", "event_log"]
+    },
+    {
+        "name": "rolling_form", "kind": "build", "script": "rolling_form.py",
+        "inputs": GAME_FILES, "outputs": ["team_rolling_form.csv"],
+        "resources": ["cpu", "event_log"]
+    },
+    {
+        "name": "team_profiles", "kind": "build", "script": "create_team_profiles.py",
+        "inputs": [QUALIFICATION], "outputs": ["comprehensive_team_profiles.csv"]
+    },
+    {
+        # Only the datasets later stages read; the ones they write are excluded
+        # so the store doesn't feed back into itself
+        "name": "parquet_store", "kind": "build", "script": "parquet_store.py",
+        "inputs": GAME_FILES + [QUALIFICATION, "road_to_bal_2026_summary.csv",
+                                "elite16_case_study_standings_current.csv", "partial_rosters.csv",
+                                "partial_stats.csv", "nct_2025_player_stats_clean.csv"],
+        "outputs": ["data_store/road_to_bal_summary", "data_store/partial_rosters", "data_store/partial_stats"]
+    },
+    {
+        "name": "league_db", "kind": "build", "script": "league_db.py",
+        "inputs": GAME_FILES + [QUALIFICATION, "elite16_case_study_standings_current.csv",
+                                "nct_2025_player_stats_clean.csv", "live_commentary_cards.csv"],
+        "outputs": ["road_to_bal.db"]
+    },
+    {
+        "name": "elite16_comprehensive", "kind": "build", "script": "create_elite16_comprehensive.py",
+        "inputs": GAME_FILES + ["data_store/road_to_bal_summary", "road_to_bal.db"],
+        "outputs": ["elite16_comprehensive_nct_fbe_bhb.csv"],
+        "resources": ["cpu", "event_log"]
+    },
+    {
+        "name": "commentary_cards", "kind": "build", "script": "generate_partial_data.py",
+        "inputs": GAME_FILES + ["data_store/partial_rosters", "data_store/partial_stats"],
+        "outputs": ["live_commentary_cards.csv"],
+        "resources": ["cpu", "event_log"]
+    },
+    {
+        "name": "commentary_template", "kind": "build", "script": "manual_commentary_template.py",
+        "inputs": [], "outputs": ["manual_commentary_points.csv"]
+    },
+    {
+        "name": "game_identity", "kind": "build", "script": "game_identity.py",
+        "inputs": GAME_FILES + ["road_to_bal_2026_summary.csv", "elite16_nct_fbe_bhb_stats.csv",
+                                "partial_stats.csv", "head_to_head_results.csv"],
+        "outputs": ["game_identities.csv", "game_identity_conflicts.csv"]
+    },
+    {
+        "name": "data_quality", "kind": "build", "script": "data_validator.py",
+        "inputs": [QUALIFICATION, "road_to_bal_2026_summary.csv", "elite16_case_study_standings_current.csv",
+                   "elite16_comprehensive_nct_fbe_bhb.csv", "nct_2025_player_stats_clean.csv",
+                   "elite16_case_study_games_completed.csv", "elite16_nct_fbe_bhb_stats.csv",
+                   "nct_2025_summary_clean.csv"],
+        "outputs": ["data_quality_report.csv", "data_quality_issues.csv"]
+    },
+
+    # Upload (Google Sheets)
+    {
+        "name": "upload_all_data", "kind": "upload", "script": "upload_all_data.py",
+        "inputs": ["comprehensive_team_profiles.csv", "head_to_head_results.csv",
+                   "case_study_teams_comprehensive_data.csv", "scraping_summary_by_team.csv",
+                   QUALIFICATION, "teams_roster_links.csv", "nct_2025_summary_clean.csv",
+                   "nct_2025_team_stats_clean.csv", "nct_2025_player_stats_clean.csv",
+                   "nct_2025_game_record_clean.csv", "data_quality_issues.csv"],
+        "outputs": []
+    },
+    {
+        "name": "upload_elite16_data", "kind": "upload", "script": "upload_elite16_data.py",
+        "inputs": ["elite16_nct_fbe_bhb_stats.csv", "elite16_comprehensive_nct_fbe_bhb.csv",
+                   "road_to_bal_2026_summary.csv", "data_quality_issues.csv"],
+        "outputs": []
+    },
+    {
+        "name": "upload_partial_data", "kind": "upload", "script": "upload_partial_data.py",
+        "inputs": ["partial_rosters.csv", "partial_stats.csv", "live_commentary_cards.csv",
+                   "manual_commentary_points.csv"],
+        "outputs": []
+    },
+    {
+        "name": "upload_team_profiles", "kind": "upload", "script": "update_team_profiles_sheet.py",
+        "inputs": ["comprehensive_team_profiles.csv"], "outputs": []
+    },
+    {
+        "name": "upload_qualification", "kind": "upload", "script": "update_qualification_data.py",
+        "inputs": [QUALIFICATION, "data_quality_issues.csv"], "outputs": []
+    },
+    {
+        "name": "upload_h2h_sheet", "kind": "upload", "script": "update_h2h_sheet.py",
+        "inputs": ["head_to_head_results.csv"], "outputs": [],
+        "resources": ["network", "sheets", "event_log"]
+    },
+]
+
+STAGES_BY_NAME = {stage["name"]: stage for stage in STAGES}
+
+# -----------------------------------------------------------------
+# GRAPH FUNCTIONS
+# -----------------------------------------------------------------
+
+def producers(stages=STAGES):
+    """{output file: stage name}; two stages writing one file is an error"""
+    owner = {}
+    for stage in stages:
+        for output in stage["outputs"]:
+            if output in owner:
+                raise ValueError(f"'{output}' is written by both {owner[output]} and {stage['name']}")
+            owner[output] = stage["name"]
+    return owner
+
+
+def upstream(stage, stages=STAGES):
+    """Names of the stages that write one of this stage's inputs"""
+    owner = producers(stages)
+    return sorted({owner[path] for path in stage["inputs"] if path in owner} - {stage["name"]})
+
+
+def topological_order(stages=STAGES):
+    """Stages ordered so every producer runs before its consumers (declaration order on ties)"""
+    by_name = {stage["name"]: stage for stage in stages}
+    waiting = {stage["name"]: set(upstream(stage, stages)) for stage in stages}
+    order = []
+    while waiting:
+        ready = [name for name in by_name if name in waiting and not waiting[name]]
+        if not ready:
+            raise ValueError(f"Pipeline has a cycle through: {sorted(waiting)}")
+        for name in ready:
+            order.append(by_name[name])
+            del waiting[name]
+        for deps in waiting.values():
+            deps.difference_update(ready)
+    return order
+
+
+def downstream(paths, stages=STAGES):
+    """
+    Names of the stages affected by a change to any of these files
+
+    A stage is affected when it reads one of them (its script included)
+    or reads the output of an affected stage. Declaration order.
+    """
+    changed, affected = set(paths), set()
+    for stage in topological_order(stages):
+        if changed.intersection(stage["inputs"] + [stage["script"]]):
+            affected.add(stage["name"])
+            changed.update(stage["outputs"])
+    return [stage["name"] for stage in stages if stage["name"] in affected]
+
+
+def with_upstream(targets, stages=STAGES):
+    """The target stages plus everything they (transitively) depend on"""
+    by_name = {stage["name"]: stage for stage in stages}
+    needed, pending = set(), list(targets)
+    while pending:
+        name = pending.pop()
+        if name not in needed:
+            needed.add(name)
+            pending += upstream(by_name[name], stages)
+    return [stage for stage in stages if stage["name"] in needed]
+
+# -----------------------------------------------------------------
+# STALENESS
+# -----------------------------------------------------------------
+
+def _manifest_key(stage):
+    return f"pipeline:{stage['name']}"
+
+
+def _stage_inputs(stage):
+    """Declared inputs (databases excluded) plus the script itself (editing a stage rebuilds it)"""
+    return [path for path in stage["inputs"] if path not in DATABASE_FILES] + [stage["script"]]
+
+
+def stage_status(stage, due_sources=None):
+    """
+    "current", or why the stage has to run / can't run
+
+    Scrape stages follow their provenance TTL. Everything else is stale
+    when an output is missing or an input's hash differs from the last
+    successful run, and blocked when a required input doesn't exist.
+    """
+    if stage["kind"] == "scrape":
+        return "ttl expired" if due_sources is None or stage["source"] in due_sources else "current"
+    missing_inputs = [path for path in stage["inputs"]
+                      if path not in OPTIONAL_INPUTS and not os.path.exists(path)]
+    if missing_inputs:
+        return "blocked: missing " + ", ".join(missing_inputs)
+    missing_outputs = [path for path in stage["outputs"] if not os.path.exists(path)]
+    if missing_outputs:
+        return "missing " + ", ".join(missing_outputs)
+    if not stage_is_current(_manifest_key(stage), _stage_inputs(stage)):
+        return "inputs changed"
+    return "current"
+
+
+def _due_sources():
+    from provenance import stale_sources
+    return {policy["source"] for policy in stale_sources()}
+
+# -----------------------------------------------------------------
+# EXECUTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def stage_resources(stage):
+    """Resource tags a stage holds while it runs (kind default unless declared)"""
+    return stage.get("resources", KIND_RESOURCES[stage["kind"]])
+
+
+def _execute(script, args, trace_file=None):
+    """Worker: run one stage script; (return code, output tail, wall seconds, profiled usage)"""
+    if trace_file:
+        return execute_profiled([sys.executable, script, *args], trace_file)
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, script, *args], capture_output=True, text=True)
+    return result.returncode, result.stdout[-2000:] + result.stderr[-2000:], time.perf_counter() - started, None
+
+
+def run(targets=None, kinds=None, force=False, dry_run=False, workers=DEFAULT_WORKERS, profile_dir=None):
+    """
+    Rebuild what is out of date, running independent stages in parallel
+
+    A stage starts once every upstream stage has finished, a worker is
+    free and its resource tags are under their RESOURCE_LIMITS. Manifest
+    records are written here, never by the workers. targets limits the
+    run to those stages and their upstream; kinds to stage kinds (e.g. no
+    scrape/upload when offline). Stages below a failed stage are skipped.
+    force reruns current stages; blocked stages stay blocked.
+    profile_dir profiles every stage that runs and writes its report there.
+    Returns ({stage name: outcome}, {stage name: wall seconds}).
+    """
+    stages = with_upstream(targets) if targets else STAGES
+    pending = [stage for stage in topological_order(stages) if kinds is None or stage["kind"] in kinds]
+    planned = {stage["name"] for stage in pending}
+    due = _due_sources() if any(stage["kind"] == "scrape" for stage in pending) else set()
+
+    outcomes, timings, failed, usages = {}, {}, set(), {}
+    started_at = time.perf_counter()
+    running, in_use = {}, Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for stage in list(pending):
+                deps = [name for name in upstream(stage) if name in planned]
+                if any(name not in outcomes for name in deps):
+                    continue
+                if failed.intersection(deps):
+                    pending.remove(stage)
+                    outcomes[stage["name"]] = "skipped: upstream failed"
+                    failed.add(stage["name"])
+                    continue
+                status = stage_status(stage, due)
+                if force and not status.startswith("blocked"):
+                    status = "forced"
+                if status == "current" or status.startswith("blocked"):
+                    pending.remove(stage)
+                    outcomes[stage["name"]] = status
+                    continue
+                if dry_run:
+                    pending.remove(stage)
+                    print(f"  → {stage['name']:<26} ({status})")
+                    outcomes[stage["name"]] = f"would run ({status})"
+                    continue
+                needs = stage_resources(stage)
+                if len(running) >= workers or any(in_use[tag] >= RESOURCE_LIMITS.get(tag, workers) for tag in needs):
+                    continue
+                pending.remove(stage)
+                in_use.update(needs)
+                print(f"  → {stage['name']:<26} ({status})")
+                trace_file = span_file(profile_dir, stage["name"]) if profile_dir else None
+                # Scripts keep their own staleness checks for standalone runs; pass --force through
+                args = stage.get("args", []) + (["--force"] if status == "forced" else [])
+                running[pool.submit(_execute, stage["script"], args, trace_file)] = stage
+
+            if not running:
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                in_use.subtract(stage_resources(stage))
+                returncode, output, seconds, usage = future.result()
+                timings[stage["name"]] = seconds
+                if usage is not None:
+                    usages[stage["name"]] = usage
+                if returncode != 0:
+                    print(f"  ✗ {stage['name']} failed:\n{output}")
+                    outcomes[stage["name"]] = "failed"
+                    failed.add(stage["name"])
+                    continue
+                if stage["kind"] != "scrape":
+                    record_stage(_manifest_key(stage), _stage_inputs(stage),
+                                 [path for path in stage["outputs"]
+                                  if os.path.isfile(path) and path not in DATABASE_FILES])
+                outcomes[stage["name"]] = "ran"
+    if profile_dir:
+        write_report(profile_dir, stages, outcomes, timings, usages, time.perf_counter() - started_at, workers)
+    return outcomes, timings
+
+
+def print_report(outcomes, timings, elapsed, workers):
+    """Per-stage outcome and wall time, then the rebuild count"""
+    print()
+    for stage_name, outcome in outcomes.items():
+        took = f"{timings[stage_name]:6.2f}s" if stage_name in timings else ""
+        print(f"  {stage_name:<26} {took:>8}  {outcome}")
+    ran = sum(outcome == "ran" for outcome in outcomes.values())
+    print(f"\n✓ {ran} of {len(outcomes)} stages rebuilt in {elapsed:.2f}s "
+          f"({sum(timings.values()):.2f}s of stage time, {workers} workers)")
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("ROAD TO BAL PIPELINE")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    flags = {arg for arg in args if arg.startswith("--")}
+    worker_count = int(args[args.index("--workers") + 1]) if "--workers" in args else DEFAULT_WORKERS
+    requested = [arg for i, arg in enumerate(args)
+                 if not arg.startswith("--") and (i == 0 or args[i - 1] != "--workers")]
+    unknown = [name for name in requested if name not in STAGES_BY_NAME]
+    if unknown:
+        sys.exit(f"Unknown stages {unknown}; choose from {sorted(STAGES_BY_NAME)}")
+
+    run_kinds = ["parse", "clean", "build"] if "--offline" in flags else None
+    run_dir = new_run_dir() if "--profile" in flags else None
+    started_at = time.perf_counter()
+    results, wall_times = run(requested or None, run_kinds, force="--force" in flags,
+                              dry_run="--dry-run" in flags, workers=worker_count, profile_dir=run_dir)
+    print_report(results, wall_times, time.perf_counter() - started_at, worker_count)
+    if run_dir:
+        print_profile(load_report(run_dir), run_dir)
+    if any(outcome == "failed" for outcome in results.values()):
+        sys.exit(1)
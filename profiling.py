@@ -0,0 +1,287 @@
+"""
+Profiling - where a refresh spends its time, memory, rows and requests
+With the pipeline's --profile flag every stage runs with ROADTOBAL_PROFILE
+set: fetches, HTTP/API calls, table reads/writes, parsers and uploads inside
+the stage record spans (wall, CPU, peak RSS, rows in/out, bytes, API calls),
+the pipeline adds per-stage CPU and peak RSS, and each run writes a JSON
+report plus a Chrome trace (chrome://tracing, Perfetto or speedscope)
+"""
+
+import atexit
+import functools
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:           # Windows: no getrusage, CPU/RSS columns stay empty
+    resource = None
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+PROFILE_ENV = "ROADTOBAL_PROFILE"   # set by the pipeline: this stage's span file
+PROFILE_DIR = "profiles"            # one sub-directory per profiled run
+REPORT_FILE = "report.json"
+TRACE_FILE = "trace.json"
+
+COUNTERS = ["rows_in", "rows_out", "bytes", "api_calls"]
+
+# Span kinds a stage's totals are summed from (outermost of each kind only,
+# since counters roll up into enclosing spans)
+TOTAL_KINDS = {"rows_in": ["read"], "rows_out": ["write", "upload"], "bytes": ["http"], "api_calls": ["http"]}
+RSS_BYTES = 1 if sys.platform == "darwin" else 1024   # ru_maxrss units
+
+ENABLED = bool(os.environ.get(PROFILE_ENV))
+
+# Spans of this process: the open stack of (kind, counters) and the closed records
+_STACK = []
+_SPANS = []
+
+# -----------------------------------------------------------------
+# SPAN FUNCTIONS (inside a stage)
+# -----------------------------------------------------------------
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_BYTES / 2**20
+
+
+@contextmanager
+def span(kind, name):
+    """
+    Time a block as one trace span; yields its counters
+
+    Counters added inside the block (see count) roll up into every
+    enclosing span. A no-op unless the pipeline is profiling.
+    """
+    if not ENABLED:
+        yield {}
+        return
+    counters = dict.fromkeys(COUNTERS, 0)
+    parent = _STACK[-1][0] if _STACK else None
+    _STACK.append((kind, counters))
+    started_at = time.time_ns() // 1000
+    started, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield counters
+    finally:
+        _STACK.pop()
+        if _STACK:
+            for key in COUNTERS:
+                _STACK[-1][1][key] += counters[key]
+        _SPANS.append({
+            "kind": kind, "name": name, "depth": len(_STACK), "parent": parent, "ts": started_at,
+            "dur": round((time.perf_counter() - started) * 1e6),
+            "cpu_s": time.process_time() - cpu, "peak_rss_mb": _peak_rss_mb(), **counters,
+        })
+
+
+def count(**counters):
+    """Add to the innermost open span's counters (rows_in, rows_out, bytes, api_calls)"""
+    if ENABLED and _STACK:
+        for key, value in counters.items():
+            _STACK[-1][1][key] += value
+
+
+def _rows(result):
+    """Rows in a DataFrame, or in the DataFrames of a tuple/list/dict result"""
+    if hasattr(result, "shape"):
+        return len(result)
+    if isinstance(result, dict):
+        result = list(result.values())
+    if isinstance(result, (tuple, list)):
+        return sum(len(item) for item in result if hasattr(item, "shape"))
+    return 0
+
+
+def profiled(kind, rows=None):
+    """
+    Decorator: run the function as a span named after it (and its file argument)
+
+    rows="in" or "out" counts the DataFrame rows it returns as rows read
+    or produced.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return func(*args, **kwargs)
+            target = next((arg for arg in args if isinstance(arg, str)), None)
+            with span(kind, f"{func.__name__}({target})" if target else func.__name__) as counters:
+                result = func(*args, **kwargs)
+                if rows:
+                    counters[f"rows_{rows}"] += _rows(result)
+            return result
+        return wrapper
+    return decorator
+
+
+def _instrument_requests():
+    """Every requests call (FIBA pages, Sheets API via google-auth) becomes an http span"""
+    import requests
+    from urllib.parse import urlsplit
+
+    request = requests.Session.request
+
+    @functools.wraps(request)
+    def profiled_request(self, method, url, *args, **kwargs):
+        parts = urlsplit(url)
+        with span("http", f"{method.upper()} {parts.netloc}{parts.path}") as counters:
+            response = request(self, method, url, *args, **kwargs)
+            counters["api_calls"] += 1
+            if not kwargs.get("stream"):
+                counters["bytes"] += len(response.content)
+        return response
+
+    requests.Session.request = profiled_request
+
+
+def _flush():
+    """Write this process's spans to the file the pipeline handed it"""
+    with open(os.environ[PROFILE_ENV], "a", encoding="utf-8") as f:
+        for record in _SPANS:
+            f.write(json.dumps(record) + "\n")
+
+
+if ENABLED:
+    _instrument_requests()
+    atexit.register(_flush)
+
+# -----------------------------------------------------------------
+# RUN FUNCTIONS (pipeline side)
+# -----------------------------------------------------------------
+
+def new_run_dir(profile_dir=PROFILE_DIR):
+    """profiles/<timestamp>/ for one profiled pipeline run"""
+    path = os.path.join(profile_dir, datetime.now().strftime("%Y%m%d-%H%M%S"))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def span_file(run_dir, stage_name):
+    return os.path.join(run_dir, f"{stage_name}.jsonl")
+
+
+def execute_profiled(command, trace_file):
+    """
+    Run a stage command with profiling on; (return code, output tail, wall seconds, usage)
+
+    usage has the child's start time, CPU seconds and peak RSS from wait4
+    (None where the platform has no wait4).
+    """
+    started_at, started = time.time_ns() // 1000, time.perf_counter()
+    env = {**os.environ, PROFILE_ENV: trace_file}
+    with tempfile.TemporaryFile() as output:
+        process = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT, env=env)
+        cpu_s = peak_rss_mb = None
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            cpu_s = usage.ru_utime + usage.ru_stime
+            peak_rss_mb = usage.ru_maxrss * RSS_BYTES / 2**20
+        else:
+            process.wait()
+        seconds = time.perf_counter() - started
+        output.seek(0)
+        text = output.read().decode("utf-8", errors="replace")
+    return process.returncode, text[-4000:], seconds, {
+        "ts": started_at, "cpu_s": cpu_s, "peak_rss_mb": peak_rss_mb, "pid": process.pid,
+    }
+
+
+def read_spans(trace_file):
+    if not os.path.exists(trace_file):
+        return []
+    with open(trace_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def stage_summary(stage, outcome, seconds, usage, spans):
+    """One report row: the stage's own usage plus its read/write/upload/http span totals"""
+    row = {"stage": stage["name"], "kind": stage["kind"], "outcome": outcome, "wall_s": round(seconds, 3),
+           "cpu_s": usage["cpu_s"], "peak_rss_mb": usage["peak_rss_mb"]}
+    for key in COUNTERS:
+        row[key] = sum(record[key] for record in spans
+                       if record["kind"] in TOTAL_KINDS[key] and record["parent"] != record["kind"])
+    return row
+
+
+def write_report(run_dir, stages, outcomes, timings, usages, elapsed, workers):
+    """
+    Merge the stage span files into report.json and trace.json; returns the report
+
+    The trace uses Chrome trace events: one process per stage, its spans
+    nested below the stage by time.
+    """
+    report = {"run": os.path.basename(run_dir), "elapsed_s": round(elapsed, 3), "workers": workers,
+              "stages": [], "by_kind": {}, "calls": {}}
+    events = []
+    for stage in stages:
+        name = stage["name"]
+        if name not in usages:
+            continue
+        spans = read_spans(span_file(run_dir, name))
+        usage = usages[name]
+        report["stages"].append(stage_summary(stage, outcomes[name], timings[name], usage, spans))
+
+        pid = usage["pid"]
+        events.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": name}})
+        events.append({"name": name, "cat": stage["kind"], "ph": "X", "pid": pid, "tid": 0,
+                       "ts": usage["ts"], "dur": round(timings[name] * 1e6),
+                       "args": {"cpu_s": usage["cpu_s"], "peak_rss_mb": usage["peak_rss_mb"]}})
+        for record in spans:
+            events.append({"name": record["name"], "cat": record["kind"], "ph": "X", "pid": pid, "tid": 0,
+                           "ts": record["ts"], "dur": record["dur"],
+                           "args": {key: record[key] for key in ["cpu_s", "peak_rss_mb", *COUNTERS]}})
+            calls = report["calls"].setdefault(record["kind"], {"calls": 0, "wall_s": 0.0, **dict.fromkeys(COUNTERS, 0)})
+            calls["calls"] += 1
+            calls["wall_s"] += record["dur"] / 1e6
+            for key in COUNTERS:
+                calls[key] += record[key]
+
+    for row in report["stages"]:
+        kind = report["by_kind"].setdefault(row["kind"], {"stages": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                                                          **dict.fromkeys(COUNTERS, 0)})
+        kind["stages"] += 1
+        kind["wall_s"] += row["wall_s"]
+        kind["cpu_s"] += row["cpu_s"] or 0.0
+        for key in COUNTERS:
+            kind[key] += row[key]
+
+    with open(os.path.join(run_dir, REPORT_FILE), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    with open(os.path.join(run_dir, TRACE_FILE), "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return report
+
+
+def load_report(run_dir):
+    with open(os.path.join(run_dir, REPORT_FILE), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def print_profile(report, run_dir):
+    """Per-stage and per-kind table: wall, CPU, peak RSS, rows, bytes, API calls"""
+    print(f"\n{'STAGE':<26} {'WALL':>7} {'CPU':>7} {'RSS MB':>7} {'ROWS IN':>8} {'ROWS OUT':>8} "
+          f"{'BYTES':>10} {'API':>5}")
+    for row in report["stages"]:
+        cpu = f"{row['cpu_s']:.2f}" if row["cpu_s"] is not None else "-"
+        rss = f"{row['peak_rss_mb']:.0f}" if row["peak_rss_mb"] is not None else "-"
+        print(f"{row['stage']:<26} {row['wall_s']:>7.2f} {cpu:>7} {rss:>7} {row['rows_in']:>8} "
+              f"{row['rows_out']:>8} {row['bytes']:>10} {row['api_calls']:>5}")
+
+    total = sum(kind["wall_s"] for kind in report["by_kind"].values()) or 1.0
+    print("\nStage time by kind:")
+    for name, kind in sorted(report["by_kind"].items(), key=lambda item: -item[1]["wall_s"]):
+        print(f"  {name:<8} {kind['wall_s']:7.2f}s ({kind['wall_s'] / total:4.0%})  "
+              f"{kind['stages']} stages, {kind['api_calls']} API calls, {kind['bytes']} bytes")
+    print(f"\n✓ Report: {os.path.join(run_dir, REPORT_FILE)}")
+    print(f"✓ Trace:  {os.path.join(run_dir, TRACE_FILE)} (chrome://tracing, Perfetto or speedscope)")
@@ -0,0 +1,332 @@
+"""
+Field provenance and freshness - where and when every stored fact came from
+Scrapers fetch through here so each page is logged with its URL, time and
+content hash (the body is archived under that hash for offline replay), and
+every field they save is tagged with that fetch; the refresh scheduler then
+re-runs only the sources whose facts are past TTL
+"""
+
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta
+import pandas as pd
+import requests
+
+from artifact_manifest import content_hash, file_hash
+from profiling import span
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+DB_FILE = "scrape_state.db"  # shared with scrape_checkpoints.py, kept out of the league database
+ARCHIVE_DIR = "page_archive"  # fetched bodies by sha256 (benchmark.py replays them)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Scraped sources: how long their facts stay fresh, the script that refreshes
+# them and the datasets it writes (file -> key columns identifying a row)
+SOURCE_POLICIES = [
+    {
+        "source": "fiba_standings",
+        "script": "scrape_elite16_standings.py",
+        "ttl": timedelta(minutes=1),
+        "datasets": {"elite16_standings_raw.csv": ["Group", "Team_Code"]},
+        "description": "Live Elite 16 standings"
+    },
+    {
+        "source": "fiba_elite16_stats",
+        "script": "scrape_elite16_team_stats.py",
+        "ttl": timedelta(minutes=15),
+        "datasets": {"elite16_team_stats_scraped.csv": ["code"],
+                     "elite16_team_games_scraped.csv": None},
+        "description": "Elite 16 team stats and game cards"
+    },
+    {
+        "source": "fiba_team_history",
+        "script": "historical_team_scraper.py",
+        "ttl": timedelta(hours=6),
+        "datasets": {"teams_overview.csv": ["team"],
+                     "tournament_appearances.csv": ["team", "tournament", "season"],
+                     "team_games_history.csv": ["team", "opponent", "date"]},
+        "description": "Road to BAL game cards and appearances"
+    },
+    {
+        "source": "wikipedia_qualification",
+        "script": "scrape_wikipedia_bal.py",
+        "ttl": timedelta(days=1),
+        "datasets": {"bal_2026_qualification_data.csv": ["Stage", "Team"]},
+        "description": "Qualification standings (Wikipedia)"
+    },
+    {
+        "source": "open_source_teams",
+        "script": "scrape_open_source_teams.py",
+        "ttl": timedelta(days=1),
+        "datasets": {"open_source_teams_data_summary.csv": ["Team"]},
+        "description": "First-time team coverage (Wikipedia, AfroBasket)"
+    },
+    {
+        "source": "bal_historical",
+        "script": "scrape_bal_nba_historical.py",
+        "ttl": timedelta(weeks=1),
+        "datasets": {},
+        "description": "Historical BAL seasons (bal.nba.com)"
+    },
+]
+
+# Hand-maintained files: provenance is the file itself (tagged when it changes)
+MANUAL_DATASETS = {
+    "manual_game_results.csv": ["Date", "Team_A", "Team_B"],
+    "comprehensive_team_profiles.csv": ["Team"],
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_fetches (
+    url        TEXT NOT NULL,
+    source     TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    page_hash  TEXT NOT NULL,
+    bytes      INTEGER,
+    PRIMARY KEY (url, fetched_at)
+);
+CREATE INDEX IF NOT EXISTS idx_fetches_source ON page_fetches(source, fetched_at);
+
+-- one row per stored fact; changed_at moves only when the value does
+CREATE TABLE IF NOT EXISTS field_provenance (
+    dataset    TEXT NOT NULL,
+    row_key    TEXT NOT NULL,
+    field      TEXT NOT NULL,
+    value      TEXT,
+    source     TEXT NOT NULL,
+    url        TEXT,
+    fetched_at TEXT NOT NULL,
+    page_hash  TEXT,
+    changed_at TEXT NOT NULL,
+    PRIMARY KEY (dataset, row_key, field)
+);
+CREATE INDEX IF NOT EXISTS idx_provenance_source ON field_provenance(source, fetched_at);
+"""
+
+POLICIES_BY_SOURCE = {policy["source"]: policy for policy in SOURCE_POLICIES}
+
+# Pages fetched by this process: url -> (fetched_at, page_hash); source -> last url
+_FETCHED = {}
+_LAST_URL = {}
+
+# -----------------------------------------------------------------
+# STORE
+# -----------------------------------------------------------------
+
+def connect(path=DB_FILE):
+    """Open the provenance tables (WAL mode, shared with the scrape checkpoints)"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+# -----------------------------------------------------------------
+# RECORDING FUNCTIONS
+# -----------------------------------------------------------------
+
+def fetch(url, source, timeout=15, path=DB_FILE, **request_kwargs):
+    """
+    requests.get that logs the fetch (url, time, sha256 of the body)
+
+    Raises like response.raise_for_status(); only successful fetches are
+    logged, so a failing source stays stale and is retried next refresh.
+    """
+    headers = request_kwargs.pop("headers", None) or {"User-Agent": USER_AGENT}
+    with span("fetch", url):
+        response = requests.get(url, headers=headers, timeout=timeout, **request_kwargs)
+    response.raise_for_status()
+
+    fetched_at, page_hash = _now(), content_hash(response.content)
+    archive_page(response.content, page_hash)
+    _FETCHED[url] = (fetched_at, page_hash)
+    _LAST_URL[source] = url
+    conn = connect(path)
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO page_fetches VALUES (?, ?, ?, ?, ?)",
+                     (url, source, fetched_at, page_hash, len(response.content)))
+    conn.close()
+    return response
+
+
+def archive_path(page_hash, archive_dir=ARCHIVE_DIR):
+    return os.path.join(archive_dir, page_hash[:2], page_hash)
+
+
+def archive_page(content, page_hash, archive_dir=ARCHIVE_DIR):
+    """Keep a fetched body under its hash (an unchanged page is stored once)"""
+    path = archive_path(page_hash, archive_dir)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(content)
+        os.replace(path + ".tmp", path)
+    return path
+
+
+def archived_pages(sources=None, archive_dir=ARCHIVE_DIR, path=DB_FILE):
+    """Distinct archived page versions: source, url, page hash and archive path (latest fetch first)"""
+    conn = connect(path)
+    df = pd.read_sql_query("""SELECT source, url, page_hash, MAX(fetched_at) AS fetched_at
+                              FROM page_fetches GROUP BY source, url, page_hash
+                              ORDER BY fetched_at DESC""", conn)
+    conn.close()
+    if sources is not None:
+        df = df[df["source"].isin(sources)]
+    df["path"] = [archive_path(page_hash, archive_dir) for page_hash in df["page_hash"]]
+    return df[df["path"].map(os.path.exists).astype(bool)].reset_index(drop=True)
+
+
+def _row_keys(df, keys):
+    if not keys:
+        return pd.Series(df.index.astype(str), index=df.index)
+    return df[keys].astype("string").fillna("").agg("|".join, axis=1)
+
+
+def _last_fetch(conn, url):
+    """(fetched_at, page_hash) of a url's latest logged fetch, this process first"""
+    if url in _FETCHED:
+        return _FETCHED[url]
+    row = conn.execute("SELECT fetched_at, page_hash FROM page_fetches WHERE url = ? "
+                       "ORDER BY fetched_at DESC LIMIT 1", (url,)).fetchone()
+    return tuple(row) if row else (None, None)
+
+
+def record_fields(df, dataset, source, keys=None, url=None, fetched_at=None, page_hash=None, path=DB_FILE):
+    """
+    Tag every field of a saved dataset with the fetch it came from
+
+    keys default to the source policy's key columns (row number if none).
+    url is one page for the whole dataset or a Series with each row's page;
+    it defaults to the last page this process fetched for the source. Fetch
+    time and hash come from that page's latest logged fetch (so rows reloaded
+    from a checkpoint keep their original fetch).
+    Returns the number of fields whose value changed.
+    """
+    if df.empty:
+        return 0
+    if keys is None:
+        keys = POLICIES_BY_SOURCE.get(source, {}).get("datasets", {}).get(dataset)
+    if not isinstance(url, pd.Series):
+        url = pd.Series(url or _LAST_URL.get(source), index=df.index, dtype="object")
+    urls = url.astype("object").where(url.notna(), None)
+
+    conn = connect(path)
+    fetches = {page: _last_fetch(conn, page) if page is not None else (None, None) for page in set(urls)}
+    stamps = [(page, fetched_at or fetches[page][0] or _now(), page_hash or fetches[page][1]) for page in urls]
+
+    fields = [column for column in df.columns if column not in (keys or [])]
+    values = df[fields].astype("string")
+    rows = [(dataset, row_key, field, value, source, page, stamp, digest, stamp)
+            for row_key, (page, stamp, digest), record in zip(_row_keys(df, keys), stamps,
+                                                               values.itertuples(index=False))
+            for field, value in zip(fields, (None if pd.isna(v) else v for v in record))]
+
+    with conn:
+        conn.execute("CREATE TEMP TABLE incoming AS SELECT * FROM field_provenance WHERE 0")
+        conn.executemany("INSERT INTO incoming VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        changed = conn.execute(
+            """SELECT COUNT(*) FROM incoming i LEFT JOIN field_provenance f USING (dataset, row_key, field)
+               WHERE f.value IS NOT i.value OR f.dataset IS NULL""").fetchone()[0]
+        conn.execute(
+            """INSERT INTO field_provenance SELECT * FROM incoming WHERE 1
+               ON CONFLICT(dataset, row_key, field) DO UPDATE SET
+                   source = excluded.source, url = excluded.url, fetched_at = excluded.fetched_at,
+                   page_hash = excluded.page_hash,
+                   changed_at = CASE WHEN value IS excluded.value THEN changed_at ELSE excluded.fetched_at END,
+                   value = excluded.value""")
+        conn.execute("DROP TABLE incoming")
+    conn.close()
+    return changed
+
+
+def record_manual(csv_file, keys=None, path=DB_FILE):
+    """Tag a hand-maintained file's fields (fetch time = file mtime, hash = file hash)"""
+    from schema_registry import read_table
+
+    if not os.path.exists(csv_file):
+        return 0
+    keys = keys if keys is not None else MANUAL_DATASETS.get(csv_file)
+    modified = datetime.fromtimestamp(os.path.getmtime(csv_file)).isoformat(timespec="seconds")
+    return record_fields(read_table(csv_file), csv_file, "manual", keys=keys, url=csv_file,
+                         fetched_at=modified, page_hash=file_hash(csv_file), path=path)
+
+# -----------------------------------------------------------------
+# FRESHNESS FUNCTIONS
+# -----------------------------------------------------------------
+
+def freshness(now=None, path=DB_FILE):
+    """Per source: last successful fetch, age, TTL and whether it is due"""
+    now = now or datetime.now()
+    conn = connect(path)
+    last = dict(conn.execute("SELECT source, MAX(fetched_at) FROM page_fetches GROUP BY source").fetchall())
+    facts = dict(conn.execute("SELECT source, COUNT(*) FROM field_provenance GROUP BY source").fetchall())
+    conn.close()
+
+    rows = []
+    for policy in SOURCE_POLICIES:
+        fetched = last.get(policy["source"])
+        age = now - datetime.fromisoformat(fetched) if fetched else None
+        rows.append({
+            "Source": policy["source"], "Script": policy["script"], "TTL": policy["ttl"],
+            "Last_Fetch": fetched, "Age": age, "Facts": facts.get(policy["source"], 0),
+            "Stale": age is None or age >= policy["ttl"]
+        })
+    return pd.DataFrame(rows)
+
+
+def stale_sources(now=None, path=DB_FILE):
+    """Policies whose facts are past TTL (never-fetched sources included)"""
+    due = freshness(now, path)
+    return [POLICIES_BY_SOURCE[source] for source in due.loc[due["Stale"], "Source"]]
+
+
+def refresh(now=None, dry_run=False, path=DB_FILE):
+    """Run the scraper of every stale source, nothing else; returns the sources run"""
+    due = stale_sources(now, path)
+    for policy in due:
+        print(f"  → {policy['source']}: {policy['script']}")
+        if not dry_run:
+            subprocess.run([sys.executable, policy["script"]], check=False)
+    for csv_file in MANUAL_DATASETS:
+        record_manual(csv_file, path=path)
+    return [policy["source"] for policy in due]
+
+
+def dataset_provenance(dataset, path=DB_FILE):
+    """Every tagged field of a dataset with its source, fetch time and page hash"""
+    conn = connect(path)
+    df = pd.read_sql_query("SELECT * FROM field_provenance WHERE dataset = ? ORDER BY row_key, field",
+                           conn, params=(dataset,))
+    conn.close()
+    return df
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("DATA FRESHNESS")
+    print("=" * 70)
+
+    if "--refresh" in sys.argv or "--dry-run" in sys.argv:
+        ran = refresh(dry_run="--dry-run" in sys.argv)
+        print(f"\n✓ {len(ran)} of {len(SOURCE_POLICIES)} sources past TTL"
+              + (" (dry run)" if "--dry-run" in sys.argv else " refreshed"))
+    else:
+        for csv_file in MANUAL_DATASETS:
+            print(f"✓ {csv_file}: {record_manual(csv_file)} fields changed since last tagged")
+
+    table = freshness()
+    table["TTL"] = table["TTL"].astype(str)
+    table["Age"] = table["Age"].map(lambda age: "never" if age is None or pd.isna(age) else str(age).split(".")[0])
+    print("\n" + table.to_string(index=False))
@@ -0,0 +1,319 @@
+"""
+Batch Elo rating engine over all scraped game results
+Replays every game in chronological batches with margin-aware updates
+and a home-court term, then predicts spreads for upcoming games
+"""
+
+import itertools
+import os
+import numpy as np
+import pandas as pd
+
+from game_results import load_game_results, load_team_countries
+from schema_registry import read_table, write_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+
+K_FACTOR = 20
+HOME_COURT_ELO = 100          # ~3.5 points of home advantage
+ELO_PER_POINT = 28            # Elo difference worth one point of spread
+SEASON_CARRYOVER = 0.75       # Share of rating kept between seasons
+INITIAL_RATING = 1450         # Teams outside the qualification data
+
+# Starting ratings from the prose tiers in create_team_profiles.py
+TIER_PRIORS = {
+    "Tier 1": 1600,
+    "Tier 2": 1525,
+    "Tier 3": 1475,
+}
+
+# Venue keyword -> country, used to detect home games
+VENUE_COUNTRIES = {
+    "Dar es Salaam": "Tanzania",
+    "Lusaka": "Zambia",
+    "Nairobi": "Kenya",
+    "Kampala": "Uganda",
+    "Johannesburg": "South Africa",
+    "Beira": "Mozambique",
+    "Maputo": "Mozambique",
+    "Lilongwe": "Malawi",
+    "Blantyre": "Malawi",
+}
+
+# Elite 16 group -> host country (NCT host Group A in Nairobi)
+ELITE16_HOST_COUNTRIES = {
+    "A": "Kenya",
+}
+
+# Group simulation: spread error (points, one SD) and places that advance
+SPREAD_SD = 11.0
+ADVANCE_PER_GROUP = 2
+SIMULATION_RUNS = 10000
+
+RATINGS_FILE = "team_ratings.csv"
+SPREADS_FILE = "predicted_spreads.csv"
+
+# -----------------------------------------------------------------
+# RATING FUNCTIONS
+# -----------------------------------------------------------------
+
+def load_tier_priors(csv_file="bal_2026_qualification_data.csv"):
+    """Team -> starting rating from the qualification tiers"""
+    if not os.path.exists(csv_file):
+        return {}
+    qual = read_table(csv_file, columns=["Team", "Tier"]).drop_duplicates("Team")
+    priors = qual["Tier"].map(TIER_PRIORS).astype(float)
+    return dict(zip(qual["Team"], priors.fillna(INITIAL_RATING)))
+
+
+def home_indicator(games, team_countries):
+    """+1 when Team_A plays in its own country, -1 for Team_B, 0 if neutral"""
+    venue_country = pd.Series(pd.NA, index=games.index, dtype="object")
+    venues = games["Venue"].fillna("").astype(str)
+    for keyword, country in VENUE_COUNTRIES.items():
+        venue_country = venue_country.mask(venues.str.contains(keyword, case=False, regex=False), country)
+
+    country_a = games["Team_A"].map(team_countries)
+    country_b = games["Team_B"].map(team_countries)
+    home_a = (country_a == venue_country).fillna(False).to_numpy(dtype=bool)
+    home_b = (country_b == venue_country).fillna(False).to_numpy(dtype=bool)
+    return home_a.astype(float) - home_b.astype(float)
+
+
+def expected_score(elo_diff):
+    """Win probability for the side with a rating edge of elo_diff"""
+    return 1.0 / (1.0 + 10.0 ** (-elo_diff / 400.0))
+
+
+def margin_multiplier(margin, winner_elo_diff):
+    """FiveThirtyEight-style margin of victory multiplier (damps favourites)"""
+    return (np.abs(margin) + 3.0) ** 0.8 / (7.5 + 0.006 * winner_elo_diff)
+
+
+def replay_ratings(games, priors=None, team_countries=None, k=K_FACTOR,
+                   home_elo=HOME_COURT_ELO, carryover=SEASON_CARRYOVER):
+    """
+    Re-rate the full game history
+
+    Games sharing a date form one batch: every game in the batch is rated
+    off the same pre-batch ratings, so a batch is a handful of numpy ops.
+    Returns (ratings Series, per-game DataFrame with pre-game ratings).
+    """
+    priors = priors or {}
+    team_countries = team_countries if team_countries is not None else {}
+
+    # Dense indices over the IDs of the teams that played; names come from
+    # the games themselves, so leagues outside the registry rate the same way
+    team_keys, first_seen, team_ids = np.unique(
+        np.concatenate([games["Team_A_ID"].to_numpy(int), games["Team_B_ID"].to_numpy(int)]),
+        return_index=True, return_inverse=True
+    )
+    names = np.concatenate([games["Team_A"].astype(str).to_numpy(), games["Team_B"].astype(str).to_numpy()])
+    teams = names[first_seen].tolist()
+    n_games = len(games)
+    idx_a, idx_b = team_ids[:n_games], team_ids[n_games:]
+
+    start = np.array([priors.get(t, INITIAL_RATING) for t in teams], dtype=float)
+    ratings = start.copy()
+    margin = (games["Score_A"] - games["Score_B"]).to_numpy(dtype=float)
+    home = home_indicator(games, team_countries)
+    outcome = np.where(margin > 0, 1.0, np.where(margin < 0, 0.0, 0.5))
+
+    pre_a = np.empty(n_games)
+    pre_b = np.empty(n_games)
+    deltas = np.empty(n_games)
+
+    # Batch boundaries: one batch per season + date, undated games open their season
+    seasons = games["Season"].astype(str).to_numpy()
+    batch = seasons + "|" + games["Date"].dt.strftime("%Y-%m-%d").fillna("").to_numpy(str)
+    bounds = np.flatnonzero(batch[1:] != batch[:-1]) + 1
+    current_season = seasons[0] if n_games else None
+
+    for rows in np.split(np.arange(n_games), bounds):
+        if len(rows) == 0:
+            continue
+        if seasons[rows[0]] != current_season:
+            ratings = start + carryover * (ratings - start)
+            current_season = seasons[rows[0]]
+
+        a, b = idx_a[rows], idx_b[rows]
+        ra, rb = ratings[a], ratings[b]
+        diff = ra - rb + home_elo * home[rows]
+        winner_diff = np.where(margin[rows] >= 0, diff, -diff)
+        delta = k * margin_multiplier(margin[rows], winner_diff) * (outcome[rows] - expected_score(diff))
+
+        pre_a[rows], pre_b[rows], deltas[rows] = ra, rb, delta
+        np.add.at(ratings, a, delta)
+        np.add.at(ratings, b, -delta)
+
+    history = games.assign(
+        Home=home,
+        Rating_A_Pre=pre_a.round(1),
+        Rating_B_Pre=pre_b.round(1),
+        Rating_Change_A=deltas.round(1)
+    )
+    return pd.Series(ratings, index=teams, name="Rating"), history
+
+
+def ratings_table(ratings, games):
+    """Current ratings with record and games rated"""
+    long = pd.concat([
+        pd.DataFrame({"Team": games["Team_A"], "Margin": games["Score_A"] - games["Score_B"]}),
+        pd.DataFrame({"Team": games["Team_B"], "Margin": games["Score_B"] - games["Score_A"]})
+    ])
+    record = long.groupby("Team")["Margin"].agg(
+        Games="size",
+        Wins=lambda m: int((m > 0).sum()),
+        Losses=lambda m: int((m < 0).sum()),
+        Avg_Margin="mean"
+    )
+    table = ratings.round(1).to_frame().join(record)
+    table["Avg_Margin"] = table["Avg_Margin"].round(1)
+    table = table.sort_values("Rating", ascending=False).rename_axis("Team").reset_index()
+    table.insert(0, "Rank", np.arange(1, len(table) + 1))
+    return table
+
+# -----------------------------------------------------------------
+# PREDICTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def predict_spread(ratings, team_a, team_b, home=0, home_elo=HOME_COURT_ELO):
+    """Predicted margin for team_a (positive = team_a favoured) and win probability"""
+    diff = ratings.get(team_a, INITIAL_RATING) - ratings.get(team_b, INITIAL_RATING) + home_elo * home
+    return round(diff / ELO_PER_POINT, 1), round(float(expected_score(diff)), 3)
+
+
+def load_upcoming_fixtures(games, team_countries):
+    """
+    Upcoming games: unplayed fixtures from elite16_all_games.csv when present,
+    otherwise the Elite 16 round robin from the qualification data
+    """
+    fixtures = load_game_results(include_unplayed=True)
+    fixtures = fixtures[(fixtures["Score_A"].fillna(0) == 0) & (fixtures["Score_B"].fillna(0) == 0)]
+    if not fixtures.empty:
+        return fixtures.assign(Home=home_indicator(fixtures, team_countries))
+
+    if not os.path.exists("bal_2026_qualification_data.csv"):
+        return pd.DataFrame(columns=["Group", "Team_A", "Team_B", "Home"])
+
+    qual = read_table("bal_2026_qualification_data.csv", columns=["Stage", "Team", "Group"])
+    elite16 = qual[qual["Stage"] == "Elite 16"]
+    rows = []
+    for group, group_teams in elite16.groupby("Group"):
+        host = ELITE16_HOST_COUNTRIES.get(group)
+        for team_a, team_b in itertools.combinations(group_teams["Team"], 2):
+            home = float(team_countries.get(team_a) == host) - float(team_countries.get(team_b) == host)
+            # Listed with the host side first for readability
+            if home < 0:
+                team_a, team_b, home = team_b, team_a, -home
+            rows.append({"Group": group, "Team_A": team_a, "Team_B": team_b, "Home": home})
+    return pd.DataFrame(rows)
+
+
+def predict_fixtures(ratings, fixtures):
+    """Predicted spreads for a fixtures table with Team_A, Team_B and Home"""
+    diff = (fixtures["Team_A"].map(ratings).fillna(INITIAL_RATING)
+            - fixtures["Team_B"].map(ratings).fillna(INITIAL_RATING)
+            + HOME_COURT_ELO * fixtures["Home"])
+    spread = (diff / ELO_PER_POINT).round(1)
+    favourite = fixtures["Team_A"].where(spread >= 0, fixtures["Team_B"])
+
+    predictions = fixtures[["Group", "Team_A", "Team_B"]].copy()
+    predictions["Rating_A"] = fixtures["Team_A"].map(ratings).fillna(INITIAL_RATING).round(1)
+    predictions["Rating_B"] = fixtures["Team_B"].map(ratings).fillna(INITIAL_RATING).round(1)
+    predictions["Home_Team"] = np.where(fixtures["Home"] > 0, fixtures["Team_A"],
+                                        np.where(fixtures["Home"] < 0, fixtures["Team_B"], "Neutral"))
+    predictions["Win_Prob_A"] = expected_score(diff).round(3)
+    predictions["Spread_A"] = spread
+    predictions["Favourite"] = favourite
+    predictions["Line"] = favourite + " -" + spread.abs().map("{:.1f}".format)
+    return predictions.reset_index(drop=True)
+
+
+def simulate_fixtures(ratings, fixtures, runs=SIMULATION_RUNS, seed=None,
+                      spread_sd=SPREAD_SD, advance=ADVANCE_PER_GROUP):
+    """
+    Monte Carlo of a fixtures table: each margin ~ Normal(spread, spread_sd)
+
+    Every run plays all the fixtures at once (one array per group); teams
+    are ranked on simulated wins, then point differential. Returns one
+    row per team with expected wins and group-win / advance probabilities.
+    """
+    predictions = predict_fixtures(ratings, fixtures)
+    rng = np.random.default_rng(seed)
+    margins = rng.normal(predictions["Spread_A"].to_numpy(), spread_sd, size=(runs, len(predictions)))
+
+    rows = []
+    for group, games in predictions.groupby("Group", sort=True):
+        teams = sorted(set(games["Team_A"]) | set(games["Team_B"]))
+        position = {team: i for i, team in enumerate(teams)}
+        wins = np.zeros((runs, len(teams)))
+        point_diff = np.zeros((runs, len(teams)))
+        for column, (team_a, team_b) in zip(games.index, zip(games["Team_A"], games["Team_B"])):
+            margin = margins[:, column]
+            wins[:, position[team_a]] += margin > 0
+            wins[:, position[team_b]] += margin <= 0
+            point_diff[:, position[team_a]] += margin
+            point_diff[:, position[team_b]] -= margin
+
+        # Rank 0 = group winner; a win outweighs any point differential
+        place = (-(wins * 10000 + point_diff)).argsort(axis=1).argsort(axis=1)
+        for team, i in position.items():
+            rows.append({
+                "Group": group, "Team": team,
+                "Rating": round(ratings.get(team, INITIAL_RATING), 1),
+                "Exp_Wins": round(wins[:, i].mean(), 2),
+                "Exp_PD": round(point_diff[:, i].mean(), 1),
+                "Win_Group_Pct": round((place[:, i] == 0).mean(), 3),
+                "Advance_Pct": round((place[:, i] < advance).mean(), 3),
+            })
+    table = pd.DataFrame(rows)
+    return table.sort_values(["Group", "Win_Group_Pct", "Exp_Wins"], ascending=[True, False, False],
+                             ignore_index=True)
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+
+def main():
+    print("=" * 70)
+    print("ELO RATING ENGINE - ALL HISTORICAL RESULTS")
+    print("=" * 70)
+
+    games = load_game_results()
+    team_countries = load_team_countries()
+    priors = load_tier_priors()
+    print(f"\n✓ Loaded {len(games)} completed games "
+          f"({games['Date'].dt.strftime('%Y-%m-%d').nunique()} date batches)")
+
+    ratings, history = replay_ratings(games, priors, team_countries)
+    table = ratings_table(ratings, games)
+    write_table(table, RATINGS_FILE)
+
+    print("\n" + "-" * 70)
+    print("CURRENT RATINGS")
+    print("-" * 70)
+    print(table.to_string(index=False))
+    print(f"\n✓ Saved: {RATINGS_FILE}")
+
+    fixtures = load_upcoming_fixtures(games, team_countries)
+    if fixtures.empty:
+        print("\n⚠️ No upcoming fixtures found")
+        return table, None
+
+    predictions = predict_fixtures(ratings, fixtures)
+    write_table(predictions, SPREADS_FILE)
+
+    print("\n" + "-" * 70)
+    print("PREDICTED SPREADS - UPCOMING GAMES")
+    print("-" * 70)
+    print(predictions[["Group", "Team_A", "Team_B", "Home_Team", "Win_Prob_A", "Line"]].to_string(index=False))
+    print(f"\n✓ Saved: {SPREADS_FILE}")
+
+    return table, predictions
+
+
+if __name__ == "__main__":
+    main()
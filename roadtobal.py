@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+"""
+roadtobal - one command for scraping, building, uploading and querying
+Subcommands import only the subsystem they drive: query reads the league
+database with sqlite3 alone (no pandas), scrape/parse/build/upload hand
+their stages to pipeline.py (requests/bs4 and gspread/google-auth load
+only inside the stages that use them), simulate loads the rating engine
+watch reruns the stages downstream of hand-edited files and gameday polls
+FIBA around scheduled games
+
+    python roadtobal.py query games NCT
+    python roadtobal.py build --dry-run
+    python roadtobal.py build --profile
+    python roadtobal.py upload upload_h2h_sheet
+    python roadtobal.py simulate --runs 20000 --seed 7
+    python roadtobal.py watch --offline
+    python roadtobal.py gameday
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import time
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+DB_FILE = "road_to_bal.db"  # league_db.DB_FILE - not imported, league_db loads pandas
+
+# Subcommand -> pipeline stage kinds it runs
+STAGE_COMMANDS = {
+    "scrape": {"kinds": ["scrape"], "help": "Re-scrape sources past their provenance TTL"},
+    "parse": {"kinds": ["parse", "clean"], "help": "Parse and clean scraped pages"},
+    "build": {"kinds": ["build"], "help": "Rebuild derived datasets whose inputs changed"},
+    "upload": {"kinds": ["upload"], "help": "Upload changed datasets to Google Sheets"},
+}
+
+# Read-only queries: name -> (help, argument names, SQL). <team> arguments
+# accept a code or a full name and are resolved against the teams table.
+QUERIES = {
+    "teams": ("Every team in the database", [],
+              "SELECT team_code, name, country, tier FROM teams ORDER BY team_id"),
+    "games": ("Every game a team played, from its own point of view", ["team"],
+              """SELECT game_date, stage, grp, team_b AS opponent, score_a AS pf, score_b AS pa, venue
+                 FROM games WHERE team_a_code = :team
+                 UNION ALL
+                 SELECT game_date, stage, grp, team_a, score_b, score_a, venue
+                 FROM games WHERE team_b_code = :team
+                 ORDER BY game_date"""),
+    "date": ("All games on one date (YYYY-MM-DD)", ["date"],
+             """SELECT game_date, stage, grp, team_a, score_a, score_b, team_b, venue
+                FROM games WHERE game_date = :date ORDER BY game_id"""),
+    "group": ("All games in a group", ["group"],
+              """SELECT game_date, stage, team_a, score_a, score_b, team_b, venue
+                 FROM games WHERE grp = :group ORDER BY game_date"""),
+    "standings": ("Latest standings snapshot", [],
+                  """SELECT s.grp, t.name, s.w, s.l, s.pf, s.pa, s.pd, s.pts, s.status
+                     FROM standings s JOIN teams t USING (team_code)
+                     WHERE snapshot_date = (SELECT MAX(snapshot_date) FROM standings)
+                     ORDER BY s.grp, s.pts DESC, s.pd DESC"""),
+    "players": ("Player rows for a team", ["team"],
+                """SELECT season, jersey, player, games, minutes, pts, orb + drb AS reb, ast, stl, blk, tov
+                   FROM player_game_stats WHERE team_code = :team ORDER BY pts DESC"""),
+    "notes": ("Commentary notes for a team", ["team"],
+              """SELECT category, note, created_at FROM commentary_notes
+                 WHERE team_code = :team ORDER BY note_id"""),
+}
+
+# -----------------------------------------------------------------
+# QUERY FUNCTIONS
+# -----------------------------------------------------------------
+
+def open_read_only(path=DB_FILE):
+    """Read-only connection to the league database (never creates or builds it)"""
+    if not os.path.exists(path):
+        sys.exit(f"{path} not found - build it first: python roadtobal.py build league_db")
+    return sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+
+
+def resolve_team(conn, team):
+    """Team code for a code or name (case-insensitive); exits if unknown"""
+    row = conn.execute("SELECT team_code FROM teams WHERE upper(team_code) = upper(?) "
+                       "OR lower(name) = lower(?)", (team, team)).fetchone()
+    if row is None:
+        sys.exit(f"Unknown team '{team}' - see: python roadtobal.py query teams")
+    return row[0]
+
+
+def print_rows(cursor):
+    """Rows as an aligned text table"""
+    headers = [column[0] for column in cursor.description]
+    rows = [["" if value is None else str(value) for value in row] for row in cursor.fetchall()]
+    widths = [max([len(header)] + [len(row[i]) for row in rows]) for i, header in enumerate(headers)]
+    print("  ".join(header.ljust(width) for header, width in zip(headers, widths)))
+    print("  ".join("-" * width for width in widths))
+    for row in rows:
+        print("  ".join(value.ljust(width) for value, width in zip(row, widths)))
+    print(f"\n✓ {len(rows)} rows")
+
+
+def cmd_query(args):
+    conn = open_read_only(args.db)
+    if args.query == "sql":
+        sql, params = " ".join(args.values), {}
+    else:
+        _, names, sql = QUERIES[args.query]
+        if len(args.values) != len(names):
+            sys.exit(f"query {args.query} takes: {' '.join(f'<{name}>' for name in names) or 'no arguments'}")
+        params = dict(zip(names, args.values))
+        if "team" in params:
+            params["team"] = resolve_team(conn, params["team"])
+    try:
+        print_rows(conn.execute(sql, params))
+    except sqlite3.Error as e:
+        sys.exit(f"Query failed: {e}")
+    finally:
+        conn.close()
+
+# -----------------------------------------------------------------
+# PIPELINE, SIMULATION, WATCH AND GAME-DAY FUNCTIONS
+# -----------------------------------------------------------------
+
+def cmd_stages(args):
+    from pipeline import STAGES, print_report, run
+    from profiling import load_report, new_run_dir, print_profile
+
+    kinds = STAGE_COMMANDS[args.command]["kinds"]
+    choices = [stage["name"] for stage in STAGES if stage["kind"] in kinds]
+    unknown = [name for name in args.stages if name not in choices]
+    if unknown:
+        sys.exit(f"Unknown {args.command} stages {unknown}; choose from {choices}")
+
+    run_dir = new_run_dir() if args.profile else None
+    started_at = time.perf_counter()
+    outcomes, timings = run(args.stages or None, kinds, force=args.force, dry_run=args.dry_run,
+                            workers=args.workers, profile_dir=run_dir)
+    print_report(outcomes, timings, time.perf_counter() - started_at, args.workers)
+    if run_dir:
+        print_profile(load_report(run_dir), run_dir)
+    if any(outcome == "failed" for outcome in outcomes.values()):
+        sys.exit(1)
+
+
+def cmd_simulate(args):
+    from game_results import load_game_results, load_team_countries
+    from rating_engine import (load_tier_priors, load_upcoming_fixtures, replay_ratings,
+                               simulate_fixtures)
+
+    games = load_game_results()
+    team_countries = load_team_countries()
+    ratings, _ = replay_ratings(games, load_tier_priors(), team_countries)
+    fixtures = load_upcoming_fixtures(games, team_countries)
+    if fixtures.empty:
+        sys.exit("No upcoming fixtures to simulate")
+
+    table = simulate_fixtures(ratings, fixtures, runs=args.runs, seed=args.seed)
+    print(f"{len(fixtures)} fixtures x {args.runs} runs\n")
+    print(table.to_string(index=False))
+    if args.output:
+        table.to_csv(args.output, index=False)
+        print(f"\n✓ Saved: {args.output}")
+
+
+def cmd_watch(args):
+    from watch import watch
+
+    watch(debounce=args.debounce, offline=args.offline, workers=args.workers, polling=args.poll)
+
+
+def cmd_gameday(args):
+    from gameday import gameday
+
+    gameday(offline=args.offline, workers=args.workers, once=args.once)
+
+# -----------------------------------------------------------------
+# COMMAND LINE
+# -----------------------------------------------------------------
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="roadtobal", description="Road to BAL data pipeline")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, spec in STAGE_COMMANDS.items():
+        sub = commands.add_parser(name, help=spec["help"])
+        sub.add_argument("stages", nargs="*", help="limit to these stages (and their upstream)")
+        sub.add_argument("--force", action="store_true", help="run even if current")
+        sub.add_argument("--dry-run", action="store_true", help="show what would run")
+        sub.add_argument("--profile", action="store_true", help="write a timing/memory/request report and trace")
+        sub.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))  # pipeline.DEFAULT_WORKERS
+        sub.set_defaults(handler=cmd_stages)
+
+    sub = commands.add_parser("simulate", help="Monte Carlo of the upcoming fixtures")
+    sub.add_argument("--runs", type=int, default=10000)
+    sub.add_argument("--seed", type=int)
+    sub.add_argument("--output", help="also save the table to this CSV")
+    sub.set_defaults(handler=cmd_simulate)
+
+    sub = commands.add_parser("watch", help="Rebuild and re-upload when hand-edited files change")
+    sub.add_argument("--debounce", type=float, default=2.0, help="quiet seconds before rebuilding")
+    sub.add_argument("--offline", action="store_true", help="rebuild only, no uploads")
+    sub.add_argument("--poll", action="store_true", help="poll mtimes instead of inotify")
+    sub.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    sub.set_defaults(handler=cmd_watch)
+
+    sub = commands.add_parser("gameday", help="Poll FIBA around scheduled games and push new results")
+    sub.add_argument("--offline", action="store_true", help="rebuild only, no uploads")
+    sub.add_argument("--once", action="store_true", help="poll once and exit")
+    sub.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    sub.set_defaults(handler=cmd_gameday)
+
+    query_help = "; ".join(f"{name}: {spec[0]}" for name, spec in QUERIES.items())
+    sub = commands.add_parser("query", help="Read-only lookups in the league database",
+                              description=query_help + "; sql: any read-only SELECT")
+    sub.add_argument("query", choices=[*QUERIES, "sql"])
+    sub.add_argument("values", nargs="*", help="query arguments (team code/name, date, group, SQL)")
+    sub.add_argument("--db", default=DB_FILE)
+    sub.set_defaults(handler=cmd_query)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Rolling form windows per team (last 3 / last 5 games)
+Each team keeps only its most recent games plus a running win streak,
+so appending a game is O(1) and "recent form" lines never rescan the log
+"""
+
+import json
+import os
+import pandas as pd
+
+from game_event_log import sync_from_sources, tail, state_at, state_to_games
+from game_results import game_key
+from schema_registry import write_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+FORM_WINDOWS = [3, 5]
+STATE_FILE = "rolling_form_state.json"
+OUTPUT_FILE = "team_rolling_form.csv"
+
+# -----------------------------------------------------------------
+# STATE FUNCTIONS
+# -----------------------------------------------------------------
+
+def new_state():
+    """Empty state: per-team recent games, the game keys already counted and the log position"""
+    return {"teams": {}, "seen": [], "log_offset": 0}
+
+
+def _team_entry(state, team):
+    return state["teams"].setdefault(team, {"recent": [], "games": 0, "streak": 0})
+
+
+def _append_result(entry, points_for, points_against, date):
+    """Push one result onto a team's window and roll its streak forward"""
+    entry["recent"].append({"pf": points_for, "pa": points_against, "date": date})
+    del entry["recent"][:-max(FORM_WINDOWS)]
+    entry["games"] += 1
+
+    streak = entry["streak"]
+    if points_for > points_against:
+        entry["streak"] = streak + 1 if streak > 0 else 1
+    elif points_for < points_against:
+        entry["streak"] = streak - 1 if streak < 0 else -1
+    else:
+        entry["streak"] = 0
+
+
+def _game_date(game):
+    return "" if pd.isna(game["Date"]) else game["Date"].strftime("%Y-%m-%d")
+
+
+def add_game(state, game, key, seen=None):
+    """Fold one game into both teams' windows (skipped if key was already counted)"""
+    seen = seen if seen is not None else set(state["seen"])
+    if key in seen:
+        return False
+
+    score_a, score_b = int(game["Score_A"]), int(game["Score_B"])
+    date = _game_date(game)
+    _append_result(_team_entry(state, game["Team_A"]), score_a, score_b, date)
+    _append_result(_team_entry(state, game["Team_B"]), score_b, score_a, date)
+
+    seen.add(key)
+    state["seen"].append(key)
+    return True
+
+
+def update_form(state, games):
+    """
+    Append only games not yet counted; returns the number of new games
+
+    Games are appended in date order; a late game dated before a team's
+    latest result needs a rebuild instead (see has_late_games).
+    """
+    seen = set(state["seen"])
+    games = games.sort_values(["Season", "Date"], kind="stable", na_position="first")
+    added = 0
+    for key, (_, game) in zip(game_key(games), games.iterrows()):
+        added += add_game(state, game, key, seen)
+    return added
+
+
+def has_late_games(state, games):
+    """True if a game predates a team's latest counted result (undated games count as earliest)"""
+    for _, game in games.iterrows():
+        date = _game_date(game)
+        for team in (game["Team_A"], game["Team_B"]):
+            recent = state["teams"].get(team, {}).get("recent")
+            if recent and date < recent[-1]["date"]:
+                return True
+    return False
+
+
+def build_form(games):
+    """Build fresh form state over a games table"""
+    state = new_state()
+    update_form(state, games)
+    return state
+
+
+def load_state(path=STATE_FILE):
+    """Load the persisted form state (empty if none saved yet)"""
+    if not os.path.exists(path):
+        return new_state()
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_FILE):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+
+# -----------------------------------------------------------------
+# OUTPUT FUNCTIONS
+# -----------------------------------------------------------------
+
+def streak_label(streak):
+    """+3 -> 'W3', -2 -> 'L2', 0 -> '-'"""
+    if streak > 0:
+        return f"W{streak}"
+    if streak < 0:
+        return f"L{-streak}"
+    return "-"
+
+
+def form_for(state, team):
+    """Rolling window figures for one team (empty dict if it has no games)"""
+    entry = state["teams"].get(team)
+    if entry is None:
+        return {}
+
+    form = {"Team": team, "GP": entry["games"], "Streak": streak_label(entry["streak"])}
+    for window in FORM_WINDOWS:
+        recent = entry["recent"][-window:]
+        n = len(recent)
+        points_for = sum(g["pf"] for g in recent)
+        points_against = sum(g["pa"] for g in recent)
+        wins = sum(g["pf"] > g["pa"] for g in recent)
+        form[f"Last{window}_GP"] = n
+        form[f"Last{window}_Record"] = f"{wins}-{n - wins}"
+        form[f"Last{window}_PPG"] = round(points_for / n, 1)
+        form[f"Last{window}_OppPPG"] = round(points_against / n, 1)
+        form[f"Last{window}_Margin"] = round((points_for - points_against) / n, 1)
+    return form
+
+
+def form_line(state, team, window=max(FORM_WINDOWS)):
+    """Commentary 'recent form' text, e.g. 'Last 5: 4-1 | 84.2 PPG | 70.1 Opp PPG | +14.1 | W3'"""
+    form = form_for(state, team)
+    if not form:
+        return "No games yet"
+    return (f"Last {form[f'Last{window}_GP']}: {form[f'Last{window}_Record']} | "
+            f"{form[f'Last{window}_PPG']} PPG | {form[f'Last{window}_OppPPG']} Opp PPG | "
+            f"{form[f'Last{window}_Margin']:+.1f} | {form['Streak']}")
+
+
+def to_dataframe(state):
+    """One row per team with every window"""
+    rows = [form_for(state, team) for team in sorted(state["teams"])]
+    return pd.DataFrame(rows)
+
+
+def refresh_form(output_file=OUTPUT_FILE, state_file=STATE_FILE):
+    """
+    Tail the game event log into the saved state and regenerate the CSV
+
+    Rebuilds from the current log state when an already-counted game was
+    corrected or retracted, or a new game is older than a team's latest.
+    """
+    state = load_state(state_file)
+    sync_from_sources()
+    games, changed, offset = tail(state.get("log_offset", 0))
+    if changed & set(state["seen"]) or has_late_games(state, games):
+        counted = len(state["seen"])
+        state = build_form(state_to_games(state_at()))
+        added = len(state["seen"]) - counted
+    else:
+        added = update_form(state, games)
+    state["log_offset"] = offset
+    save_state(state, state_file)
+
+    df = to_dataframe(state)
+    write_table(df, output_file)
+    return state, added
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("ROLLING FORM - LAST 3 / LAST 5 GAMES")
+    print("=" * 70)
+
+    form_state, new_games = refresh_form()
+
+    print(f"\n✓ {new_games} new games appended")
+    print(f"✓ {len(form_state['teams'])} teams tracked\n")
+    for team_name in sorted(form_state["teams"]):
+        print(f"  {team_name:<25} {form_line(form_state, team_name)}")
+    print(f"\n✓ Saved: {OUTPUT_FILE}")
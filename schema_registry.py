@@ -0,0 +1,328 @@
+"""
+Schema registry - declared column types for every CSV the pipeline reads
+Each dataset lists its (column, type) pairs, the sentinels that mean "no
+value" and which label columns are categorical, so loaders never fall
+back to type inference and "N/A" never turns a numeric column into text
+"""
+
+import os
+import pandas as pd
+
+from profiling import profiled
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+
+# Declared type -> pandas dtype used by read_csv
+PANDAS_TYPES = {
+    "string": "str",
+    "int": "Int64",            # always nullable, whether or not a column has gaps
+    "float": "float64",
+    "category": "category",    # low-cardinality labels (tier, stage, status...)
+}
+
+DEFAULT_NA_VALUES = ["", "N/A"]
+
+# CSV file -> declared columns (in file order) and NA sentinels
+SCHEMAS = {
+    "bal_2026_qualification_data.csv": {
+        "columns": [
+            ("Stage", "category"), ("Team", "string"), ("Tier", "category"),
+            ("Country", "category"), ("Group", "category"), ("Position", "string"),
+            ("Played", "int"), ("Won", "int"), ("Lost", "int"),
+            ("Points_For", "int"), ("Points_Against", "int"), ("Point_Diff", "int"),
+            ("Points", "int"), ("Qualification_Method", "string"), ("Status", "category"),
+        ]
+    },
+    "road_to_bal_2026_summary.csv": {
+        "columns": [
+            ("Team", "string"), ("Country", "category"), ("Tier", "category"),
+            ("Preliminary_Group", "category"), ("Stage", "category"),
+            ("Games_Played", "int"), ("Wins", "int"), ("Losses", "int"), ("Win_Pct", "float"),
+            ("Points_For", "int"), ("Points_Against", "int"), ("Point_Diff", "int"),
+            ("PPG", "float"), ("Opp_PPG", "float"),
+            ("Qualification_Status", "category"), ("Final_Position", "string"),
+            ("Notable_Results", "string"),
+        ]
+    },
+    "elite16_case_study_standings_current.csv": {
+        "columns": [
+            ("Team_Code", "string"), ("Team_Name", "string"), ("Group", "category"),
+            ("W", "int"), ("L", "int"), ("PF", "int"), ("PA", "int"), ("PD", "int"),
+            ("PTS", "int"), ("Status", "category"),
+        ]
+    },
+    "elite16_comprehensive_nct_fbe_bhb.csv": {
+        "columns": [
+            ("Team", "string"), ("Tier", "category"), ("Country", "category"),
+            ("Prelim_Group", "category"), ("Prelim_GP", "int"), ("Prelim_Wins", "int"),
+            ("Prelim_Losses", "int"), ("Prelim_PF", "int"), ("Prelim_PA", "int"),
+            ("Prelim_PD", "int"), ("Prelim_PPG", "float"),
+            ("Elite16_GP", "int"), ("Elite16_Wins", "int"), ("Elite16_Losses", "int"),
+            ("Elite16_PF", "int"), ("Elite16_PA", "int"), ("Elite16_PD", "int"),
+            ("Elite16_PPG", "float"), ("Elite16_OppPPG", "float"),
+            ("Total_GP", "int"), ("Total_Wins", "int"), ("Total_Losses", "int"),
+            ("Total_PF", "int"), ("Total_PA", "int"), ("Elite16_Games", "string"),
+            ("Last5_Record", "string"), ("Last5_PPG", "float"), ("Last5_OppPPG", "float"),
+            ("Last5_Margin", "float"), ("Streak", "string"),
+            ("Total_PD", "int"), ("Total_PPG", "float"), ("Total_Win_Pct", "float"),
+        ]
+    },
+    "elite16_nct_fbe_bhb_stats.csv": {
+        "columns": [
+            ("Team", "string"), ("Code", "string"), ("Tier", "category"),
+            ("Elite16_Group", "category"), ("Games_Played", "int"), ("Wins", "int"),
+            ("Losses", "int"), ("Win_Pct", "float"), ("Points_For", "int"),
+            ("Points_Against", "int"), ("Point_Diff", "int"), ("PPG", "float"),
+            ("Opp_PPG", "float"), ("Status", "category"), ("Notable_Games", "string"),
+        ]
+    },
+    "elite16_all_games.csv": {
+        # Date is "TBD" for fixtures not yet scheduled (read as NaT)
+        "columns": [
+            ("Game_ID", "int"), ("Group", "string"), ("Date", "date"),
+            ("Team_A_Code", "string"), ("Team_A", "string"), ("Score_A", "int"),
+            ("Team_B_Code", "string"), ("Team_B", "string"), ("Score_B", "int"),
+            ("Winner", "string"),
+        ]
+    },
+    "elite16_case_study_games_completed.csv": {
+        "columns": [
+            ("Date", "date"), ("Group", "string"),
+            ("Team_A_Code", "string"), ("Team_A", "string"), ("Score_A", "int"),
+            ("Team_B_Code", "string"), ("Team_B", "string"), ("Score_B", "int"),
+            ("Winner", "string"), ("Venue", "string"), ("Round", "string"),
+        ]
+    },
+    "manual_game_results.csv": {
+        "columns": [
+            ("Date", "date"), ("Season", "string"), ("Group", "string"),
+            ("Team_A_Code", "string"), ("Team_A", "string"), ("Score_A", "int"),
+            ("Team_B_Code", "string"), ("Team_B", "string"), ("Score_B", "int"),
+            ("Winner", "string"), ("Venue", "string"), ("Round", "string"),
+        ]
+    },
+    "team_games_history.csv": {
+        # score ("85-70") and date are display text from the team pages' game cards
+        "columns": [
+            ("team", "string"), ("opponent", "string"), ("score", "string"),
+            ("date", "string"), ("event_url", "string"),
+        ]
+    },
+    "head_to_head_results.csv": {
+        "columns": [
+            ("Team A", "string"), ("Team B", "string"), ("Result", "string"),
+            ("Margin", "int"), ("Date", "string"), ("Significance", "string"),
+            ("Series", "string"), ("Games", "int"), ("Avg_Margin", "float"),
+            ("Biggest_Win", "string"), ("Biggest_Win_Date", "string"),
+        ]
+    },
+    "nct_2025_bal_stats.csv": {
+        "columns": [("team", "string"), ("season", "string"), ("data", "string"), ("source", "category")],
+        "na_values": [""]
+    },
+    "nct_2025_player_stats_clean.csv": {
+        "columns": [
+            ("Jersey", "int"), ("Name", "string"), ("Games", "int"), ("MIN", "float"),
+            ("2PM", "int"), ("2PA", "int"), ("2P%", "float"),
+            ("3PM", "int"), ("3PA", "int"), ("3P%", "float"),
+            ("FTM", "int"), ("FTA", "int"), ("FT%", "float"),
+            ("ORB", "float"), ("DRB", "float"), ("REB", "float"), ("AST", "float"),
+            ("PF", "float"), ("STL", "float"), ("BLK", "float"), ("TO", "float"),
+            ("PTS", "float"), ("RNK", "float"),
+        ]
+    },
+    "nct_2025_summary_clean.csv": {
+        "columns": [
+            ("Team", "string"), ("Season", "string"), ("Games Played", "int"), ("Record", "string"),
+            ("PPG", "float"), ("Opp PPG", "float"), ("FG%", "float"), ("3P%", "float"),
+            ("FT%", "float"), ("RPG", "float"), ("APG", "float"), ("SPG", "float"),
+            ("BPG", "float"), ("TOV", "float"),
+        ]
+    },
+    "nct_2025_team_stats_clean.csv": {
+        "columns": [("Metric", "string"), ("Value", "float")]
+    },
+    "nct_2025_game_record_clean.csv": {
+        "columns": [
+            ("Competition", "string"), ("Total Games", "int"), ("Home Won", "int"),
+            ("Home Lost", "int"), ("Away Won", "int"), ("Away Lost", "int"),
+        ]
+    },
+    "partial_rosters.csv": {
+        # "TBD" jersey numbers are meaningful here, not missing values
+        "columns": [
+            ("Team", "string"), ("Player_Number", "string"), ("Player_Name", "string"),
+            ("Position", "category"), ("Height", "string"), ("Notes", "string"),
+            ("Data_Source", "category"),
+        ],
+        "na_values": [""]
+    },
+    "partial_stats.csv": {
+        # Value mixes numbers with "1-1", "50.0%" and "77-68 W" display text
+        "columns": [
+            ("Team", "string"), ("Category", "category"), ("Stat", "string"),
+            ("Value", "string"), ("Games", "int"), ("Source", "string"), ("Notes", "string"),
+        ]
+    },
+    "live_commentary_cards.csv": {
+        "columns": [
+            ("Team", "string"), ("Quick Stats", "string"), ("Star Fact", "string"),
+            ("Storyline", "string"), ("Key Matchup", "string"), ("Watch For", "string"),
+            ("Roster Status", "string"), ("Recent Form", "string"),
+        ]
+    },
+    "manual_commentary_points.csv": {
+        "columns": [
+            ("Team", "string"), ("Storyline", "string"), ("Point_Number", "int"),
+            ("Talking_Point", "string"),
+        ]
+    },
+    "comprehensive_team_profiles.csv": {
+        "columns": [
+            ("Team", "string"), ("Tier", "category"), ("Group", "category"), ("Country", "category"),
+            ("Narrative", "string"), ("BAL History", "string"), ("2026 Qualifier Status", "string"),
+            ("Key Stats", "string"), ("Top Players", "string"), ("Strengths", "string"),
+            ("Weaknesses", "string"), ("H2H Notes", "string"), ("X-Factor", "string"),
+            ("Storyline", "string"),
+        ]
+    },
+    "open_source_teams_manual_template.csv": {
+        "columns": [
+            ("Team", "string"), ("Country", "category"), ("League", "string"), ("Tier", "category"),
+            ("Data_Source", "string"), ("Roster_Available", "category"), ("Stats_Available", "category"),
+            ("Key_Info", "string"), ("Manual_Entry_Required", "category"), ("Commentary_Notes", "string"),
+        ]
+    },
+    "teams_roster_links.csv": {
+        "columns": [
+            ("team_name", "string"), ("team_code", "string"),
+            ("profile_url", "string"), ("team_slug", "string"),
+        ]
+    },
+    "case_study_teams_comprehensive_data.csv": {
+        "columns": [
+            ("team", "string"), ("table_index", "int"), ("row_data", "string"), ("source", "category"),
+        ],
+        "na_values": [""]
+    },
+    "scraping_summary_by_team.csv": {
+        "columns": [
+            ("Team", "string"), ("Total Records", "int"), ("RTB 2025", "int"), ("FIBA History", "int"),
+            ("BAL Teams", "int"), ("BAL Stats", "int"), ("Basketball24", "int"),
+        ]
+    },
+    # Load-test data from synthetic_league.py (written under synthetic_league/)
+    "synthetic_teams.csv": {
+        "columns": [
+            ("Team_ID", "int"), ("Team_Code", "string"), ("Team", "string"), ("Country", "category"),
+            ("City", "string"), ("Tier", "category"), ("Strength", "float"),
+        ]
+    },
+    "synthetic_games.csv": {
+        "columns": [
+            ("Game_ID", "int"), ("Date", "date"), ("Competition", "string"), ("Season", "string"),
+            ("Stage", "category"), ("Group", "string"),
+            ("Team_A_ID", "int"), ("Team_A_Code", "string"), ("Team_A", "string"), ("Score_A", "int"),
+            ("Team_B_ID", "int"), ("Team_B_Code", "string"), ("Team_B", "string"), ("Score_B", "int"),
+            ("Venue", "string"), ("Source", "category"),
+        ]
+    },
+    "synthetic_box_scores.csv": {
+        # Per-game lines of the player stats schema (no Games/RNK)
+        "columns": [
+            ("Game_ID", "int"), ("Season", "string"), ("Team_Code", "string"), ("Team", "string"),
+            ("Jersey", "int"), ("Name", "string"), ("MIN", "float"),
+            ("2PM", "int"), ("2PA", "int"), ("2P%", "float"),
+            ("3PM", "int"), ("3PA", "int"), ("3P%", "float"),
+            ("FTM", "int"), ("FTA", "int"), ("FT%", "float"),
+            ("ORB", "int"), ("DRB", "int"), ("REB", "int"), ("AST", "int"),
+            ("PF", "int"), ("STL", "int"), ("BLK", "int"), ("TO", "int"), ("PTS", "int"),
+        ]
+    },
+    "synthetic_play_by_play.csv": {
+        "columns": [
+            ("Game_ID", "int"), ("Event_Num", "int"), ("Period", "int"), ("Clock", "string"),
+            ("Team_Code", "string"), ("Jersey", "int"), ("Player", "string"), ("Event", "category"),
+            ("Points", "int"), ("Score_A", "int"), ("Score_B", "int"),
+        ]
+    },
+}
+
+# -----------------------------------------------------------------
+# SCHEMA FUNCTIONS
+# -----------------------------------------------------------------
+
+def schema_for(csv_file):
+    """Declared schema for a CSV (matched on file name), or None"""
+    return SCHEMAS.get(os.path.basename(csv_file))
+
+
+def schema_columns(csv_file):
+    """[(column, type), ...] in file order"""
+    return list(schema_for(csv_file)["columns"])
+
+
+def column_types(csv_file):
+    """{column: declared type} (empty for unregistered files)"""
+    schema = schema_for(csv_file)
+    return dict(schema["columns"]) if schema else {}
+
+
+def na_values(csv_file):
+    """Strings read as missing for this file"""
+    schema = schema_for(csv_file)
+    return list(schema.get("na_values", DEFAULT_NA_VALUES)) if schema else DEFAULT_NA_VALUES
+
+# -----------------------------------------------------------------
+# LOADING FUNCTIONS
+# -----------------------------------------------------------------
+
+@profiled("read", rows="in")
+def read_table(csv_file, columns=None, **read_csv_kwargs):
+    """
+    read_csv with the registry's dtypes, NA sentinels and date columns
+
+    Unregistered files fall back to plain read_csv. Integer columns are
+    always nullable Int64, so a column's dtype never depends on whether
+    this particular file happens to have gaps.
+    """
+    schema = schema_for(csv_file)
+    if schema is None:
+        df = pd.read_csv(csv_file, usecols=columns, **read_csv_kwargs)
+        return df[columns] if columns is not None else df
+
+    types = dict(schema["columns"])
+    wanted = columns if columns is not None else [column for column, _ in schema["columns"]]
+    dtypes = {column: PANDAS_TYPES[types[column]] for column in wanted
+              if column in types and types[column] != "date"}
+    dates = [column for column in wanted if types.get(column) == "date"]
+
+    df = pd.read_csv(csv_file, usecols=columns, dtype=dtypes, keep_default_na=False,
+                     na_values=na_values(csv_file), **read_csv_kwargs)
+    for column in dates:
+        df[column] = pd.to_datetime(df[column], errors="coerce")
+    return df[columns] if columns is not None else df
+
+
+@profiled("write", rows="out")
+def write_table(df, csv_file, **to_csv_kwargs):
+    """df.to_csv without the index, counted as rows written when profiling"""
+    df.to_csv(csv_file, index=False, **to_csv_kwargs)
+    return df
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("SCHEMA REGISTRY")
+    print("=" * 70)
+    for registered in SCHEMAS:
+        if not os.path.exists(registered):
+            print(f"  - {registered:<45} (not generated yet)")
+            continue
+        table = read_table(registered)
+        undeclared = sorted(set(pd.read_csv(registered, nrows=0).columns) - set(column_types(registered)))
+        kinds = table.dtypes.astype(str).value_counts().to_dict()
+        note = f"  undeclared: {undeclared}" if undeclared else ""
+        print(f"  ✓ {registered:<45} {len(table):>4} rows  {kinds}{note}")
@@ -8,13 +8,15 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 
+from team_registry import team_name
+
 # -----------------------------------------------------------------
 # CONFIGURATION - 7 Teams Case Study
 # -----------------------------------------------------------------
 
 TEAMS_CONFIG = {
     # GROUP A - Tier 1
-    "Nairobi City Thunder": {
+    team_name("NCT"): {
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Hosts - 2025 BAL debutants",
         "afrobasket_url": "https://basketball.afrobasket.com/team/Nairobi-City-Thunder/17638/Stats",
@@ -23,14 +25,14 @@ TEAMS_CONFIG = {
     },
     
     # GROUP A - Tier 2
-    "Namuwongo Blazers": {
+    team_name("NAM"): {
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Kingslayers - First Ugandan NBL title",
         "search_terms": ["Namuwongo", "Blazers"],
         "has_bal_history": False
     },
     
-    "Johannesburg Giants": {
+    team_name("JOH"): {
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Undefeated - Perfect 5-0 in qualifiers",
         "search_terms": ["Johannesburg", "Giants"],
@@ -40,7 +42,7 @@ TEAMS_CONFIG = {
     },
     
     # GROUP B - Tier 1
-    "Ferroviario Da Beira": {
+    team_name("FBE"): {
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Juggernaut - 2x BAL main (2022, 2023)",
         "fiba_url": "https://www.fiba.basketball/en/history/109-basketball-africa-league/208481/teams/ferroviario-da-beira",
@@ -50,7 +52,7 @@ TEAMS_CONFIG = {
     },
     
     # GROUP B - Tier 2
-    "Matero Magic": {
+    team_name("MMA"): {
         "tier": "Tier 2",
         "narrative": "The Road Warriors - Zambian champions",
         "search_terms": ["Matero", "Magic"],
@@ -60,7 +62,7 @@ TEAMS_CONFIG = {
     },
     
     # GROUP B - Tier 3
-    "Dar City": {
+    team_name("DAR"): {
         "tier": "Tier 3 (Dark Horse)",
         "narrative": "Star-Powered Unknown with elite talent",
         "search_terms": ["Dar City", "Dar"],
@@ -69,7 +71,7 @@ TEAMS_CONFIG = {
         "key_players": ["Solo Diabate", "Raphiael Putney"]
     },
     
-    "Bravehearts": {
+    team_name("BHB"): {
         "tier": "Tier 3",
         "narrative": "The Underdogs - 5x Malawian champions",
         "search_terms": ["Bravehearts", "Brave Hearts"],
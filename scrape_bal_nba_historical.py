@@ -3,6 +3,10 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 
+from provenance import fetch
+
+PROVENANCE_SOURCE = "bal_historical"
+
 def scrape_bal_nba_teams():
     """
     Scrape team data from BAL.NBA.com
@@ -11,17 +15,12 @@ def scrape_bal_nba_teams():
     print("SCRAPING BAL.NBA.COM FOR HISTORICAL TEAMS")
     print("=" * 80)
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     # BAL teams page
     teams_url = "https://bal.nba.com/teams"
     print(f"\n1. Fetching teams list: {teams_url}")
     
     try:
-        response = requests.get(teams_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = fetch(teams_url, PROVENANCE_SOURCE)
         soup = BeautifulSoup(response.content, 'html.parser')
         
         # Save HTML
@@ -51,8 +50,7 @@ def scrape_bal_nba_teams():
                 print(f"    Fetching team page...")
                 
                 try:
-                    team_response = requests.get(team_url, headers=headers, timeout=15)
-                    team_response.raise_for_status()
+                    team_response = fetch(team_url, PROVENANCE_SOURCE)
                     team_soup = BeautifulSoup(team_response.content, 'html.parser')
                     
                     # Save team page
@@ -81,8 +79,7 @@ def scrape_bal_nba_teams():
     print(f"\n2. Fetching statistics page: {stats_url}")
     
     try:
-        response = requests.get(stats_url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = fetch(stats_url, PROVENANCE_SOURCE)
         soup = BeautifulSoup(response.content, 'html.parser')
         
         # Save HTML
@@ -108,22 +105,21 @@ def scrape_bal_nba_teams():
         print(f"\n3. Trying BAL {season} season: {season_url}")
         
         try:
-            response = requests.get(season_url, headers=headers, timeout=15)
-            if response.status_code == 200:
-                print(f"  ✓ Page exists!")
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Save HTML
-                with open(f'bal_nba_season_{season}.html', 'w', encoding='utf-8') as f:
-                    f.write(soup.prettify())
-                print(f"  ✓ Saved to bal_nba_season_{season}.html")
-                
-                # Look for Ferroviario
-                page_text = soup.get_text()
-                if 'Ferroviario' in page_text or 'Beira' in page_text:
-                    print(f"  ✓ Ferroviario found in {season} season!")
-            else:
-                print(f"  ✗ {response.status_code}")
+            response = fetch(season_url, PROVENANCE_SOURCE)
+            print(f"  ✓ Page exists!")
+            soup = BeautifulSoup(response.content, 'html.parser')
+            
+            # Save HTML
+            with open(f'bal_nba_season_{season}.html', 'w', encoding='utf-8') as f:
+                f.write(soup.prettify())
+            print(f"  ✓ Saved to bal_nba_season_{season}.html")
+            
+            # Look for Ferroviario
+            page_text = soup.get_text()
+            if 'Ferroviario' in page_text or 'Beira' in page_text:
+                print(f"  ✓ Ferroviario found in {season} season!")
+        except requests.exceptions.HTTPError as e:
+            print(f"  ✗ {e.response.status_code}")
         except Exception as e:
             print(f"  ✗ Error: {e}")
         
@@ -0,0 +1,123 @@
+"""
+Scrape checkpoints - resume long scrapes from the last finished unit
+Scrapers that loop over teams or sources save each unit's results to the
+store as soon as it finishes; after a crash or Ctrl+C the next run reloads
+those units and only scrapes the rest, until the run is marked finished
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+DB_FILE = "scrape_state.db"  # same store as provenance.py
+
+SCHEMA = """
+-- one row per scraper; finished_at stays NULL while a run can be resumed
+CREATE TABLE IF NOT EXISTS scrape_runs (
+    scraper     TEXT PRIMARY KEY,
+    started_at  TEXT NOT NULL,
+    finished_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+    scraper      TEXT NOT NULL,
+    unit         TEXT NOT NULL,
+    position     INTEGER NOT NULL,
+    payload      TEXT NOT NULL,
+    completed_at TEXT NOT NULL,
+    PRIMARY KEY (scraper, unit)
+);
+"""
+
+# -----------------------------------------------------------------
+# STORE
+# -----------------------------------------------------------------
+
+def connect(path=DB_FILE):
+    """Open the checkpoint tables (WAL mode, shared with provenance.py)"""
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _json_default(value):
+    """numpy scalars (from pandas rows) -> Python values"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+# -----------------------------------------------------------------
+# CHECKPOINT FUNCTIONS
+# -----------------------------------------------------------------
+
+def resume_run(scraper, restart=False, path=DB_FILE):
+    """
+    Units already finished by the scraper's unfinished run: {unit: payload}
+
+    Starts a new run (dropping old checkpoints) when the last run finished,
+    none exists, or restart is set.
+    """
+    conn = connect(path)
+    with conn:
+        run = conn.execute("SELECT finished_at FROM scrape_runs WHERE scraper = ?", (scraper,)).fetchone()
+        if run is None or run[0] is not None or restart:
+            conn.execute("DELETE FROM scrape_checkpoints WHERE scraper = ?", (scraper,))
+            conn.execute("INSERT OR REPLACE INTO scrape_runs VALUES (?, ?, NULL)", (scraper, _now()))
+            done = {}
+        else:
+            rows = conn.execute("SELECT unit, payload FROM scrape_checkpoints WHERE scraper = ? "
+                                "ORDER BY position", (scraper,)).fetchall()
+            done = {unit: json.loads(payload) for unit, payload in rows}
+    conn.close()
+    return done
+
+
+def checkpoint(scraper, unit, payload, position=0, path=DB_FILE):
+    """Save one finished unit's results (JSON-serializable) in its own transaction"""
+    conn = connect(path)
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO scrape_checkpoints VALUES (?, ?, ?, ?, ?)",
+                     (scraper, unit, position, json.dumps(payload, default=_json_default), _now()))
+    conn.close()
+
+
+def finish_run(scraper, path=DB_FILE):
+    """Mark the run complete once its outputs are written (the next run starts fresh)"""
+    conn = connect(path)
+    with conn:
+        conn.execute("UPDATE scrape_runs SET finished_at = ? WHERE scraper = ?", (_now(), scraper))
+    conn.close()
+
+
+def run_status(path=DB_FILE):
+    """Per scraper: started, finished (None while resumable) and units checkpointed"""
+    conn = connect(path)
+    rows = conn.execute("""SELECT r.scraper, r.started_at, r.finished_at, COUNT(c.unit)
+                           FROM scrape_runs r LEFT JOIN scrape_checkpoints c USING (scraper)
+                           GROUP BY r.scraper ORDER BY r.scraper""").fetchall()
+    conn.close()
+    return [{"Scraper": scraper, "Started": started, "Finished": finished, "Units": units}
+            for scraper, started, finished, units in rows]
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("SCRAPE CHECKPOINTS")
+    print("=" * 70)
+
+    runs = run_status()
+    if not runs:
+        print("\nNo checkpointed scrapes yet")
+    for run in runs:
+        state = f"finished {run['Finished']}" if run["Finished"] else "resumable"
+        print(f"\n{run['Scraper']}: started {run['Started']}, {state}, {run['Units']} units checkpointed")
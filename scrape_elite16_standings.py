@@ -3,6 +3,11 @@ from bs4 import BeautifulSoup
 import pandas as pd
 import time
 
+from provenance import fetch, record_fields
+from team_registry import CASE_STUDY_CODES, team_name
+
+PROVENANCE_SOURCE = "fiba_standings"
+
 def scrape_elite16_standings():
     """
     Scrape Road to BAL 2026 Elite 16 standings from FIBA website
@@ -13,26 +18,13 @@ def scrape_elite16_standings():
     
     print(f"Fetching data from: {url}")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
+        response = fetch(url, PROVENANCE_SOURCE)
         
         soup = BeautifulSoup(response.content, 'html.parser')
         
         # Case study teams mapping
-        case_study_teams = {
-            'NCT': 'Nairobi City Thunder',
-            'NAM': 'Namuwongo Blazers',
-            'JOH': 'Johannesburg Giants',
-            'FBE': 'Ferroviario Da Beira',
-            'MMA': 'Matero Magic',
-            'DAR': 'Dar City',
-            'BHB': 'Bravehearts'
-        }
+        case_study_teams = {code: team_name(code) for code in CASE_STUDY_CODES}
         
         all_standings = []
         
@@ -151,6 +143,7 @@ def scrape_elite16_standings():
             # Save to CSV
             output_file = 'elite16_standings_raw.csv'
             df.to_csv(output_file, index=False)
+            record_fields(df, output_file, PROVENANCE_SOURCE)
             print(f"\n✓ Saved to {output_file}")
             return df
         else:
@@ -3,29 +3,33 @@ Scrape Elite 16 stats and records for NCT, Ferroviario Da Beira, and Bravehearts
 from the FIBA Road to BAL 2026 Elite 16 tournament
 """
 
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import json
 import time
 
+from provenance import fetch, record_fields
+from team_registry import team_code, team_name
+
+PROVENANCE_SOURCE = "fiba_elite16_stats"
+
 # Target teams for Elite 16 data collection
 TARGET_TEAMS = {
     "nairobi-city-thunder": {
-        "name": "Nairobi City Thunder",
-        "code": "NCT",
+        "name": team_name("nairobi-city-thunder"),
+        "code": team_code("nairobi-city-thunder"),
         "tier": "Tier 1",
         "group": "Group A"
     },
     "ferroviario-da-beira": {
-        "name": "Ferroviario Da Beira",
-        "code": "FBE",
+        "name": team_name("ferroviario-da-beira"),
+        "code": team_code("ferroviario-da-beira"),
         "tier": "Tier 1", 
         "group": "Group B"
     },
     "bravehearts-basketball-club": {
-        "name": "Bravehearts",
-        "code": "BHB",
+        "name": team_name("bravehearts-basketball-club"),
+        "code": team_code("bravehearts-basketball-club"),
         "tier": "Tier 3",
         "group": "Group B"
     }
@@ -45,12 +49,7 @@ URLS = {
 def get_page(url):
     """Fetch page with error handling"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        return response.text
+        return fetch(url, PROVENANCE_SOURCE, timeout=10).text
     except Exception as e:
         print(f"  ❌ Error fetching {url}: {e}")
         return None
@@ -239,12 +238,14 @@ def scrape_elite16_stats():
     if all_stats:
         df_stats = pd.DataFrame(all_stats)
         df_stats.to_csv("elite16_team_stats_scraped.csv", index=False)
+        record_fields(df_stats, "elite16_team_stats_scraped.csv", PROVENANCE_SOURCE)
         print(f"\n✓ Team Stats: elite16_team_stats_scraped.csv ({len(df_stats)} teams)")
         print(df_stats)
     
     if all_games:
         df_games = pd.DataFrame(all_games)
         df_games.to_csv("elite16_team_games_scraped.csv", index=False)
+        record_fields(df_games, "elite16_team_games_scraped.csv", PROVENANCE_SOURCE)
         print(f"\n✓ Team Games: elite16_team_games_scraped.csv ({len(df_games)} games)")
     
     print("\n" + "="*70)
@@ -9,30 +9,16 @@ import pandas as pd
 import time
 import re
 
+from team_registry import CASE_STUDY_NAMES, search_terms
+
 # -----------------------------------------------------------------
 # CONFIGURATION - Case Study Teams
 # -----------------------------------------------------------------
 
-CASE_STUDY_TEAMS = [
-    "Nairobi City Thunder",
-    "Namuwongo Blazers", 
-    "Johannesburg Giants",
-    "Ferroviario Da Beira",
-    "Matero Magic",
-    "Dar City",
-    "Bravehearts"
-]
+CASE_STUDY_TEAMS = CASE_STUDY_NAMES
 
 # Alternative name variations for matching
-TEAM_VARIATIONS = {
-    "Ferroviario Da Beira": ["Ferroviario", "Beira", "Ferroviário", "FBE"],
-    "Nairobi City Thunder": ["NCT", "Nairobi", "Thunder"],
-    "Namuwongo Blazers": ["Namuwongo", "Blazers"],
-    "Johannesburg Giants": ["Johannesburg", "Giants", "JHB"],
-    "Matero Magic": ["Matero", "Magic"],
-    "Dar City": ["Dar", "Dar City"],
-    "Bravehearts": ["Bravehearts", "Brave Hearts", "BRA"]
-}
+TEAM_VARIATIONS = {team: search_terms(team) for team in CASE_STUDY_TEAMS}
 
 DATA_SOURCES = {
     "rtb_2025": "https://www.fiba.basketball/en/events/fiba-africa-champions-clubs-road-to-bal-2025",
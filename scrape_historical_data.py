@@ -11,6 +11,8 @@ from bs4 import BeautifulSoup
 import time
 import re
 
+from team_registry import team_code, team_name
+
 # -----------------------------------------------------------------
 # 1. CONFIGURATION
 # -----------------------------------------------------------------
@@ -20,53 +22,53 @@ BASE_URL = "https://www.fiba.basketball"
 TARGET_TEAMS = {
     # Group A
     "nairobi-city-thunder": {
-        "name": "Nairobi City Thunder",
-        "short": "NCT",
+        "name": team_name("nairobi-city-thunder"),
+        "short": team_code("nairobi-city-thunder"),
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Hosts - 2025 BAL debutants",
         "afrobasket_id": "17638",
         "bal_2025": True
     },
     "namuwongo-blazers": {
-        "name": "Namuwongo Blazers",
-        "short": "NAM",
+        "name": team_name("namuwongo-blazers"),
+        "short": team_code("namuwongo-blazers"),
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Kingslayers - First Ugandan NBL title",
         "bal_history": False
     },
     "johannesburg-giants": {
-        "name": "Johannesburg Giants",
-        "short": "JHG",
+        "name": team_name("johannesburg-giants"),
+        "short": team_code("johannesburg-giants"),
         "tier": "Tier 2 (New Guard)",
         "narrative": "The Undefeated - Perfect 5-0 in qualifiers",
         "preliminary_group": "E"
     },
     # Group B
     "ferroviario-da-beira": {
-        "name": "Ferroviario Da Beira",
-        "short": "FBE",
+        "name": team_name("ferroviario-da-beira"),
+        "short": team_code("ferroviario-da-beira"),
         "tier": "Tier 1 (BAL Vet)",
         "narrative": "The Juggernaut - 2x BAL main (2022, 2023)",
         "bal_2023": True,
         "fiba_history_id": "208481"
     },
     "matero-magic": {
-        "name": "Matero Magic",
-        "short": "MAT",
+        "name": team_name("matero-magic"),
+        "short": team_code("matero-magic"),
         "tier": "Tier 2",
         "narrative": "The Road Warriors - Zambian champions",
         "preliminary_group": "Various"
     },
     "dar-city": {
-        "name": "Dar City",
-        "short": "DAR",
+        "name": team_name("dar-city"),
+        "short": team_code("dar-city"),
         "tier": "Tier 3 (Dark Horse)",
         "narrative": "Star-Powered Unknown with elite talent",
         "preliminary_group": "D"
     },
     "bravehearts-basketball-club": {
-        "name": "Bravehearts Basketball Club",
-        "short": "BRA",
+        "name": team_name("bravehearts-basketball-club"),
+        "short": team_code("bravehearts-basketball-club"),
         "tier": "Tier 3",
         "narrative": "The Underdogs - 5x Malawian champions"
     }
@@ -315,7 +317,7 @@ def scrape_fbeira_2023_bal_stats():
                 
                 if row_data and len(row_data) > 1:
                     stats.append({
-                        "team": "Ferroviario Da Beira",
+                        "team": team_name("FBE"),
                         "season": "2023 BAL",
                         "data": " | ".join(row_data),
                         "source": "FIBA History"
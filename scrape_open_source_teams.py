@@ -4,13 +4,17 @@ Targets multiple sources: Wikipedia, AfroBasket, Basketball Reference, news site
 Fetches, cleans, and validates data for live commentary and stats
 """
 
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
+import sys
 import time
 from datetime import datetime
 
+from data_validator import coverage_quality
+from provenance import fetch, record_fields
+from scrape_checkpoints import checkpoint, finish_run, resume_run
+
 # Target teams
 TEAMS = {
     "namuwongo-blazers": {
@@ -43,6 +47,15 @@ TEAMS = {
     }
 }
 
+# Scraped fields that count as a checked source (see validate_team_data)
+PROVENANCE_SOURCE = "open_source_teams"
+CHECKPOINT_NAME = "scrape_open_source_teams"
+
+# Discard checkpoints from an interrupted run and scrape every team again
+RESTART = "--restart" in sys.argv
+
+COVERAGE_SOURCES = ["wikipedia_mentions", "afrobasket_links"]
+
 # Data sources
 DATA_SOURCES = {
     "wikipedia_uganda": "https://en.wikipedia.org/wiki/National_Basketball_League_(Uganda)",
@@ -57,12 +70,7 @@ DATA_SOURCES = {
 def get_page(url):
     """Fetch page with error handling"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        return response.text
+        return fetch(url, PROVENANCE_SOURCE).text
     except Exception as e:
         print(f"  ❌ Error fetching {url}: {e}")
         return None
@@ -217,57 +225,26 @@ def extract_player_data(html, team_info):
     return players
 
 def validate_team_data(data):
-    """Validate and clean scraped data"""
+    """Count scraped sources/players and grade them (rules live in data_validator)"""
     validated = {
         "team": data.get("team", "Unknown"),
         "country": data.get("country", "Unknown"),
         "league": data.get("league", "Unknown"),
-        "data_quality": "Unknown",
-        "sources_checked": 0,
-        "sources_with_data": 0,
-        "players_found": 0,
-        "stats_available": False,
-        "recommendations": []
+        "sources_checked": sum(key in data for key in COVERAGE_SOURCES),
+        "sources_with_data": sum(bool(data.get(key)) for key in COVERAGE_SOURCES),
+        "players_found": len(data.get("players", [])),
     }
-    
-    # Count sources
-    if "wikipedia_mentions" in data:
-        validated["sources_checked"] += 1
-        if data["wikipedia_mentions"]:
-            validated["sources_with_data"] += 1
-    
-    if "afrobasket_links" in data:
-        validated["sources_checked"] += 1
-        if data["afrobasket_links"]:
-            validated["sources_with_data"] += 1
-    
-    if "players" in data:
-        validated["players_found"] = len(data["players"])
-        if validated["players_found"] > 0:
-            validated["stats_available"] = True
-    
-    # Determine data quality
-    if validated["sources_with_data"] >= 2 and validated["players_found"] >= 5:
-        validated["data_quality"] = "Good"
-    elif validated["sources_with_data"] >= 1 or validated["players_found"] >= 3:
-        validated["data_quality"] = "Fair"
-    else:
-        validated["data_quality"] = "Poor"
-    
-    # Generate recommendations
-    if validated["data_quality"] == "Poor":
-        validated["recommendations"].append("Manual data entry required")
-        validated["recommendations"].append(f"Contact {data.get('country')} Basketball Federation")
-        validated["recommendations"].append("Check local news sites and sports media")
-    
-    if validated["players_found"] == 0:
-        validated["recommendations"].append("Search for team roster on social media")
-        validated["recommendations"].append("Check recent game lineups")
-    
-    if not validated["stats_available"]:
-        validated["recommendations"].append("Manual stat tracking during live games")
-        validated["recommendations"].append("Use Elite 16 official stats when available")
-    
+    validated["stats_available"] = validated["players_found"] > 0
+    
+    summary = pd.DataFrame([{
+        "Country": data.get("country"),
+        "Sources_With_Data": validated["sources_with_data"],
+        "Players_Found": validated["players_found"],
+        "Stats_Available": validated["stats_available"]
+    }])
+    grade = coverage_quality(summary).iloc[0]
+    validated["data_quality"] = grade["Data_Quality"]
+    validated["recommendations"] = grade["Recommendations"]
     return validated
 
 def scrape_team_comprehensive(slug, team_info):
@@ -316,7 +293,7 @@ def scrape_team_comprehensive(slug, team_info):
     
     return all_data
 
-def main():
+def main(restart=RESTART):
     print("\n" + "="*70)
     print("OPEN-SOURCE DATA SCRAPER FOR FIRST-TIME TEAMS")
     print("="*70)
@@ -329,10 +306,19 @@ def main():
     print("="*70)
     
     all_teams_data = []
-    
-    for slug, team_info in TEAMS.items():
+    done = resume_run(CHECKPOINT_NAME, restart)
+    if done:
+        print(f"\nResuming: {len(done)} of {len(TEAMS)} teams already checkpointed")
+    
+    for position, (slug, team_info) in enumerate(TEAMS.items()):
+        if slug in done:
+            all_teams_data.append(done[slug])
+            print(f"\n✓ {team_info['name']} - from checkpoint")
+            continue
+        
         team_data = scrape_team_comprehensive(slug, team_info)
         all_teams_data.append(team_data)
+        checkpoint(CHECKPOINT_NAME, slug, team_data, position)
         
         print(f"\n{'='*70}")
         print(f"VALIDATION RESULTS: {team_info['name']}")
@@ -371,6 +357,8 @@ def main():
     
     df_summary = pd.DataFrame(summary_data)
     df_summary.to_csv("open_source_teams_data_summary.csv", index=False)
+    record_fields(df_summary, "open_source_teams_data_summary.csv", PROVENANCE_SOURCE)
+    finish_run(CHECKPOINT_NAME)
     
     print("\n" + "="*70)
     print("SCRAPING COMPLETE")
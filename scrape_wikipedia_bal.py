@@ -3,26 +3,29 @@ Scrape Road to BAL 2026 qualification data from Wikipedia
 Wikipedia has complete static HTML tables with all the data we need
 """
 
-import requests
 import pandas as pd
 from bs4 import BeautifulSoup
 import time
 
+from provenance import fetch, record_fields
+from team_registry import team_name
+
 # -----------------------------------------------------------------
 # CONFIGURATION
 # -----------------------------------------------------------------
 
 TARGET_TEAMS = {
-    "Nairobi City Thunder": {"tier": "Tier 1", "group": "Finals Group A"},
-    "Namuwongo Blazers": {"tier": "Tier 2", "group": "Finals Group A"},
-    "Johannesburg Giants": {"tier": "Tier 2", "group": "Finals Group A"},
-    "Ferroviario Da Beira": {"tier": "Tier 1", "group": "Finals Group B"},
-    "Matero Magic": {"tier": "Tier 2", "group": "Finals Group B"},
-    "Dar City": {"tier": "Tier 3", "group": "Finals Group B"},
-    "Bravehearts": {"tier": "Tier 3", "group": "Finals Group B"},
+    team_name("NCT"): {"tier": "Tier 1", "group": "Finals Group A"},
+    team_name("NAM"): {"tier": "Tier 2", "group": "Finals Group A"},
+    team_name("JOH"): {"tier": "Tier 2", "group": "Finals Group A"},
+    team_name("FBE"): {"tier": "Tier 1", "group": "Finals Group B"},
+    team_name("MMA"): {"tier": "Tier 2", "group": "Finals Group B"},
+    team_name("DAR"): {"tier": "Tier 3", "group": "Finals Group B"},
+    team_name("BHB"): {"tier": "Tier 3", "group": "Finals Group B"},
 }
 
 WIKIPEDIA_URL = "https://en.wikipedia.org/wiki/2026_BAL_qualification"
+PROVENANCE_SOURCE = "wikipedia_qualification"
 
 # -----------------------------------------------------------------
 # SCRAPING FUNCTIONS
@@ -36,81 +39,80 @@ def scrape_wikipedia_bal_qualification():
     print(f"\nURL: {WIKIPEDIA_URL}\n")
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(WIKIPEDIA_URL, headers=headers, timeout=15)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        
+        response = fetch(WIKIPEDIA_URL, PROVENANCE_SOURCE)
         print("✓ Page loaded successfully\n")
+        return parse_qualification_page(response.text)
+    
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        return []
+
+def parse_qualification_page(html):
+    """Standings rows for the target teams from the qualification page's wikitables"""
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # Extract all tables
+    tables = soup.find_all("table", class_="wikitable")
+    print(f"Found {len(tables)} wikitables\n")
+    
+    all_standings = []
+    all_results = []
+    
+    # Process each table
+    for table_idx, table in enumerate(tables, 1):
+        print(f"Processing Table {table_idx}...")
         
-        # Extract all tables
-        tables = soup.find_all("table", class_="wikitable")
-        print(f"Found {len(tables)} wikitables\n")
+        # Get table caption/header to identify which group
+        caption = table.find_previous(["h2", "h3", "h4"])
+        group_name = caption.get_text(strip=True) if caption else f"Table {table_idx}"
+        print(f"  Group/Section: {group_name}")
         
-        all_standings = []
-        all_results = []
+        # Extract headers
+        headers = []
+        header_row = table.find("tr")
+        if header_row:
+            headers = [th.get_text(strip=True) for th in header_row.find_all(["th", "td"])]
         
-        # Process each table
-        for table_idx, table in enumerate(tables, 1):
-            print(f"Processing Table {table_idx}...")
-            
-            # Get table caption/header to identify which group
-            caption = table.find_previous(["h2", "h3", "h4"])
-            group_name = caption.get_text(strip=True) if caption else f"Table {table_idx}"
-            print(f"  Group/Section: {group_name}")
+        # Extract data rows
+        rows = table.find_all("tr")[1:]  # Skip header row
+        
+        for row in rows:
+            cells = row.find_all(["td", "th"])
+            row_data = [cell.get_text(strip=True) for cell in cells]
             
-            # Extract headers
-            headers = []
-            header_row = table.find("tr")
-            if header_row:
-                headers = [th.get_text(strip=True) for th in header_row.find_all(["th", "td"])]
+            if not row_data or len(row_data) < 2:
+                continue
             
-            # Extract data rows
-            rows = table.find_all("tr")[1:]  # Skip header row
+            # Check if this row contains any of our target teams
+            row_text = " ".join(row_data)
             
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                row_data = [cell.get_text(strip=True) for cell in cells]
-                
-                if not row_data or len(row_data) < 2:
-                    continue
-                
-                # Check if this row contains any of our target teams
-                row_text = " ".join(row_data)
-                
-                for team_name in TARGET_TEAMS.keys():
-                    # Flexible matching (check for partial names)
-                    team_words = team_name.split()
-                    if any(word in row_text for word in team_words if len(word) > 4):
-                        
-                        record = {
-                            "team": team_name,
-                            "tier": TARGET_TEAMS[team_name]["tier"],
-                            "group": group_name,
-                            "table_index": table_idx,
-                        }
-                        
-                        # Map columns dynamically
-                        for i, header in enumerate(headers):
-                            if i < len(row_data):
-                                record[header] = row_data[i]
-                        
-                        all_standings.append(record)
-                        print(f"    ✓ Found: {team_name}")
-                        break
-        
-        print(f"\n{'='*70}")
-        print(f"EXTRACTION COMPLETE")
-        print(f"{'='*70}")
-        print(f"Total records extracted: {len(all_standings)}")
-        
-        return all_standings
+            for team_name in TARGET_TEAMS.keys():
+                # Flexible matching (check for partial names)
+                team_words = team_name.split()
+                if any(word in row_text for word in team_words if len(word) > 4):
+                    
+                    record = {
+                        "team": team_name,
+                        "tier": TARGET_TEAMS[team_name]["tier"],
+                        "group": group_name,
+                        "table_index": table_idx,
+                    }
+                    
+                    # Map columns dynamically
+                    for i, header in enumerate(headers):
+                        if i < len(row_data):
+                            record[header] = row_data[i]
+                    
+                    all_standings.append(record)
+                    print(f"    ✓ Found: {team_name}")
+                    break
     
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        return []
+    print(f"\n{'='*70}")
+    print(f"EXTRACTION COMPLETE")
+    print(f"{'='*70}")
+    print(f"Total records extracted: {len(all_standings)}")
+    
+    return all_standings
 
 def save_to_csv(data, filename):
     """Save data to CSV"""
@@ -120,6 +122,7 @@ def save_to_csv(data, filename):
     
     df = pd.DataFrame(data)
     df.to_csv(filename, index=False)
+    record_fields(df, filename, PROVENANCE_SOURCE)
     print(f"\n✓ Saved: {filename}")
     print(f"  Rows: {len(df)}")
     print(f"  Columns: {list(df.columns)}")
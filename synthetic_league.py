@@ -0,0 +1,493 @@
+"""
+Synthetic league - realistic competitions for load testing at scale
+Generates hundreds of clubs across the FIBA Africa countries, multi-season
+home-and-away group schedules with knockouts, player box scores and
+play-by-play in the project's schemas, so standings, ratings, simulations
+and uploads can be exercised at many times today's data volume
+"""
+
+import os
+import string
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from game_results import GAME_COLUMNS
+from schema_registry import read_table
+from team_registry import TEAMS
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+SYNTHETIC_DIR = "synthetic_league"
+FILES = {
+    "teams": "synthetic_teams.csv",
+    "games": "synthetic_games.csv",
+    "box_scores": "synthetic_box_scores.csv",
+    "play_by_play": "synthetic_play_by_play.csv",
+}
+
+COMPETITION = "Synthetic League"
+SOURCE = "synthetic"
+FIRST_SEASON = 2024
+TEAM_ID_START = 100001        # Far above the registry's permanent team IDs
+GAME_ID_START = 9000001
+
+DEFAULT_TEAMS = 320           # ~2,600 played games over the default seasons
+DEFAULT_SEASONS = 3
+GROUP_SIZE = 4                # Home-and-away round robin, like the Elite 16 groups
+KNOCKOUT_TEAMS = 16           # Best group winners into a single-game bracket
+UNPLAYED_ROUNDS = 2           # Final season's last group rounds left 0-0 as upcoming fixtures
+ROSTER_SIZE = 12
+
+# Scoring model: per-side points ~ Normal(average +/- half the edge, sd)
+AVERAGE_SCORE = 74
+MIN_SCORE = 35
+SCORE_SD = 9.0
+STRENGTH_SD = 7.0             # Team strength in points above an average side
+HOME_COURT = 3.0
+SEASON_CARRYOVER = 0.8        # Share of strength kept between seasons (the rest is redrawn)
+
+# Tier by strength rank (share of teams), matching rating_engine.TIER_PRIORS
+TIER_SHARES = [("Tier 1", 0.10), ("Tier 2", 0.30), ("Tier 3", 0.60)]
+
+# Box score model: share of points from free throws and threes, shooting
+# percentages and per-team-game means of the counting stats
+FT_POINT_SHARE = 0.17
+THREE_POINT_SHARE = 0.30
+SHOT_TYPES = [("2PM", "2PA", "2P%", 0.49), ("3PM", "3PA", "3P%", 0.32), ("FTM", "FTA", "FT%", 0.70)]
+TEAM_STAT_MEANS = {"ORB": 11, "DRB": 25, "AST": 15, "PF": 19, "STL": 8, "BLK": 3, "TO": 15}
+USAGE_CONCENTRATION = 2.0     # Dirichlet alpha for a roster's shot shares (lower = star-heavy)
+MINUTE_MIX = 0.5              # Minutes follow usage this much, the rest spread evenly
+TEAM_MINUTES = 200
+PLAYER_MAX_MINUTES = 40
+
+# Play-by-play: (event, points, box column counted, box column subtracted)
+PBP_EVENTS = [
+    ("2PT made", 2, "2PM", None), ("2PT missed", 0, "2PA", "2PM"),
+    ("3PT made", 3, "3PM", None), ("3PT missed", 0, "3PA", "3PM"),
+    ("FT made", 1, "FTM", None), ("FT missed", 0, "FTA", "FTM"),
+    ("Offensive rebound", 0, "ORB", None), ("Defensive rebound", 0, "DRB", None),
+    ("Assist", 0, "AST", None), ("Steal", 0, "STL", None), ("Block", 0, "BLK", None),
+    ("Turnover", 0, "TO", None), ("Foul", 0, "PF", None),
+]
+PERIODS = 4
+PERIOD_SECONDS = 600
+
+# Country -> club cities (club names are city + nickname)
+COUNTRIES = {
+    "Kenya": ["Nairobi", "Mombasa", "Kisumu"],
+    "Uganda": ["Kampala", "Entebbe", "Jinja"],
+    "Tanzania": ["Dar es Salaam", "Arusha", "Dodoma"],
+    "Rwanda": ["Kigali", "Huye"],
+    "Burundi": ["Bujumbura", "Gitega"],
+    "South Sudan": ["Juba"],
+    "Ethiopia": ["Addis Ababa"],
+    "South Africa": ["Johannesburg", "Cape Town", "Durban", "Pretoria"],
+    "Mozambique": ["Maputo", "Beira", "Nampula"],
+    "Zambia": ["Lusaka", "Ndola", "Kitwe"],
+    "Malawi": ["Lilongwe", "Blantyre"],
+    "Zimbabwe": ["Harare", "Bulawayo"],
+    "Botswana": ["Gaborone", "Francistown"],
+    "Namibia": ["Windhoek"],
+    "Madagascar": ["Antananarivo"],
+    "Angola": ["Luanda", "Benguela", "Huambo"],
+    "DR Congo": ["Kinshasa", "Lubumbashi"],
+    "Congo": ["Brazzaville", "Pointe-Noire"],
+    "Cameroon": ["Yaounde", "Douala"],
+    "Gabon": ["Libreville"],
+    "Nigeria": ["Lagos", "Abuja", "Kano", "Port Harcourt"],
+    "Ghana": ["Accra", "Kumasi"],
+    "Cote d'Ivoire": ["Abidjan", "Yamoussoukro"],
+    "Senegal": ["Dakar", "Thies"],
+    "Mali": ["Bamako"],
+    "Guinea": ["Conakry"],
+    "Morocco": ["Casablanca", "Rabat", "Fes"],
+    "Algeria": ["Algiers", "Oran"],
+    "Tunisia": ["Tunis", "Sfax", "Monastir"],
+    "Libya": ["Tripoli", "Benghazi"],
+    "Egypt": ["Cairo", "Alexandria"],
+}
+
+NICKNAMES = [
+    "Thunder", "Blazers", "Giants", "Magic", "Stars", "Warriors", "Lions", "Eagles",
+    "Rhinos", "Buffaloes", "Leopards", "Sharks", "Hawks", "Kings", "Tigers", "Falcons",
+    "Storm", "Heat", "Knights", "Spartans", "Titans", "Pirates", "Rockets", "Cobras",
+    "Panthers", "Elephants", "Gazelles", "Hippos", "Crocodiles", "Scorpions", "Comets",
+    "Rangers", "Raiders", "Dragons", "Vipers", "Jaguars", "Wolves", "Bulls", "Royals", "Mariners",
+]
+
+FIRST_NAMES = [
+    "Uchenna", "Albert", "Tylor", "Samuel", "Brian", "Joseph", "Moses", "Kevin", "Ibrahim",
+    "Amadou", "Cheikh", "Youssef", "Karim", "Tendai", "Thabo", "Sipho", "Kwame", "Kofi",
+    "Chinedu", "Emeka", "Olumide", "Jean", "Patrick", "Didier", "Mamadou", "Abdoulaye",
+    "Tariq", "Omar", "Bongani", "Lungelo", "Daniel", "Eric", "Hamza", "Nelson", "Felix",
+]
+
+LAST_NAMES = [
+    "Iroegbu", "Odero", "Ongwae", "Okello", "Mwangi", "Otieno", "Kamau", "Banda", "Phiri",
+    "Mutombo", "Diallo", "Ndiaye", "Sow", "Traore", "Kone", "Mensah", "Boateng", "Okafor",
+    "Adeyemi", "Nwosu", "Bakari", "Mushi", "Nkosi", "Dlamini", "Khumalo", "Moyo", "Chanda",
+    "Tembo", "Habimana", "Niyonzima", "Ait Ali", "Benali", "Haddad", "Mansour", "Cossa",
+    "Machava", "Fernandes", "Kiala", "Tshibangu", "Ekwe",
+]
+
+# -----------------------------------------------------------------
+# TEAM AND SCHEDULE FUNCTIONS
+# -----------------------------------------------------------------
+
+def group_label(index):
+    """A..Z, then AA, AB... for leagues with more than 26 groups"""
+    label, index = "", index + 1
+    while index:
+        index, rest = divmod(index - 1, 26)
+        label = chr(65 + rest) + label
+    return label
+
+
+def round_robin(size):
+    """
+    Circle-method pairings [(round, home, away)] for one group
+
+    Every pair meets home and away; odd groups give one team a bye per round.
+    """
+    slots = list(range(size)) + ([None] if size % 2 else [])
+    n = len(slots)
+    first_half = []
+    for rnd in range(n - 1):
+        for k in range(n // 2):
+            a, b = slots[k], slots[n - 1 - k]
+            if a is not None and b is not None:
+                first_half.append((rnd, a, b) if rnd % 2 else (rnd, b, a))
+        slots = [slots[0], slots[-1], *slots[1:-1]]
+    return first_half + [(rnd + n - 1, away, home) for rnd, home, away in first_half]
+
+
+def generate_teams(n_teams, rng):
+    """Clubs with unique names and codes (never a registry code), country, tier and strength"""
+    combos = [(country, city, nickname) for country, cities in COUNTRIES.items()
+              for city in cities for nickname in NICKNAMES]
+    if n_teams > len(combos):
+        raise ValueError(f"At most {len(combos)} synthetic teams (got {n_teams})")
+    picks = [combos[i] for i in rng.choice(len(combos), n_teams, replace=False)]
+
+    used = {team["code"] for team in TEAMS}
+    codes = []
+    for _, city, nickname in picks:
+        code = (city[:2] + nickname[0]).upper()
+        while code in used:
+            code = "".join(rng.choice(list(string.ascii_uppercase), 3))
+        used.add(code)
+        codes.append(code)
+
+    strength = rng.normal(0, STRENGTH_SD, n_teams)
+    rank_share = (-strength).argsort().argsort() / n_teams
+    bounds = np.cumsum([share for _, share in TIER_SHARES])
+    tiers = np.array([tier for tier, _ in TIER_SHARES])[np.searchsorted(bounds, rank_share, side="right")]
+
+    return pd.DataFrame({
+        "Team_ID": TEAM_ID_START + np.arange(n_teams),
+        "Team_Code": codes,
+        "Team": [f"{city} {nickname}" for _, city, nickname in picks],
+        "Country": [country for country, _, _ in picks],
+        "City": [city for _, city, _ in picks],
+        "Tier": tiers,
+        "Strength": strength.round(2),
+    })
+
+
+def generate_rosters(teams, rng):
+    """ROSTER_SIZE players per team with a jersey, a name and a share of the team's shots"""
+    n = len(teams)
+    jerseys = np.argsort(rng.random((n, 100)), axis=1)[:, :ROSTER_SIZE]
+    names = [f"{last}, {first}" for last, first in zip(rng.choice(LAST_NAMES, n * ROSTER_SIZE),
+                                                        rng.choice(FIRST_NAMES, n * ROSTER_SIZE))]
+    usage = rng.dirichlet(np.full(ROSTER_SIZE, USAGE_CONCENTRATION), n)
+    return pd.DataFrame({
+        "Team_ID": np.repeat(teams["Team_ID"].to_numpy(), ROSTER_SIZE),
+        "Jersey": jerseys.ravel(),
+        "Name": names,
+        "Usage": usage.ravel(),
+    })
+
+
+def play_games(strength_a, strength_b, home, rng):
+    """Scores for a batch of games from each side's strength; ties go to overtime"""
+    edge = (strength_a - strength_b + HOME_COURT * home) / 2
+    score_a = np.maximum(np.rint(AVERAGE_SCORE + edge + rng.normal(0, SCORE_SD, len(edge))), MIN_SCORE)
+    score_b = np.maximum(np.rint(AVERAGE_SCORE - edge + rng.normal(0, SCORE_SD, len(edge))), MIN_SCORE)
+    score_a, score_b = score_a.astype(int), score_b.astype(int)
+    tied = score_a == score_b
+    while tied.any():
+        score_a[tied] += rng.integers(4, 15, tied.sum())
+        score_b[tied] += rng.integers(4, 15, tied.sum())
+        tied = score_a == score_b
+    return score_a, score_b
+
+
+def _game_frame(teams, season, stage, groups, dates, idx_a, idx_b, score_a, score_b, venues):
+    """Games in GAME_COLUMNS order from team row indices"""
+    a, b = teams.iloc[idx_a], teams.iloc[idx_b]
+    return pd.DataFrame({
+        "Date": dates, "Competition": COMPETITION, "Season": str(season), "Stage": stage, "Group": groups,
+        "Team_A_ID": a["Team_ID"].to_numpy(), "Team_A_Code": a["Team_Code"].to_numpy(),
+        "Team_A": a["Team"].to_numpy(), "Score_A": score_a,
+        "Team_B_ID": b["Team_ID"].to_numpy(), "Team_B_Code": b["Team_Code"].to_numpy(),
+        "Team_B": b["Team"].to_numpy(), "Score_B": score_b,
+        "Venue": venues, "Source": SOURCE,
+    })[GAME_COLUMNS]
+
+
+def generate_season(teams, strength, season, rng, unplayed_rounds=0):
+    """
+    One season: random groups playing a weekly home-and-away round robin,
+    then a knockout bracket of the best group winners at a neutral venue
+
+    The last unplayed_rounds group rounds are left 0-0 (and the knockout
+    unplayed), the way FIBA lists fixtures before tip-off.
+    """
+    groups = np.array_split(rng.permutation(len(teams)), max(1, len(teams) // GROUP_SIZE))
+    rows = [(rnd, g, members[home], members[away])
+            for g, members in enumerate(groups) for rnd, home, away in round_robin(len(members))]
+    rnd, slot, idx_a, idx_b = (np.array(column) for column in zip(*rows))
+
+    start = pd.Timestamp(f"{season}-01-10")
+    dates = start + pd.to_timedelta(rnd * 7 + slot % 3, unit="D")
+    played = rnd <= rnd.max() - unplayed_rounds
+    score_a, score_b = play_games(strength[idx_a], strength[idx_b], np.ones(len(rnd)), rng)
+    score_a, score_b = np.where(played, score_a, 0), np.where(played, score_b, 0)
+    venues = teams["City"].to_numpy()[idx_a] + " Arena"
+    frames = [_game_frame(teams, season, "Group Phase", [group_label(g) for g in slot], dates,
+                          idx_a, idx_b, score_a, score_b, venues)]
+    if unplayed_rounds:
+        return pd.concat(frames, ignore_index=True)
+
+    # Seeding: group winners first, then wins and point differential
+    wins, diff = np.zeros(len(teams)), np.zeros(len(teams))
+    np.add.at(wins, idx_a, score_a > score_b)
+    np.add.at(wins, idx_b, score_b > score_a)
+    np.add.at(diff, idx_a, score_a - score_b)
+    np.add.at(diff, idx_b, score_b - score_a)
+    winners = np.zeros(len(teams), dtype=bool)
+    for members in groups:
+        winners[members[np.lexsort((diff[members], wins[members]))[-1]]] = True
+    seeds = np.lexsort((diff, wins, winners))[::-1]
+
+    size = 2 ** int(np.log2(min(KNOCKOUT_TEAMS, len(teams))))
+    bracket = seeds[:size]
+    host = rng.choice(teams["City"].to_numpy())
+    date = dates.max()
+    while len(bracket) > 1:
+        date += pd.Timedelta(days=7)
+        half = len(bracket) // 2
+        ko_a, ko_b = bracket[:half], bracket[::-1][:half]
+        ko_score_a, ko_score_b = play_games(strength[ko_a], strength[ko_b], np.zeros(half), rng)
+        label = {2: "Final", 4: "Semifinals", 8: "Quarterfinals"}.get(len(bracket), f"Round of {len(bracket)}")
+        frames.append(_game_frame(teams, season, "Knockout", label, date, ko_a, ko_b,
+                                  ko_score_a, ko_score_b, f"{host} Arena"))
+        bracket = np.where(ko_score_a > ko_score_b, ko_a, ko_b)
+    return pd.concat(frames, ignore_index=True)
+
+# -----------------------------------------------------------------
+# BOX SCORE AND PLAY-BY-PLAY FUNCTIONS
+# -----------------------------------------------------------------
+
+def box_scores(games, teams, rosters, rng):
+    """
+    Player box score lines for every played game (the player stats schema
+    per game), consistent with the final score
+
+    Team points are split into free throws, threes and twos, each made
+    total shared across the roster by shot usage; misses and counting
+    stats follow usage and minutes.
+    """
+    played = games[(games["Score_A"] > 0) | (games["Score_B"] > 0)]
+    n_games = len(played)
+    team_idx = np.concatenate([played["Team_A_ID"], played["Team_B_ID"]]) - TEAM_ID_START
+    points = np.concatenate([played["Score_A"], played["Score_B"]]).astype(int)
+    n = len(points)
+
+    ftm = np.minimum(np.rint(points * FT_POINT_SHARE * rng.lognormal(0, 0.25, n)), points).astype(int)
+    fg3m = np.rint((points - ftm) * THREE_POINT_SHARE / 3 * rng.lognormal(0, 0.25, n)).astype(int)
+    fg3m = np.minimum(fg3m, (points - ftm) // 3)
+    rest = points - ftm - 3 * fg3m
+    ftm += rest % 2                           # field goals score in twos
+    made = {"2PM": rest // 2, "3PM": fg3m, "FTM": ftm}
+
+    usage = rosters["Usage"].to_numpy().reshape(-1, ROSTER_SIZE)[team_idx]
+    minute_weights = (MINUTE_MIX * usage + (1 - MINUTE_MIX) / ROSTER_SIZE) * rng.gamma(20, 1 / 20, usage.shape)
+    minute_weights /= minute_weights.sum(axis=1, keepdims=True)
+
+    stats = {}
+    for made_column, attempt_column, pct_column, pct in SHOT_TYPES:
+        team_made = made[made_column]
+        stats[made_column] = rng.multinomial(team_made, usage)
+        stats[attempt_column] = stats[made_column] + rng.multinomial(rng.poisson(team_made * (1 - pct) / pct), usage)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            stats[pct_column] = np.round(100 * stats[made_column] / stats[attempt_column], 1)
+    for column, mean in TEAM_STAT_MEANS.items():
+        stats[column] = rng.multinomial(rng.poisson(mean, n), minute_weights)
+    stats["REB"] = stats["ORB"] + stats["DRB"]
+    stats["PTS"] = 2 * stats["2PM"] + 3 * stats["3PM"] + stats["FTM"]
+    stats["MIN"] = np.minimum(TEAM_MINUTES * minute_weights, PLAYER_MAX_MINUTES).round(1)
+
+    player_rows = team_idx[:, None] * ROSTER_SIZE + np.arange(ROSTER_SIZE)
+    box = pd.DataFrame({
+        "Game_ID": np.repeat(np.tile(played["Game_ID"].to_numpy(), 2), ROSTER_SIZE),
+        "Season": np.repeat(np.tile(played["Season"].to_numpy(), 2), ROSTER_SIZE),
+        "Team_Code": teams["Team_Code"].to_numpy()[np.repeat(team_idx, ROSTER_SIZE)],
+        "Team": teams["Team"].to_numpy()[np.repeat(team_idx, ROSTER_SIZE)],
+        "Jersey": rosters["Jersey"].to_numpy()[player_rows].ravel(),
+        "Name": rosters["Name"].to_numpy()[player_rows].ravel(),
+    })
+    for column in ["MIN", "2PM", "2PA", "2P%", "3PM", "3PA", "3P%", "FTM", "FTA", "FT%",
+                   "ORB", "DRB", "REB", "AST", "PF", "STL", "BLK", "TO", "PTS"]:
+        box[column] = stats[column].ravel()
+    # Side A lines first, then side B; keep each game's two teams together
+    side = np.repeat(np.arange(n) // n_games, ROSTER_SIZE)
+    return box.iloc[np.lexsort((side, box["Game_ID"].to_numpy()))].reset_index(drop=True)
+
+
+def play_by_play(box, games, rng):
+    """
+    One event row per shot, free throw, rebound, assist, steal, block,
+    turnover and foul in the box scores, with the running score
+
+    Events are spread uniformly over four periods, so overtime points
+    land inside regulation; the last row of each game matches its final.
+    """
+    counts = np.column_stack([box[column].to_numpy() - (box[minus].to_numpy() if minus else 0)
+                              for _, _, column, minus in PBP_EVENTS])
+    flat = np.repeat(np.arange(counts.size), counts.ravel())
+    row, event = flat // len(PBP_EVENTS), flat % len(PBP_EVENTS)
+
+    team_a = games.set_index("Game_ID")["Team_A_Code"]
+    side_a = (box["Team_Code"].to_numpy() == team_a.reindex(box["Game_ID"]).to_numpy())[row]
+    game_ids = box["Game_ID"].to_numpy()[row]
+    seconds = rng.uniform(0, PERIODS * PERIOD_SECONDS, len(row))
+    order = np.lexsort((seconds, game_ids))
+    row, event, side_a, game_ids, seconds = row[order], event[order], side_a[order], game_ids[order], seconds[order]
+
+    points = np.array([points for _, points, _, _ in PBP_EVENTS])[event]
+    starts = np.flatnonzero(np.r_[True, game_ids[1:] != game_ids[:-1]])
+    lengths = np.diff(np.r_[starts, len(row)])
+
+    def running(values):
+        total = np.cumsum(values)
+        return total - np.repeat(total[starts] - values[starts], lengths)
+
+    remaining = np.ceil(PERIOD_SECONDS - seconds % PERIOD_SECONDS).astype(int)
+    return pd.DataFrame({
+        "Game_ID": game_ids,
+        "Event_Num": np.arange(len(row)) - np.repeat(starts, lengths) + 1,
+        "Period": (seconds // PERIOD_SECONDS).astype(int) + 1,
+        "Clock": [f"{s // 60:02d}:{s % 60:02d}" for s in remaining.tolist()],
+        "Team_Code": box["Team_Code"].to_numpy()[row],
+        "Jersey": box["Jersey"].to_numpy()[row],
+        "Player": box["Name"].to_numpy()[row],
+        "Event": pd.Categorical.from_codes(event, [name for name, _, _, _ in PBP_EVENTS]),
+        "Points": points,
+        "Score_A": running(points * side_a),
+        "Score_B": running(points * ~side_a),
+    })
+
+# -----------------------------------------------------------------
+# LEAGUE FUNCTIONS
+# -----------------------------------------------------------------
+
+def generate_league(n_teams=DEFAULT_TEAMS, seasons=DEFAULT_SEASONS, seed=None, unplayed_rounds=UNPLAYED_ROUNDS):
+    """
+    A full synthetic competition: {teams, games, box_scores, play_by_play}
+
+    Team strength carries over between seasons with some redrawn, so
+    ratings have real signal to find; the same seed gives the same league.
+    """
+    rng = np.random.default_rng(seed)
+    teams = generate_teams(n_teams, rng)
+    rosters = generate_rosters(teams, rng)
+
+    strength = teams["Strength"].to_numpy()
+    frames = []
+    for season in range(FIRST_SEASON, FIRST_SEASON + seasons):
+        last = season == FIRST_SEASON + seasons - 1
+        frames.append(generate_season(teams, strength, season, rng, unplayed_rounds if last else 0))
+        strength = (SEASON_CARRYOVER * strength
+                    + np.sqrt(1 - SEASON_CARRYOVER ** 2) * rng.normal(0, STRENGTH_SD, len(teams)))
+    games = pd.concat(frames, ignore_index=True)
+    games.insert(0, "Game_ID", GAME_ID_START + np.arange(len(games)))
+
+    box = box_scores(games, teams, rosters, rng)
+    return {"teams": teams, "games": games, "box_scores": box, "play_by_play": play_by_play(box, games, rng)}
+
+
+def tier_priors(teams):
+    """Team -> starting rating from its tier (rating_engine.load_tier_priors for synthetic teams)"""
+    from rating_engine import INITIAL_RATING, TIER_PRIORS
+
+    return dict(zip(teams["Team"], teams["Tier"].map(TIER_PRIORS).fillna(INITIAL_RATING).astype(float)))
+
+
+def season_totals(box, games):
+    """Player season totals and opponent scoring in advanced_metrics' shape (players, opponents)"""
+    players = box.groupby(["Team", "Season", "Name"], as_index=False, sort=False).agg(
+        GP=("Game_ID", "size"), MIN=("MIN", "sum"),
+        FG2M=("2PM", "sum"), FG2A=("2PA", "sum"), FG3M=("3PM", "sum"), FG3A=("3PA", "sum"),
+        FTM=("FTM", "sum"), FTA=("FTA", "sum"), ORB=("ORB", "sum"), DRB=("DRB", "sum"),
+        AST=("AST", "sum"), STL=("STL", "sum"), BLK=("BLK", "sum"), TOV=("TO", "sum"), PTS=("PTS", "sum"),
+    ).rename(columns={"Name": "Player"})
+
+    played = games[(games["Score_A"] > 0) | (games["Score_B"] > 0)]
+    opponents = pd.concat([
+        pd.DataFrame({"Team": played["Team_A"], "Season": played["Season"], "Opp_PTS": played["Score_B"]}),
+        pd.DataFrame({"Team": played["Team_B"], "Season": played["Season"], "Opp_PTS": played["Score_A"]}),
+    ]).groupby(["Team", "Season"], as_index=False)["Opp_PTS"].sum()
+    return players, opponents
+
+
+def league_exists(out_dir=SYNTHETIC_DIR):
+    return all(os.path.exists(os.path.join(out_dir, file)) for file in FILES.values())
+
+
+def save_league(league, out_dir=SYNTHETIC_DIR):
+    """Write each table to its CSV under out_dir; returns {table: rows}"""
+    os.makedirs(out_dir, exist_ok=True)
+    for name, file in FILES.items():
+        league[name].to_csv(os.path.join(out_dir, file), index=False)
+    return {name: len(league[name]) for name in FILES}
+
+
+def load_league(out_dir=SYNTHETIC_DIR):
+    """The saved tables, read with their registered schemas"""
+    return {name: read_table(os.path.join(out_dir, file)) for name, file in FILES.items()}
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("SYNTHETIC LEAGUE GENERATOR")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    n_teams = int(args[args.index("--teams") + 1]) if "--teams" in args else DEFAULT_TEAMS
+    n_seasons = int(args[args.index("--seasons") + 1]) if "--seasons" in args else DEFAULT_SEASONS
+    seed = int(args[args.index("--seed") + 1]) if "--seed" in args else None
+    out_dir = args[args.index("--out") + 1] if "--out" in args else SYNTHETIC_DIR
+
+    started = time.perf_counter()
+    league = generate_league(n_teams, n_seasons, seed)
+    generated = time.perf_counter() - started
+    rows = save_league(league, out_dir)
+
+    print(f"\n{n_teams} teams, {n_seasons} seasons ({generated:.1f}s to generate)")
+    for name, file in FILES.items():
+        print(f"  ✓ {os.path.join(out_dir, file):<45} {rows[name]:>10,} rows")
+
+    from game_results import load_game_results
+
+    played = int(((league["games"]["Score_A"] > 0) | (league["games"]["Score_B"] > 0)).sum())
+    current = len(load_game_results())
+    if current:
+        print(f"\n{played:,} played games = {played / current:,.0f}x the {current} games in the current data")
+    print("\nLoad-test the stages on it: python benchmark.py --synthetic")
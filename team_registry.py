@@ -0,0 +1,290 @@
+"""
+Team identity registry - one integer ID per club
+Resolves every spelling, code and URL slug used across the scrapers to the
+same ID, and gives DataFrames categorical/int team columns so joins and
+groupbys run on integers and unknown names fail loudly instead of missing
+"""
+
+import os
+import unicodedata
+import pandas as pd
+
+from schema_registry import read_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+
+# team_id is permanent - append new clubs, never renumber.
+# aliases: exact alternative names/codes (matched case/accent-insensitively)
+# search_terms: loose substrings for scraping free text
+# Every Road to BAL club in ROSTER_FILE must be registered here
+ROSTER_FILE = "teams_roster_links.csv"
+TEAMS = [
+    {
+        "team_id": 1, "code": "NCT", "name": "Nairobi City Thunder",
+        "slug": "nairobi-city-thunder", "case_study": True,
+        "aliases": ["Nairobi City Thunder BC"],
+        "search_terms": ["NCT", "Nairobi", "Thunder"]
+    },
+    {
+        "team_id": 2, "code": "NAM", "name": "Namuwongo Blazers",
+        "slug": "namuwongo-blazers", "case_study": True,
+        "aliases": [],
+        "search_terms": ["Namuwongo", "Blazers"]
+    },
+    {
+        "team_id": 3, "code": "JOH", "name": "Johannesburg Giants",
+        "slug": "johannesburg-giants", "case_study": True,
+        "aliases": ["JHB", "JHG"],
+        "search_terms": ["Johannesburg", "Giants", "JHB"]
+    },
+    {
+        "team_id": 4, "code": "FBE", "name": "Ferroviario da Beira",
+        "slug": "ferroviario-da-beira", "case_study": True,
+        "aliases": ["Ferroviario Beira", "Ferroviário da Beira", "Clube Ferroviario da Beira"],
+        "search_terms": ["Ferroviario", "Beira", "Ferroviário", "FBE"]
+    },
+    {
+        "team_id": 5, "code": "MMA", "name": "Matero Magic",
+        "slug": "matero-magic", "case_study": True,
+        "aliases": [],
+        "search_terms": ["Matero", "Magic"]
+    },
+    {
+        "team_id": 6, "code": "DAR", "name": "Dar City",
+        "slug": "dar-city", "case_study": True,
+        "aliases": ["Dar City Basketball", "Dar City Basketball Team", "dar-city-basketball-team"],
+        "search_terms": ["Dar", "Dar City"]
+    },
+    {
+        "team_id": 7, "code": "BHB", "name": "Bravehearts",
+        "slug": "bravehearts-basketball-club", "case_study": True,
+        "aliases": ["Bravehearts Basketball Club", "Brave Hearts", "Bravehearts BC", "BRA"],
+        "search_terms": ["Bravehearts", "Brave Hearts", "BRA"]
+    },
+    {
+        "team_id": 8, "code": "DJA", "name": "Djabal Club",
+        "slug": "djabal-club", "case_study": False,
+        "aliases": ["Djabal"],
+        "search_terms": ["Djabal"]
+    },
+    {
+        "team_id": 9, "code": "HOU", "name": "Basket Hounds",
+        "slug": "basket-hounds", "case_study": False,
+        "aliases": [],
+        "search_terms": ["Hounds"]
+    },
+    {
+        "team_id": 10, "code": "DOL", "name": "Dolphins",
+        "slug": "dolphins", "case_study": False,
+        "aliases": ["Dolphins Basketball Club", "dolphins-basketball-club"],
+        "search_terms": ["Dolphins"]
+    },
+    {
+        "team_id": 11, "code": "AHL", "name": "Al Ahly Benghazi",
+        "slug": "al-ahly-benghazi", "case_study": False,
+        "aliases": [],
+        "search_terms": ["Al Ahly", "Benghazi"]
+    },
+    {
+        "team_id": 12, "code": "ASD", "name": "AS Douanes",
+        "slug": "as-douanes", "case_study": False,
+        "aliases": ["Douanes"],
+        "search_terms": ["Douanes"]
+    },
+    {
+        "team_id": 13, "code": "NWG", "name": "ASB New Generation",
+        "slug": "asb-new-generation", "case_study": False,
+        "aliases": ["New Generation"],
+        "search_terms": ["New Generation"]
+    },
+    {
+        "team_id": 14, "code": "CRBT", "name": "Centre de Reference de Basketball de Tombouctou",
+        "slug": "centre-de-reference-de-basketball-de-tombouctou", "case_study": False,
+        "aliases": ["CRB Tombouctou"],
+        "search_terms": ["Tombouctou"]
+    },
+    {
+        "team_id": 15, "code": "CFG", "name": "Centre Fédéral de Guinée",
+        "slug": "centre-federal-de-guinee", "case_study": False,
+        "aliases": [],
+        "search_terms": ["Centre Federal", "Guinee"]
+    },
+    {
+        "team_id": 16, "code": "COT", "name": "Elan Coton BBC",
+        "slug": "elan-coton-bbc", "case_study": False,
+        "aliases": ["Elan Coton"],
+        "search_terms": ["Coton"]
+    },
+    {
+        "team_id": 17, "code": "JCA", "name": "Jeunesse Club d'Abidjan",
+        "slug": "jeunesse-club-dabidjan", "case_study": False,
+        "aliases": ["Jeunesse Club d Abidjan"],
+        "search_terms": ["Jeunesse", "Abidjan"]
+    },
+    {
+        "team_id": 18, "code": "KRS", "name": "Kriol Star",
+        "slug": "kriol-star", "case_study": False,
+        "aliases": [],
+        "search_terms": ["Kriol"]
+    },
+    {
+        "team_id": 19, "code": "LPRC", "name": "LPRC Oilers",
+        "slug": "lprc-oilers", "case_study": False,
+        "aliases": [],
+        "search_terms": ["LPRC", "Oilers"]
+    },
+    {
+        "team_id": 20, "code": "MOA", "name": "Moanda BB",
+        "slug": "moanda-bb", "case_study": False,
+        "aliases": ["Moanda"],
+        "search_terms": ["Moanda"]
+    },
+    {
+        "team_id": 21, "code": "NTE", "name": "New Tech Université Club",
+        "slug": "new-tech-universite-club", "case_study": False,
+        "aliases": ["New Tech"],
+        "search_terms": ["New Tech"]
+    },
+    {
+        "team_id": 22, "code": "RWS", "name": "Roche-Bois Warriors Sports Club",
+        "slug": "roche-bois-warriors-sports-club", "case_study": False,
+        "aliases": ["Roche-Bois Warriors"],
+        "search_terms": ["Roche-Bois", "Roche Bois"]
+    },
+    {
+        "team_id": 23, "code": "SPK", "name": "Spintex Knights",
+        "slug": "spintex-knights", "case_study": False,
+        "aliases": [],
+        "search_terms": ["Spintex", "Knights"]
+    },
+]
+
+# -----------------------------------------------------------------
+# LOOKUP TABLES
+# -----------------------------------------------------------------
+
+def normalize(name):
+    """Lower-case, accent-free, single-spaced key ('Ferroviário-da-Beira' -> 'ferroviario da beira')"""
+    text = unicodedata.normalize("NFKD", str(name)).encode("ascii", "ignore").decode()
+    return " ".join(text.replace("-", " ").replace("_", " ").lower().split())
+
+
+def _build_alias_index():
+    index = {}
+    for team in TEAMS:
+        for alias in [team["name"], team["code"], team["slug"], *team["aliases"]]:
+            key = normalize(alias)
+            if index.get(key, team["team_id"]) != team["team_id"]:
+                raise ValueError(f"Alias '{alias}' maps to two teams")
+            index[key] = team["team_id"]
+    return index
+
+
+ALIAS_INDEX = _build_alias_index()
+TEAMS_BY_ID = {team["team_id"]: team for team in TEAMS}
+
+# Categorical dtype shared by every team-name column (categories in ID order)
+TEAM_DTYPE = pd.CategoricalDtype([team["name"] for team in TEAMS])
+CATEGORY_POSITION = {team["team_id"]: position for position, team in enumerate(TEAMS)}
+
+CASE_STUDY_CODES = [team["code"] for team in TEAMS if team["case_study"]]
+CASE_STUDY_NAMES = [team["name"] for team in TEAMS if team["case_study"]]
+
+# -----------------------------------------------------------------
+# RESOLUTION FUNCTIONS
+# -----------------------------------------------------------------
+
+def team_id(alias):
+    """Integer ID for any name, code or slug; KeyError if unknown"""
+    try:
+        return ALIAS_INDEX[normalize(alias)]
+    except KeyError:
+        raise KeyError(f"Unknown team '{alias}' - add it to team_registry.TEAMS") from None
+
+
+def team_name(alias):
+    """Canonical name for any name, code, slug or ID"""
+    key = alias if isinstance(alias, int) else team_id(alias)
+    return TEAMS_BY_ID[key]["name"]
+
+
+def team_code(alias):
+    """Three-letter code for any name, code, slug or ID"""
+    key = alias if isinstance(alias, int) else team_id(alias)
+    return TEAMS_BY_ID[key]["code"]
+
+
+def search_terms(alias):
+    """Loose substrings used to spot a team in scraped text"""
+    return TEAMS_BY_ID[team_id(alias)]["search_terms"]
+
+
+def find_team(text):
+    """
+    Team ID for a loose mention in scraped text ('Beira', 'the Giants')
+
+    Exact aliases win; otherwise the single team whose search term appears
+    as whole words in the text. None if nothing or several teams match.
+    """
+    key = normalize(text)
+    if key in ALIAS_INDEX:
+        return ALIAS_INDEX[key]
+    padded = f" {key} "
+    matches = {team["team_id"] for team in TEAMS
+               for term in team["search_terms"] if f" {normalize(term)} " in padded}
+    return matches.pop() if len(matches) == 1 else None
+
+
+def resolve_ids(values, strict=True):
+    """
+    Series of names/codes -> Int64 team IDs (one dict lookup per distinct value)
+
+    strict raises on any unknown non-blank value; otherwise unknowns are <NA>.
+    """
+    values = pd.Series(values)
+    distinct = values.dropna().astype(str).unique()
+    mapping = {value: ALIAS_INDEX.get(normalize(value)) for value in distinct}
+    unknown = sorted(v for v, tid in mapping.items() if tid is None and v.strip())
+    if strict and unknown:
+        raise KeyError(f"Unknown teams {unknown} - add them to team_registry.TEAMS")
+    return values.astype("string").map(mapping).astype("Int64")
+
+
+def ids_to_category(ids):
+    """Int64 team IDs -> canonical names as the shared categorical dtype"""
+    ids = pd.Series(ids, dtype="Int64")
+    codes = ids.map(CATEGORY_POSITION).fillna(-1).astype(int)
+    return pd.Series(pd.Categorical.from_codes(codes, dtype=TEAM_DTYPE), index=ids.index)
+
+
+def as_team_category(values, strict=True):
+    """Series of names/codes -> canonical names as the shared categorical dtype"""
+    return ids_to_category(resolve_ids(values, strict))
+
+
+def ids_to_codes(ids):
+    """Int64 team IDs -> three-letter codes"""
+    return pd.Series(ids, dtype="Int64").map({tid: team["code"] for tid, team in TEAMS_BY_ID.items()})
+
+
+def registry_frame():
+    """The registry as a DataFrame (team_id, code, name, slug, case_study)"""
+    return pd.DataFrame(TEAMS)[["team_id", "code", "name", "slug", "case_study"]]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TEAM REGISTRY")
+    print("=" * 70)
+    print(registry_frame().to_string(index=False))
+    print(f"\n✓ {len(TEAMS)} teams, {len(ALIAS_INDEX)} aliases")
+
+    if os.path.exists(ROSTER_FILE):
+        roster = read_table(ROSTER_FILE, columns=["team_name"])
+        missing = sorted(name for name in roster["team_name"] if normalize(name) not in ALIAS_INDEX)
+        if missing:
+            print(f"✗ {len(missing)} roster teams not registered: {', '.join(missing)}")
+        else:
+            print(f"✓ All {len(roster)} roster teams registered")
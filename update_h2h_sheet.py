@@ -1,52 +1,87 @@
-import gspread
-from google.oauth2.service_account import Credentials
+"""
+Update the Head-to-Head Results worksheet from the H2H index
+Folds any new games into the index first, then replaces the sheet contents
+"""
+
 import pandas as pd
 
-# Setup credentials
-SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-credentials = Credentials.from_service_account_file('credentials.json', scopes=SCOPES)
-client = gspread.authorize(credentials)
+from display_format import format_for_display
+from head_to_head_index import refresh_head_to_head
+from profiling import profiled
+from schema_registry import read_table
 
-# Open spreadsheet
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+CREDENTIALS_FILE = 'credentials.json'
 SPREADSHEET_ID = '1__XNzNwQ2Ib9ULzQ1NaHt6Jfw5EefkA4-_QojbrLLlU'
-spreadsheet = client.open_by_key(SPREADSHEET_ID)
+WORKSHEET_TITLE = "Head-to-Head Results"
 
-print(f"✓ Opened: {spreadsheet.title}")
+HEADER_FORMAT = {
+    'backgroundColor': {'red': 0.0, 'green': 0.3, 'blue': 0.6},
+    'textFormat': {'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}, 'bold': True}
+}
 
-# Read the updated CSV
-df = pd.read_csv('head_to_head_results.csv')
-df = df.fillna('')
+# -----------------------------------------------------------------
+# UPLOAD FUNCTIONS
+# -----------------------------------------------------------------
 
-print(f"\n✓ Loaded {len(df)} head-to-head results")
-print(df)
+def open_spreadsheet(credentials_file=CREDENTIALS_FILE, spreadsheet_id=SPREADSHEET_ID):
+    """Authorized gspread Spreadsheet (gspread/google-auth imported on first call)"""
+    import gspread
+    from google.oauth2.service_account import Credentials
 
-# Find or create the worksheet
-worksheet_title = "Head-to-Head Results"
-try:
-    worksheet = spreadsheet.worksheet(worksheet_title)
-    print(f"\n✓ Found existing worksheet: {worksheet_title}")
-except:
-    worksheet = spreadsheet.add_worksheet(title=worksheet_title, rows=100, cols=10)
-    print(f"\n✓ Created new worksheet: {worksheet_title}")
+    credentials = Credentials.from_service_account_file(credentials_file, scopes=SCOPES)
+    return gspread.authorize(credentials).open_by_key(spreadsheet_id)
 
-# Clear existing content
-worksheet.clear()
 
-# Update with new data
-worksheet.update([df.columns.values.tolist()] + df.values.tolist())
+def load_h2h(h2h=None):
+    """H2H table from a DataFrame, a CSV path, or (None) a fresh index refresh; returns (df, new games)"""
+    if h2h is None:
+        return refresh_head_to_head()
+    if not isinstance(h2h, pd.DataFrame):
+        h2h = read_table(h2h)
+    return h2h, 0
 
-print(f"\n✓ Updated {worksheet_title}")
-print(f"  Rows: {len(df)}")
-print(f"  Columns: {len(df.columns)}")
 
-# Format header row
-worksheet.format('A1:F1', {
-    'backgroundColor': {'red': 0.0, 'green': 0.3, 'blue': 0.6},
-    'textFormat': {'foregroundColor': {'red': 1.0, 'green': 1.0, 'blue': 1.0}, 'bold': True}
-})
+@profiled("upload", rows="out")
+def update_h2h_sheet(spreadsheet, h2h=None, worksheet_title=WORKSHEET_TITLE):
+    """Replace the worksheet with the H2H table; returns the DataFrame uploaded"""
+    import gspread
+
+    df, _ = load_h2h(h2h)
+    df = format_for_display(df).fillna('')
+
+    try:
+        worksheet = spreadsheet.worksheet(worksheet_title)
+    except gspread.WorksheetNotFound:
+        worksheet = spreadsheet.add_worksheet(title=worksheet_title, rows=100, cols=len(df.columns) + 2)
+
+    worksheet.clear()
+    worksheet.update([df.columns.values.tolist()] + df.values.tolist())
+
+    end_col = chr(64 + min(len(df.columns), 26))
+    worksheet.format(f'A1:{end_col}1', HEADER_FORMAT)
+    worksheet.columns_auto_resize(0, len(df.columns))
+    return df
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    spreadsheet = open_spreadsheet()
+    print(f"✓ Opened: {spreadsheet.title}")
+
+    # Fold any new games into the H2H index and regenerate the CSV
+    df, new_games = refresh_head_to_head()
+    print(f"\n✓ Loaded {len(df)} head-to-head results ({new_games} new games indexed)")
+    print(df.fillna(''))
 
-# Auto-resize columns
-worksheet.columns_auto_resize(0, len(df.columns))
+    df = update_h2h_sheet(spreadsheet, df)
 
-print(f"\n✓ Formatting applied")
-print("\n✅ HEAD-TO-HEAD RESULTS UPDATED SUCCESSFULLY!")
+    print(f"\n✓ Updated {WORKSHEET_TITLE}")
+    print(f"  Rows: {len(df)}")
+    print(f"  Columns: {len(df.columns)}")
+    print(f"\n✓ Formatting applied")
+    print("\n✅ HEAD-TO-HEAD RESULTS UPDATED SUCCESSFULLY!")
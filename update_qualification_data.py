@@ -1,12 +1,22 @@
-import pandas as pd
+import sys
 import gspread
 from google.oauth2.service_account import Credentials
 
+from display_format import format_for_display
+from data_validator import upload_errors
+from schema_registry import read_table
+
 # Google Sheets setup
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 CREDENTIALS_FILE = 'credentials.json'
 SPREADSHEET_ID = '1__XNzNwQ2Ib9ULzQ1NaHt6Jfw5EefkA4-_QojbrLLlU'
 
+# Refuse to upload qualification data that fails validation
+errors = upload_errors('bal_2026_qualification_data.csv')
+if not errors.empty:
+    print(errors.to_string(index=False))
+    sys.exit(f"❌ {len(errors)} validation errors - fix bal_2026_qualification_data.csv before uploading")
+
 # Authenticate
 creds = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
 client = gspread.authorize(creds)
@@ -16,7 +26,7 @@ spreadsheet = client.open_by_key(SPREADSHEET_ID)
 print(f"✓ Opened: {spreadsheet.title}")
 
 # Load qualification data
-df = pd.read_csv('bal_2026_qualification_data.csv')
+df = format_for_display(read_table('bal_2026_qualification_data.csv'))
 
 # Replace NaN values with empty strings for Google Sheets compatibility
 df = df.fillna('')
@@ -2,10 +2,14 @@
 Update only the Team Profiles worksheet in Google Sheets
 """
 
+import sys
 import gspread
-import pandas as pd
 from google.oauth2.service_account import Credentials
 
+from arrow_handoff import load
+from artifact_manifest import stage_is_current, record_stage
+from display_format import format_for_display
+
 # -----------------------------------------------------------------
 # CONFIGURATION
 # -----------------------------------------------------------------
@@ -15,11 +19,19 @@ SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1__XNzNwQ2Ib9ULzQ1NaHt
 # File to update
 CSV_FILE = "comprehensive_team_profiles.csv"
 WORKSHEET_NAME = "Team Profiles (All 7 Teams)"
+STAGE = f"upload:{WORKSHEET_NAME}"
+
+# Re-upload even when the CSV hashes the same as the last upload
+FORCE = "--force" in sys.argv
 
 # -----------------------------------------------------------------
 # UPDATE FUNCTION
 # -----------------------------------------------------------------
-def update_team_profiles():
+def update_team_profiles(force=FORCE):
+    if not force and stage_is_current(STAGE, [CSV_FILE]):
+        print(f"✓ {CSV_FILE} unchanged since last upload - skipping (use --force to re-upload)")
+        return
+
     try:
         # Authenticate
         scopes = [
@@ -42,7 +54,7 @@ def update_team_profiles():
         
         # Read CSV
         print(f"Loading {CSV_FILE}...")
-        df = pd.read_csv(CSV_FILE)
+        df = format_for_display(load(CSV_FILE))
         df = df.fillna("")
         print(f"✓ Loaded {len(df)} rows, {len(df.columns)} columns")
         
@@ -86,6 +98,7 @@ def update_team_profiles():
         print(f"Auto-resizing columns...")
         worksheet.columns_auto_resize(0, len(df.columns))
         print(f"✓ Auto-resized {len(df.columns)} columns")
+        record_stage(STAGE, [CSV_FILE])
         
         # Summary
         print("\n" + "="*70)
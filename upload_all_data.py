@@ -2,10 +2,15 @@
 Upload BAL 2026 qualification data to Google Sheets
 """
 
+import sys
 import gspread
-import pandas as pd
 from google.oauth2.service_account import Credentials
 
+from arrow_handoff import load
+from display_format import format_for_display
+from artifact_manifest import stage_is_current, record_stage
+from data_validator import validate, upload_errors
+
 # -----------------------------------------------------------------
 # CONFIGURATION
 # -----------------------------------------------------------------
@@ -66,10 +71,19 @@ FILES_TO_UPLOAD = [
     }
 ]
 
+# Re-upload even when a CSV hashes the same as its last upload
+FORCE = "--force" in sys.argv
+
 # -----------------------------------------------------------------
 # UPLOAD FUNCTION
 # -----------------------------------------------------------------
-def upload_multiple_files():
+def upload_multiple_files(force=FORCE):
+    pending = [f for f in FILES_TO_UPLOAD
+               if force or not stage_is_current(f"upload:{f['worksheet_name']}", [f["csv_file"]])]
+    if not pending:
+        print("✓ All files unchanged since last upload - skipping (use --force to re-upload)")
+        return
+
     try:
         # Authenticate
         scopes = [
@@ -90,8 +104,14 @@ def upload_multiple_files():
         print(f"✓ Opened: {spreadsheet.title}")
         print(f"  URL: {spreadsheet.url}\n")
         
+        # Validate everything once; files with errors are held back
+        issues, _ = validate()
+        
         # Upload each file
         for file_info in FILES_TO_UPLOAD:
+            if file_info not in pending:
+                print(f"✓ {file_info['csv_file']} unchanged - skipping")
+                continue
             csv_file = file_info["csv_file"]
             worksheet_name = file_info["worksheet_name"]
             description = file_info["description"]
@@ -101,9 +121,14 @@ def upload_multiple_files():
             print(f"  → Worksheet: {worksheet_name}")
             print(f"  → {description}")
             
+            errors = upload_errors(csv_file, issues)
+            if not errors.empty:
+                print(f"  ❌ {len(errors)} validation errors - not uploaded (run data_validator.py)")
+                continue
+            
             try:
                 # Read CSV
-                df = pd.read_csv(csv_file)
+                df = format_for_display(load(csv_file))
                 # Replace NaN with empty strings for Google Sheets compatibility
                 df = df.fillna("")
                 print(f"  ✓ Loaded {len(df)} rows, {len(df.columns)} columns")
@@ -138,6 +163,7 @@ def upload_multiple_files():
                 # Auto-resize columns
                 worksheet.columns_auto_resize(0, len(df.columns))
                 print(f"  ✓ Auto-resized columns")
+                record_stage(f"upload:{worksheet_name}", [csv_file])
                 
             except FileNotFoundError:
                 print(f"  ⚠ File not found: {csv_file} (skipping)")
@@ -151,7 +177,7 @@ def upload_multiple_files():
         print("UPLOAD COMPLETE!")
         print("="*70)
         print(f"\n✓ Spreadsheet URL: {spreadsheet.url}")
-        print(f"✓ Files processed: {len(FILES_TO_UPLOAD)}")
+        print(f"✓ Files processed: {len(pending)} ({len(FILES_TO_UPLOAD) - len(pending)} unchanged)")
         print("\nWorksheets created:")
         for ws in spreadsheet.worksheets():
             print(f"  - {ws.title}")
@@ -1,11 +1,17 @@
-import pandas as pd
+import sys
 import gspread
 from google.oauth2.service_account import Credentials
 
+from arrow_handoff import load
+from display_format import format_for_display
+from artifact_manifest import stage_is_current, record_stage
+from data_validator import validate, upload_errors
+
 # Google Sheets setup
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 CREDENTIALS_FILE = 'credentials.json'
 SPREADSHEET_ID = '1__XNzNwQ2Ib9ULzQ1NaHt6Jfw5EefkA4-_QojbrLLlU'
+FORCE = "--force" in sys.argv  # Re-upload even when a CSV is unchanged since its last upload
 
 # Authenticate
 credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
@@ -32,14 +38,27 @@ datasets = [
     }
 ]
 
+# Validate everything once; datasets with errors are held back
+issues, _ = validate()
+
 for dataset in datasets:
     print(f"\n{'='*60}")
     print(f"Processing: {dataset['worksheet_name']}")
     print(f"Description: {dataset['description']}")
     print(f"{'='*60}")
     
+    stage = f"upload:{dataset['worksheet_name']}"
+    if not FORCE and stage_is_current(stage, [dataset["csv_file"]]):
+        print(f"✓ {dataset['csv_file']} unchanged since last upload - skipping")
+        continue
+    
+    errors = upload_errors(dataset["csv_file"], issues)
+    if not errors.empty:
+        print(f"❌ {len(errors)} validation errors - not uploaded (run data_validator.py)")
+        continue
+    
     # Load CSV
-    df = pd.read_csv(dataset["csv_file"])
+    df = format_for_display(load(dataset["csv_file"]))
     df = df.fillna('')  # Replace NaN with empty strings
     
     print(f"✓ Loaded {len(df)} rows, {len(df.columns)} columns")
@@ -83,6 +102,7 @@ for dataset in datasets:
     worksheet.columns_auto_resize(0, len(headers)-1)
     
     print(f"✓ Formatting applied")
+    record_stage(stage, [dataset["csv_file"]])
 
 print("\n" + "="*60)
 print("✅ ALL ELITE 16 DATA UPLOADED SUCCESSFULLY!")
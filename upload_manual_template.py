@@ -1,7 +1,9 @@
-import pandas as pd
 import gspread
 from google.oauth2.service_account import Credentials
 
+from display_format import format_for_display
+from schema_registry import read_table
+
 # Google Sheets setup
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 CREDENTIALS_FILE = 'credentials.json'
@@ -14,7 +16,7 @@ spreadsheet = client.open_by_key(SPREADSHEET_ID)
 print(f"✓ Opened: {spreadsheet.title}")
 
 # Load manual template
-df = pd.read_csv("open_source_teams_manual_template.csv")
+df = format_for_display(read_table("open_source_teams_manual_template.csv"))
 df = df.fillna('')
 
 print(f"\n✓ Loaded {len(df)} teams")
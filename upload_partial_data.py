@@ -1,127 +1,192 @@
+"""
+Upload partial rosters, partial stats and live commentary cards to Google Sheets
+Each dataset replaces its worksheet, with a colour-coded frozen header; a
+worksheet whose CSV hashes the same as its last upload is skipped
+"""
+
+import sys
 import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
 
-# Google Sheets setup
+from arrow_handoff import load
+from artifact_manifest import stage_is_current, record_stage
+from display_format import format_for_display
+from profiling import profiled
+from schema_registry import read_table
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
 CREDENTIALS_FILE = 'credentials.json'
 SPREADSHEET_ID = '1__XNzNwQ2Ib9ULzQ1NaHt6Jfw5EefkA4-_QojbrLLlU'
 
-# Authenticate
-credentials = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
-client = gspread.authorize(credentials)
-spreadsheet = client.open_by_key(SPREADSHEET_ID)
-print(f"✓ Opened: {spreadsheet.title}")
-
-# Datasets to upload
-datasets = [
+# Datasets to upload (header colour: green rosters, blue stats, purple commentary)
+DATASETS = [
     {
         "csv_file": "partial_rosters.csv",
         "worksheet_name": "Partial Rosters",
-        "description": "Identified players for 4 teams"
+        "description": "Identified players for 4 teams",
+        "header_color": {'red': 0.2, 'green': 0.6, 'blue': 0.3}
     },
     {
         "csv_file": "partial_stats.csv",
         "worksheet_name": "Partial Stats",
-        "description": "Detailed statistics from preliminary games"
+        "description": "Detailed statistics from preliminary games",
+        "header_color": {'red': 0.0, 'green': 0.3, 'blue': 0.6}
     },
     {
         "csv_file": "live_commentary_cards.csv",
         "worksheet_name": "Live Commentary Cards",
-        "description": "Quick reference cards for live broadcasts"
+        "description": "Quick reference cards for live broadcasts",
+        "header_color": {'red': 0.5, 'green': 0.2, 'blue': 0.6}
+    },
+    {
+        "csv_file": "manual_commentary_points.csv",
+        "worksheet_name": "Commentary Talking Points",
+        "description": "Talking points from manual_commentary_template.py",
+        "header_color": {'red': 0.5, 'green': 0.2, 'blue': 0.6}
     }
 ]
 
-for dataset in datasets:
-    print(f"\n{'='*60}")
-    print(f"Processing: {dataset['worksheet_name']}")
-    print(f"{'='*60}")
-    
-    # Load CSV
-    df = pd.read_csv(dataset["csv_file"])
-    df = df.fillna('')
-    
-    print(f"✓ Loaded {len(df)} rows")
-    
-    # Try to find or create worksheet
+# Re-upload even when a CSV hashes the same as its last upload
+FORCE = "--force" in sys.argv
+
+# -----------------------------------------------------------------
+# UPLOAD FUNCTIONS
+# -----------------------------------------------------------------
+
+def open_spreadsheet(credentials_file=CREDENTIALS_FILE, spreadsheet_id=SPREADSHEET_ID):
+    """Authorized gspread Spreadsheet (gspread/google-auth imported on first call)"""
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    credentials = Credentials.from_service_account_file(credentials_file, scopes=SCOPES)
+    return gspread.authorize(credentials).open_by_key(spreadsheet_id)
+
+
+@profiled("upload", rows="out")
+def upload_dataset(spreadsheet, data, worksheet_name, header_color):
+    """
+    Replace one worksheet with a DataFrame (or a stage output's CSV path)
+
+    Returns the display-formatted DataFrame that was uploaded.
+    """
+    import gspread
+
+    df = data if isinstance(data, pd.DataFrame) else load(data)
+    df = format_for_display(df).fillna('')
+
     try:
-        worksheet = spreadsheet.worksheet(dataset["worksheet_name"])
-        print(f"✓ Found existing worksheet")
-    except:
-        worksheet = spreadsheet.add_worksheet(title=dataset["worksheet_name"], rows=100, cols=20)
-        print(f"✓ Created new worksheet")
-    
-    # Clear and update
+        worksheet = spreadsheet.worksheet(worksheet_name)
+    except gspread.WorksheetNotFound:
+        worksheet = spreadsheet.add_worksheet(title=worksheet_name, rows=100, cols=20)
+
     worksheet.clear()
-    
     headers = df.columns.tolist()
-    data = [headers] + df.values.tolist()
-    
-    worksheet.update(data, value_input_option='USER_ENTERED')
-    print(f"✓ Updated with {len(df)} rows, {len(headers)} columns")
-    
-    # Format header
-    if len(headers) <= 26:
-        end_col = chr(64 + len(headers))
-    else:
-        end_col = 'Z'
-    
-    # Color code based on worksheet
-    if "Roster" in dataset["worksheet_name"]:
-        # Green for rosters
-        bg_color = {'red': 0.2, 'green': 0.6, 'blue': 0.3}
-    elif "Stats" in dataset["worksheet_name"]:
-        # Blue for stats
-        bg_color = {'red': 0.0, 'green': 0.3, 'blue': 0.6}
-    else:
-        # Purple for commentary
-        bg_color = {'red': 0.5, 'green': 0.2, 'blue': 0.6}
-    
+    worksheet.update([headers] + df.values.tolist(), value_input_option='USER_ENTERED')
+
+    end_col = chr(64 + len(headers)) if len(headers) <= 26 else 'Z'
     worksheet.format(f'A1:{end_col}1', {
-        'backgroundColor': bg_color,
+        'backgroundColor': header_color,
         'textFormat': {'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}, 'bold': True},
         'horizontalAlignment': 'CENTER'
     })
-    
-    # Freeze header
     worksheet.freeze(rows=1)
-    
-    # Auto-resize columns
     worksheet.columns_auto_resize(0, min(len(headers)-1, 25))
-    
-    print(f"✓ Formatting applied")
-
-print("\n" + "="*60)
-print("✅ ALL PARTIAL DATA UPLOADED TO GOOGLE SHEETS")
-print("="*60)
-
-print("\nWorksheets Created:")
-print("  1. Partial Rosters (Green) - Player information")
-print("  2. Partial Stats (Blue) - Detailed statistics")
-print("  3. Live Commentary Cards (Purple) - Quick reference")
-
-print("\n" + "="*60)
-print("DATA SUMMARY")
-print("="*60)
-
-# Load and display summary
-rosters = pd.read_csv("partial_rosters.csv")
-stats = pd.read_csv("partial_stats.csv")
-cards = pd.read_csv("live_commentary_cards.csv")
-
-print(f"\nRosters: {len(rosters)} players across {len(rosters['Team'].unique())} teams")
-for team in rosters['Team'].unique():
-    confirmed = len(rosters[(rosters['Team'] == team) & (~rosters['Player_Name'].str.contains('Unknown'))])
-    total = len(rosters[rosters['Team'] == team])
-    print(f"  • {team}: {confirmed} confirmed / {total} total")
-
-print(f"\nStats: {len(stats)} data points across {len(stats['Team'].unique())} teams")
-for team in stats['Team'].unique():
-    count = len(stats[stats['Team'] == team])
-    print(f"  • {team}: {count} stats")
-
-print(f"\nCommentary Cards: {len(cards)} teams ready for broadcast")
-
-print("\n" + "="*60)
-print("READY FOR LIVE COMMENTARY!")
-print("="*60)
+    return df
+
+
+def pending_datasets(datasets=DATASETS, force=FORCE):
+    """Datasets whose CSV changed since its worksheet was last uploaded"""
+    return [dataset for dataset in datasets
+            if force or not stage_is_current(f"upload:{dataset['worksheet_name']}", [dataset["csv_file"]])]
+
+
+def upload_partial_data(spreadsheet, frames=None, datasets=DATASETS, force=FORCE):
+    """
+    Upload the changed partial datasets; returns {worksheet name: DataFrame uploaded}
+
+    frames maps a dataset's csv_file to a DataFrame already in memory (always
+    uploaded); the others are loaded from their stage output when changed.
+    """
+    frames = frames or {}
+    pending = pending_datasets(datasets, force)
+    uploaded = {}
+    for dataset in datasets:
+        if dataset not in pending and dataset["csv_file"] not in frames:
+            continue
+        data = frames.get(dataset["csv_file"], dataset["csv_file"])
+        uploaded[dataset["worksheet_name"]] = upload_dataset(
+            spreadsheet, data, dataset["worksheet_name"], dataset["header_color"])
+        if dataset["csv_file"] not in frames:
+            record_stage(f"upload:{dataset['worksheet_name']}", [dataset["csv_file"]])
+    return uploaded
+
+
+def partial_data_summary(rosters, stats, cards):
+    """Per-team confirmed/total players and stat counts"""
+    confirmed = ~rosters['Player_Name'].str.contains('Unknown')
+    roster_summary = pd.DataFrame({
+        "Confirmed": confirmed.groupby(rosters['Team'], sort=False).sum(),
+        "Total": rosters.groupby('Team', sort=False).size()
+    })
+    stats_summary = stats.groupby('Team', sort=False).size()
+    return roster_summary, stats_summary, len(cards)
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    pending = pending_datasets()
+    if not pending:
+        print("✓ All partial datasets unchanged since last upload - skipping (use --force to re-upload)")
+        sys.exit(0)
+
+    spreadsheet = open_spreadsheet()
+    print(f"✓ Opened: {spreadsheet.title}")
+
+    for dataset in DATASETS:
+        if dataset not in pending:
+            print(f"\n✓ {dataset['worksheet_name']} unchanged - skipping")
+            continue
+        print(f"\n{'='*60}")
+        print(f"Processing: {dataset['worksheet_name']}")
+        print(f"{'='*60}")
+        df = upload_dataset(spreadsheet, dataset["csv_file"], dataset["worksheet_name"],
+                            dataset["header_color"])
+        record_stage(f"upload:{dataset['worksheet_name']}", [dataset["csv_file"]])
+        print(f"✓ Updated with {len(df)} rows, {len(df.columns)} columns")
+        print(f"✓ Formatting applied")
+
+    print("\n" + "="*60)
+    print("✅ ALL PARTIAL DATA UPLOADED TO GOOGLE SHEETS")
+    print("="*60)
+
+    print("\nWorksheets Created:")
+    print("  1. Partial Rosters (Green) - Player information")
+    print("  2. Partial Stats (Blue) - Detailed statistics")
+    print("  3. Live Commentary Cards (Purple) - Quick reference")
+    print("  4. Commentary Talking Points (Purple) - Manual template points")
+
+    print("\n" + "="*60)
+    print("DATA SUMMARY")
+    print("="*60)
+
+    rosters = read_table("partial_rosters.csv")
+    stats = read_table("partial_stats.csv")
+    cards = read_table("live_commentary_cards.csv")
+    roster_summary, stats_summary, card_count = partial_data_summary(rosters, stats, cards)
+
+    print(f"\nRosters: {len(rosters)} players across {len(roster_summary)} teams")
+    for team, row in roster_summary.iterrows():
+        print(f"  • {team}: {row['Confirmed']} confirmed / {row['Total']} total")
+
+    print(f"\nStats: {len(stats)} data points across {len(stats_summary)} teams")
+    for team, count in stats_summary.items():
+        print(f"  • {team}: {count} stats")
+
+    print(f"\nCommentary Cards: {card_count} teams ready for broadcast")
+
+    print("\n" + "="*60)
+    print("READY FOR LIVE COMMENTARY!")
+    print("="*60)
@@ -14,9 +14,10 @@ Setup Instructions:
 """
 
 import gspread
-import pandas as pd
 from google.oauth2.service_account import Credentials
 
+from schema_registry import read_table
+
 # -----------------------------------------------------------------
 # CONFIGURATION
 # -----------------------------------------------------------------
@@ -49,7 +50,7 @@ def upload_to_google_sheets():
         
         # Read CSV data
         print(f"Reading data from {CSV_FILE}...")
-        df = pd.read_csv(CSV_FILE)
+        df = read_table(CSV_FILE)
         print(f"Loaded {len(df)} rows")
         
         # Open or create spreadsheet
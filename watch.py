@@ -0,0 +1,192 @@
+"""
+Watch mode - rebuild and re-upload when hand-edited sources change
+Listens for saves to the manual files with inotify (mtime polling where
+inotify isn't available), waits for a burst of saves to go quiet, then
+runs only the pipeline stages downstream of the files whose content changed
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+
+from artifact_manifest import file_hash
+from pipeline import DEFAULT_WORKERS, downstream, print_report, run
+
+# -----------------------------------------------------------------
+# CONFIGURATION
+# -----------------------------------------------------------------
+# Hand-edited sources only: a file a pipeline stage writes (head_to_head_results.csv)
+# would be saved by the rebuild itself and trigger a second one
+WATCH_FILES = [
+    "partial_rosters.csv",
+    "partial_stats.csv",
+    "manual_game_results.csv",
+    "manual_commentary_template.py",
+]
+
+DEBOUNCE_SECONDS = 2.0        # Quiet time after the last save before rebuilding
+POLL_SECONDS = 1.0            # mtime polling interval when inotify is unavailable
+
+# Editors either write in place (close after write) or write a temp file
+# and rename it over the original, so watch the directory for both
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+# Stage kinds watch mode may run (never scrapes; --offline drops uploads too)
+RUN_KINDS = ["parse", "clean", "build", "upload"]
+OFFLINE_KINDS = ["parse", "clean", "build"]
+
+# -----------------------------------------------------------------
+# FILE EVENT FUNCTIONS
+# -----------------------------------------------------------------
+
+def open_inotify(directory="."):
+    """Non-blocking inotify descriptor watching a directory (None if unavailable)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+def _read_inotify(fd, timeout):
+    """File names saved in the watched directory within timeout seconds"""
+    ready, _, _ = select.select([fd], [], [], timeout)
+    if not ready:
+        return set()
+    names = set()
+    while True:
+        try:
+            buffer = os.read(fd, 64 * 1024)
+        except BlockingIOError:
+            return names
+        offset = 0
+        while offset < len(buffer):
+            _, _, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            names.add(os.fsdecode(buffer[offset:offset + length].rstrip(b"\0")))
+            offset += length
+
+
+def _mtimes(files):
+    return {path: os.path.getmtime(path) if os.path.exists(path) else None for path in files}
+
+
+def open_watcher(files=WATCH_FILES, directory=".", polling=False):
+    """Watcher state: the inotify descriptor, or the mtimes to poll against"""
+    fd = None if polling else open_inotify(directory)
+    return {"files": list(files), "fd": fd, "mtimes": _mtimes(files)}
+
+
+def saved_files(watcher, timeout):
+    """Watched files saved within timeout seconds (empty set if none)"""
+    if watcher["fd"] is not None:
+        return _read_inotify(watcher["fd"], timeout) & set(watcher["files"])
+    time.sleep(min(timeout, POLL_SECONDS))
+    current = _mtimes(watcher["files"])
+    saved = {path for path, mtime in current.items() if mtime != watcher["mtimes"][path]}
+    watcher["mtimes"] = current
+    return saved
+
+
+def next_burst(watcher, debounce=DEBOUNCE_SECONDS):
+    """
+    Block until a watched file is saved, then until saves stop for debounce seconds
+
+    Returns every file saved during the burst, so ten quick saves across
+    three files produce one rebuild.
+    """
+    burst = set()
+    while not burst:
+        burst = saved_files(watcher, 3600)
+    quiet_at = time.monotonic() + debounce
+    while time.monotonic() < quiet_at:
+        # Saves to other files in the directory wake the wait without extending it
+        more = saved_files(watcher, quiet_at - time.monotonic())
+        if more:
+            burst |= more
+            quiet_at = time.monotonic() + debounce
+    return burst
+
+
+def changed_files(saved, hashes):
+    """Saved files whose content differs from the last seen version (updates hashes)"""
+    changed = []
+    for path in sorted(saved):
+        digest = file_hash(path)
+        if digest != hashes.get(path):
+            hashes[path] = digest
+            changed.append(path)
+    return changed
+
+# -----------------------------------------------------------------
+# REBUILD FUNCTIONS
+# -----------------------------------------------------------------
+
+def rebuild(changed, offline=False, workers=DEFAULT_WORKERS):
+    """Run the stages downstream of the changed files; returns the outcomes"""
+    targets = downstream(changed)
+    if not targets:
+        print("  (no stage reads these files)")
+        return {}
+    started_at = time.perf_counter()
+    outcomes, timings = run(targets, OFFLINE_KINDS if offline else RUN_KINDS, workers=workers)
+    print_report(outcomes, timings, time.perf_counter() - started_at, workers)
+    return outcomes
+
+
+def watch(files=WATCH_FILES, debounce=DEBOUNCE_SECONDS, offline=False, workers=DEFAULT_WORKERS,
+          polling=False):
+    """Catch up once, then rebuild after every burst of edits (until Ctrl+C)"""
+    watcher = open_watcher(files, polling=polling)
+    hashes = {path: file_hash(path) for path in files}
+    mode = "inotify" if watcher["fd"] is not None else f"polling every {POLL_SECONDS:g}s"
+    print(f"Watching {len(files)} files ({mode}, {debounce:g}s debounce"
+          + (", offline)" if offline else ")"))
+    for path in files:
+        print(f"  • {path}")
+
+    print("\nCatching up")
+    rebuild(files, offline, workers)
+    try:
+        while True:
+            print("\nWaiting for edits...")
+            changed = changed_files(next_burst(watcher, debounce), hashes)
+            if not changed:
+                print("  saved without changes - nothing to do")
+                continue
+            print(f"\n[{time.strftime('%H:%M:%S')}] Changed: {', '.join(changed)}")
+            rebuild(changed, offline, workers)
+    except KeyboardInterrupt:
+        print("\n✓ Stopped watching")
+    finally:
+        if watcher["fd"] is not None:
+            os.close(watcher["fd"])
+
+# -----------------------------------------------------------------
+# EXECUTION
+# -----------------------------------------------------------------
+if __name__ == "__main__":
+    print("=" * 70)
+    print("WATCH MODE")
+    print("=" * 70)
+
+    args = sys.argv[1:]
+    watch(debounce=float(args[args.index("--debounce") + 1]) if "--debounce" in args else DEBOUNCE_SECONDS,
+          offline="--offline" in args,
+          workers=int(args[args.index("--workers") + 1]) if "--workers" in args else DEFAULT_WORKERS,
+          polling="--poll" in args)